@@ -0,0 +1,106 @@
+"""
+Fixed-delay vs adaptive Producer pacing under a changing consumer cost.
+
+One Producer feeds one Consumer whose per-item cost changes in phases
+(fast, slow, fast). A fixed delay either matches the fast phase and builds
+a backlog during the slow one, or matches the slow phase and starves the
+consumer during the fast ones. The AIMD and PID controllers adjust pacing
+from the queue depth. Reports end-to-end throughput, the mean/max time
+items sat in the queue between put() and take(), and how long the producer
+was blocked on a full queue and the consumer on an empty one, averaged over
+--repeats runs.
+
+The consumer is the bottleneck in every phase, so no pacing beats the fast
+fixed delay on throughput by more than noise: the adaptive policies match
+it while cutting queue wait and producer blocking. The slow fixed delay has
+the shortest queue wait but about half the throughput.
+
+Usage (from Assignment_1/):
+    python -m benchmarks.bench_adaptive_producer
+"""
+import argparse
+import logging
+import time
+from collections import deque
+from typing import List
+
+from src.blocking_queue import BlockingQueue
+from src.consumer import Consumer
+from src.producer import Producer
+from src.rate_control import AIMDRateController, PIDRateController
+
+
+class TimedQueue(BlockingQueue):
+    # Records how long each item waited in the queue (FIFO, so stamps line up).
+    def __init__(self, capacity: int):
+        super().__init__(capacity)
+        self._stamps = deque()
+        self.waits: List[float] = []
+
+    def _store(self, item):
+        self._stamps.append(time.perf_counter())
+        super()._store(item)
+
+    def _remove(self):
+        self.waits.append(time.perf_counter() - self._stamps.popleft())
+        return super()._remove()
+
+
+def run(items: int, capacity: int, fast: float, slow: float, **producer_args):
+    queue = TimedQueue(capacity)
+
+    def handler(payload):
+        # Middle third of the items is the slow phase
+        time.sleep(slow if items // 3 < payload <= 2 * items // 3 else fast)
+
+    producer = Producer(queue, items, **producer_args)
+    consumer = Consumer(queue, handler=handler)
+    started = time.perf_counter()
+    producer.start()
+    consumer.start()
+    producer.join()
+    consumer.join()
+    elapsed = time.perf_counter() - started
+    waits = queue.waits
+    metrics = queue.metrics_snapshot()
+    return (items / elapsed, sum(waits) / len(waits), max(waits),
+            metrics["producer_blocked_sec"], metrics["consumer_blocked_sec"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=900)
+    parser.add_argument("--capacity", type=int, default=64)
+    parser.add_argument("--fast", type=float, default=0.001, help="consumer cost per item, fast phases (s)")
+    parser.add_argument("--slow", type=float, default=0.004, help="consumer cost per item, slow phase (s)")
+    parser.add_argument("--repeats", type=int, default=3, help="runs averaged per policy")
+    args = parser.parse_args()
+
+    # Per-item INFO logging would dominate the timings
+    logging.disable(logging.INFO)
+
+    # Controllers keep state, so every run gets fresh ones
+    policies = {
+        f"fixed {args.fast * 1e3:.0f}ms": lambda: dict(delay=args.fast),
+        f"fixed {args.slow * 1e3:.0f}ms": lambda: dict(delay=args.slow),
+        "aimd": lambda: dict(rate_controller=AIMDRateController(
+            target_fill=0.1, initial_rate=1 / args.slow, increase=10.0, decrease=0.5, cooldown=0.02)),
+        "pid": lambda: dict(rate_controller=PIDRateController(
+            target_depth=8, initial_rate=1 / args.slow)),
+    }
+
+    print(f"{args.items} items, capacity {args.capacity}, "
+          f"consumer {args.fast * 1e3:.0f}ms / {args.slow * 1e3:.0f}ms / {args.fast * 1e3:.0f}ms")
+    print(f"{'policy':<10} {'items/sec':>10} {'mean wait':>11} {'max wait':>10} "
+          f"{'prod blocked':>13} {'cons blocked':>13}")
+    for name, producer_args in policies.items():
+        runs = [run(args.items, args.capacity, args.fast, args.slow, **producer_args())
+                for _ in range(args.repeats)]
+        rate, mean_wait, max_wait, producer_blocked, consumer_blocked = (
+            sum(column) / len(runs) for column in zip(*runs))
+        print(f"{name:<10} {rate:>10.0f} {mean_wait * 1e3:>9.1f}ms {max_wait * 1e3:>8.1f}ms "
+              f"{producer_blocked * 1e3:>11.0f}ms {consumer_blocked * 1e3:>11.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
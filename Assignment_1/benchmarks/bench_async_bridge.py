@@ -0,0 +1,127 @@
+"""
+Thread <-> asyncio hand-off latency: AsyncBlockingQueue vs run_in_executor.
+
+A thread producer stamps each item with time.perf_counter() and an asyncio
+consumer records how long the item took to arrive (and the reverse direction).
+The baseline wraps the thread-blocking BlockingQueue in loop.run_in_executor
+for every item.
+
+Usage (from Assignment_1/):
+    python -m benchmarks.bench_async_bridge
+"""
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+from typing import List
+
+from src.async_blocking_queue import AsyncBlockingQueue
+from src.blocking_queue import BlockingQueue
+from src.data_item import DataItem, POISON_PILL
+
+
+def _thread_producer(put, items: int, interval: float) -> threading.Thread:
+    def run():
+        for _ in range(items):
+            put(DataItem(time.perf_counter()))
+            if interval:
+                time.sleep(interval)
+        put(POISON_PILL)
+
+    return threading.Thread(target=run)
+
+
+async def thread_to_async_bridge(items: int, capacity: int, interval: float) -> List[float]:
+    queue = AsyncBlockingQueue(capacity)
+    producer = _thread_producer(queue.sync.put, items, interval)
+    producer.start()
+    latencies = [time.perf_counter() - item.payload async for item in queue]
+    producer.join()
+    return latencies
+
+
+async def thread_to_async_executor(items: int, capacity: int, interval: float) -> List[float]:
+    queue = BlockingQueue(capacity)
+    loop = asyncio.get_running_loop()
+    producer = _thread_producer(queue.put, items, interval)
+    producer.start()
+    latencies = []
+    while True:
+        item = await loop.run_in_executor(None, queue.take)
+        if item.is_poison_pill():
+            break
+        latencies.append(time.perf_counter() - item.payload)
+    producer.join()
+    return latencies
+
+
+def _thread_consumer(take, latencies: List[float]) -> threading.Thread:
+    def run():
+        while True:
+            item = take()
+            if item.is_poison_pill():
+                break
+            latencies.append(time.perf_counter() - item.payload)
+
+    return threading.Thread(target=run)
+
+
+async def async_to_thread_bridge(items: int, capacity: int, interval: float) -> List[float]:
+    queue = AsyncBlockingQueue(capacity)
+    latencies: List[float] = []
+    consumer = _thread_consumer(queue.sync.take, latencies)
+    consumer.start()
+    for _ in range(items):
+        await queue.put(DataItem(time.perf_counter()))
+        await asyncio.sleep(interval)
+    await queue.put(POISON_PILL)
+    consumer.join()
+    return latencies
+
+
+async def async_to_thread_executor(items: int, capacity: int, interval: float) -> List[float]:
+    queue = BlockingQueue(capacity)
+    loop = asyncio.get_running_loop()
+    latencies: List[float] = []
+    consumer = _thread_consumer(queue.take, latencies)
+    consumer.start()
+    for _ in range(items):
+        await loop.run_in_executor(None, queue.put, DataItem(time.perf_counter()))
+        await asyncio.sleep(interval)
+    await loop.run_in_executor(None, queue.put, POISON_PILL)
+    consumer.join()
+    return latencies
+
+
+def _report(name: str, latencies: List[float], elapsed: float) -> None:
+    ordered = sorted(latencies)
+    p50 = ordered[len(ordered) // 2] * 1e6
+    p99 = ordered[int(len(ordered) * 0.99)] * 1e6
+    rate = len(latencies) / elapsed
+    print(f"{name:<28} p50 {p50:>8.1f} us  p99 {p99:>9.1f} us  mean {statistics.mean(latencies) * 1e6:>8.1f} us"
+          f"  {rate:>9,.0f} it/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=20000)
+    parser.add_argument("--capacity", type=int, default=64)
+    parser.add_argument("--interval", type=float, default=0.0,
+                        help="pause between puts (0 = saturate)")
+    args = parser.parse_args()
+
+    cases = [
+        ("thread -> async (bridge)", thread_to_async_bridge),
+        ("thread -> async (executor)", thread_to_async_executor),
+        ("async -> thread (bridge)", async_to_thread_bridge),
+        ("async -> thread (executor)", async_to_thread_executor),
+    ]
+    for name, case in cases:
+        start = time.perf_counter()
+        latencies = asyncio.run(case(args.items, args.capacity, args.interval))
+        _report(name, latencies, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+ConsumerPool scaling benchmark: throughput vs worker count for each backend.
+
+Runs a CPU-bound handler (pure-Python arithmetic, holds the GIL) and an
+I/O-bound handler (sleep, releases the GIL) through the thread and process
+backends and reports items/sec.
+
+Usage (from Assignment_1/):
+    python -m benchmarks.bench_consumer_pool
+"""
+import argparse
+import time
+
+from src.blocking_queue import BlockingQueue
+from src.consumer_pool import ConsumerPool
+from src.data_item import DataItem
+
+
+def cpu_handler(n):
+    # Roughly a millisecond of pure-Python work per item
+    total = 0
+    for i in range(20000):
+        total += i * n
+    return total
+
+
+def io_handler(n):
+    time.sleep(0.002)
+    return n
+
+
+HANDLERS = {"cpu": cpu_handler, "io": io_handler}
+
+
+def run_pool(handler, backend: str, workers: int, items: int) -> float:
+    # Returns items/sec for `items` payloads pushed through a pool of `workers`.
+    queue = BlockingQueue(capacity=256)
+    pool = ConsumerPool(queue, handler, workers=workers, backend=backend)
+
+    start = time.perf_counter()
+    pool.start()
+    queue.put_many(DataItem(i) for i in range(items))
+    queue.close()
+    pool.join()
+    elapsed = time.perf_counter() - start
+
+    return items / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=2000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--handlers", nargs="+", choices=sorted(HANDLERS), default=["cpu", "io"])
+    args = parser.parse_args()
+
+    print(f"{'handler':>8} {'workers':>8} {'thread':>14} {'process':>14}")
+    for name in args.handlers:
+        for n in args.workers:
+            threaded = run_pool(HANDLERS[name], "thread", n, args.items)
+            processes = run_pool(HANDLERS[name], "process", n, args.items)
+            print(f"{name:>8} {n:>8} {threaded:>10,.0f} it/s {processes:>10,.0f} it/s")
+
+
+if __name__ == "__main__":
+    main()
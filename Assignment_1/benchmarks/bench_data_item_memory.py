@@ -0,0 +1,97 @@
+"""
+Memory and allocation cost of DataItem envelopes, measured with tracemalloc.
+
+1. Resident cost: a million items held in a BlockingQueue, comparing the
+   original __dict__-based envelope with the __slots__ DataItem.
+2. Allocation churn: a million items streamed through a small queue by a
+   producer/consumer pair, with and without a DataItemPool.
+
+Usage (from Assignment_1/):
+    python -m benchmarks.bench_data_item_memory
+"""
+import argparse
+import gc
+import threading
+import time
+import tracemalloc
+
+from src.blocking_queue import BlockingQueue
+from src.data_item import DataItem, DataItemPool, POISON_PILL
+
+
+class DictDataItem:
+    # The original envelope: a plain class with a per-instance __dict__.
+    def __init__(self, payload):
+        self.payload = payload
+
+    def is_poison_pill(self) -> bool:
+        return self.payload is None
+
+
+def resident(factory, items: int):
+    # Peak traced bytes while `items` envelopes sit in a queue
+    queue = BlockingQueue(items, collect_metrics=False)
+    gc.collect()
+    tracemalloc.start()
+    for i in range(items):
+        queue.put(factory(i))
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, peak
+
+
+def streamed(items: int, pool=None):
+    # (seconds, peak traced bytes, envelopes allocated) for a producer/consumer pair
+    queue = BlockingQueue(256, collect_metrics=False)
+    created = [0]
+
+    def produce():
+        for i in range(items):
+            if pool is not None:
+                queue.put(pool.acquire(i))
+            else:
+                created[0] += 1
+                queue.put(DataItem(i))
+        queue.put(POISON_PILL)
+
+    def consume():
+        while True:
+            item = queue.take()
+            if item.is_poison_pill():
+                break
+            if pool is not None:
+                pool.release(item)
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    threads = [threading.Thread(target=produce), threading.Thread(target=consume)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, pool.created if pool is not None else created[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=1_000_000)
+    args = parser.parse_args()
+    n = args.items
+
+    print(f"Resident cost of {n:,} queued items (tracemalloc):")
+    for name, factory in (("__dict__ envelope", DictDataItem), ("__slots__ DataItem", DataItem)):
+        current, peak = resident(factory, n)
+        print(f"  {name:<20} {current / 2**20:>8.1f} MiB  ({current / n:>5.1f} B/item, peak {peak / 2**20:.1f} MiB)")
+
+    print(f"\nStreaming {n:,} items through a 256-slot queue:")
+    for name, pool in (("new DataItem each", None), ("DataItemPool", DataItemPool(max_size=512))):
+        elapsed, peak, created = streamed(n, pool)
+        print(f"  {name:<20} {elapsed:>6.2f}s  peak {peak / 2**10:>8.1f} KiB  envelopes allocated {created:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Tail latency of high-priority items under saturation.
+
+A bulk producer keeps the queue full while an urgent producer injects one
+high-priority item every `--interval` seconds. A single consumer records how
+long each urgent item waited between put() and take(). Compares the FIFO
+BlockingQueue, PriorityBlockingQueue and MultiLaneQueue.
+
+Usage (from Assignment_1/):
+    python -m benchmarks.bench_priority_latency
+"""
+import argparse
+import threading
+import time
+from typing import List
+
+from src.blocking_queue import BlockingQueue, QueueClosed
+from src.data_item import DataItem
+from src.priority_queue import MultiLaneQueue, PriorityBlockingQueue
+
+URGENT = 10
+
+
+def make_queues(capacity: int):
+    return {
+        "fifo": BlockingQueue(capacity),
+        "priority": PriorityBlockingQueue(capacity),
+        "lanes 8:1": MultiLaneQueue(capacity, {"urgent": 8, "bulk": 1},
+                                    lane_of=lambda item: "urgent" if item.priority else "bulk"),
+    }
+
+
+def run(queue, urgent_items: int, interval: float, work: float) -> List[float]:
+    latencies: List[float] = []
+    stop = threading.Event()
+
+    def bulk_producer():
+        try:
+            while not stop.is_set():
+                queue.offer(DataItem(("bulk", 0.0)), timeout=0.01)
+        except QueueClosed:
+            pass
+
+    def urgent_producer():
+        for _ in range(urgent_items):
+            queue.put(DataItem(("urgent", time.perf_counter()), priority=URGENT))
+            time.sleep(interval)
+        stop.set()
+        queue.close()
+
+    def consumer():
+        try:
+            while True:
+                kind, stamp = queue.take().payload
+                if kind == "urgent":
+                    latencies.append(time.perf_counter() - stamp)
+                # Simulated per-item work keeps the queue saturated
+                deadline = time.perf_counter() + work
+                while time.perf_counter() < deadline:
+                    pass
+        except QueueClosed:
+            pass
+
+    threads = [threading.Thread(target=f) for f in (bulk_producer, consumer)]
+    for t in threads:
+        t.start()
+    # Let the bulk producer fill the queue first
+    time.sleep(0.05)
+    urgent = threading.Thread(target=urgent_producer)
+    urgent.start()
+    urgent.join()
+    for t in threads:
+        t.join()
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--capacity", type=int, default=512)
+    parser.add_argument("--urgent", type=int, default=200, help="number of urgent items")
+    parser.add_argument("--interval", type=float, default=0.005, help="seconds between urgent items")
+    parser.add_argument("--work", type=float, default=0.00005, help="consumer busy time per item")
+    args = parser.parse_args()
+
+    print(f"{'queue':<10} {'p50':>10} {'p99':>10} {'max':>10}   (urgent item wait)")
+    for name, queue in make_queues(args.capacity).items():
+        latencies = sorted(run(queue, args.urgent, args.interval, args.work))
+        p50 = latencies[len(latencies) // 2] * 1e3
+        p99 = latencies[int(len(latencies) * 0.99)] * 1e3
+        print(f"{name:<10} {p50:>8.2f}ms {p99:>8.2f}ms {latencies[-1] * 1e3:>8.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Contention benchmark: ring-buffer BlockingQueue vs the original list-based queue.
+
+Runs N producers and N consumers (N = 1, 4, 16) against each implementation
+and reports items/sec.
+
+Usage (from Assignment_1/):
+    python -m benchmarks.bench_queue_contention
+"""
+import argparse
+import logging
+import threading
+import time
+from typing import List
+
+from src.blocking_queue import BlockingQueue
+from src.data_item import DataItem, POISON_PILL
+
+logger = logging.getLogger(__name__)
+
+
+class ListBlockingQueue:
+    # The original implementation: list.pop(0) and a single notify_all() condition.
+    def __init__(self, capacity: int):
+        self._buffer: List[DataItem] = []
+        self._capacity = capacity
+        self._cv = threading.Condition()
+
+    def put(self, item: DataItem) -> None:
+        with self._cv:
+            while len(self._buffer) == self._capacity:
+                logger.debug("Queue full. Producer waiting...")
+                self._cv.wait()
+            self._buffer.append(item)
+            logger.debug(f"Item added: {item}")
+            self._cv.notify_all()
+
+    def take(self) -> DataItem:
+        with self._cv:
+            while len(self._buffer) == 0:
+                logger.debug("Queue empty. Consumer waiting...")
+                self._cv.wait()
+            item = self._buffer.pop(0)
+            logger.debug(f"Item removed: {item}")
+            self._cv.notify_all()
+            return item
+
+
+def run_contention(queue, workers: int, items_per_producer: int) -> float:
+    # Returns items/sec for `workers` producers and `workers` consumers.
+    def produce():
+        for i in range(items_per_producer):
+            queue.put(DataItem(i))
+
+    def consume():
+        while not queue.take().is_poison_pill():
+            pass
+
+    producers = [threading.Thread(target=produce) for _ in range(workers)]
+    consumers = [threading.Thread(target=consume) for _ in range(workers)]
+
+    start = time.perf_counter()
+    for t in consumers + producers:
+        t.start()
+    for t in producers:
+        t.join()
+    # One pill per consumer once every producer is done
+    for _ in consumers:
+        queue.put(POISON_PILL)
+    for t in consumers:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    return workers * items_per_producer / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=20000, help="items per producer")
+    parser.add_argument("--capacity", type=int, default=1024)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 16])
+    args = parser.parse_args()
+
+    print(f"{'workers':>8} {'list queue':>14} {'ring queue':>14} {'speedup':>8}")
+    for n in args.workers:
+        old = run_contention(ListBlockingQueue(args.capacity), n, args.items)
+        new = run_contention(BlockingQueue(args.capacity), n, args.items)
+        print(f"{n:>8} {old:>10,.0f} it/s {new:>10,.0f} it/s {new / old:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Cross-process throughput: SharedMemoryQueue vs multiprocessing.Queue.
+
+The parent process produces fixed-size byte payloads and a child process
+consumes them. Reports messages/sec and MB/s for several payload sizes.
+
+Usage (from Assignment_1/):
+    python -m benchmarks.bench_shared_memory_queue
+"""
+import argparse
+import multiprocessing
+import time
+
+from src.blocking_queue import QueueClosed
+from src.shared_memory_queue import SharedMemoryQueue
+
+_DONE = b""
+
+
+def consume_shared(queue: SharedMemoryQueue, use_view: bool):
+    try:
+        while True:
+            if use_view:
+                with queue.take_view() as view:
+                    len(view)
+            else:
+                queue.take()
+    except QueueClosed:
+        pass
+
+
+def consume_mp(queue):
+    while queue.get() != _DONE:
+        pass
+
+
+def run_shared(messages: int, size: int, use_view: bool) -> float:
+    queue = SharedMemoryQueue(capacity_bytes=1 << 20)
+    payload = b"x" * size
+    child = multiprocessing.Process(target=consume_shared, args=(queue, use_view))
+    child.start()
+
+    start = time.perf_counter()
+    for _ in range(messages):
+        queue.put(payload)
+    queue.close()
+    child.join()
+    elapsed = time.perf_counter() - start
+
+    queue.unlink()
+    return messages / elapsed
+
+
+def run_mp(messages: int, size: int) -> float:
+    queue = multiprocessing.Queue(maxsize=1024)
+    payload = b"x" * size
+    child = multiprocessing.Process(target=consume_mp, args=(queue,))
+    child.start()
+
+    start = time.perf_counter()
+    for _ in range(messages):
+        queue.put(payload)
+    queue.put(_DONE)
+    child.join()
+    return messages / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=50000)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[64, 1024, 16384])
+    args = parser.parse_args()
+
+    print(f"{'bytes':>7} {'mp.Queue':>14} {'shm take':>14} {'shm view':>14}")
+    for size in args.sizes:
+        mp_rate = run_mp(args.messages, size)
+        shm_rate = run_shared(args.messages, size, use_view=False)
+        view_rate = run_shared(args.messages, size, use_view=True)
+        print(f"{size:>7} {mp_rate:>10,.0f} msg/s {shm_rate:>10,.0f} msg/s {view_rate:>10,.0f} msg/s")
+
+
+if __name__ == "__main__":
+    main()
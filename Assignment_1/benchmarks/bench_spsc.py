@@ -0,0 +1,51 @@
+"""
+Single producer / single consumer throughput: SPSCQueue vs BlockingQueue.
+
+Usage (from Assignment_1/):
+    python -m benchmarks.bench_spsc
+"""
+import argparse
+import threading
+import time
+
+from src.blocking_queue import BlockingQueue
+from src.data_item import DataItem
+from src.spsc_queue import SPSCQueue
+
+
+def run(queue, items: int) -> float:
+    # Returns items/sec for one producer thread and one consumer thread.
+    item = DataItem(1)
+
+    def produce():
+        for _ in range(items):
+            queue.put(item)
+
+    def consume():
+        for _ in range(items):
+            queue.take()
+
+    threads = [threading.Thread(target=produce), threading.Thread(target=consume)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return items / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=200000)
+    parser.add_argument("--capacities", type=int, nargs="+", default=[16, 1024])
+    args = parser.parse_args()
+
+    print(f"{'capacity':>9} {'BlockingQueue':>16} {'SPSCQueue':>16} {'speedup':>8}")
+    for capacity in args.capacities:
+        general = run(BlockingQueue(capacity), args.items)
+        spsc = run(SPSCQueue(capacity), args.items)
+        print(f"{capacity:>9} {general:>12,.0f} it/s {spsc:>12,.0f} it/s {spsc / general:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
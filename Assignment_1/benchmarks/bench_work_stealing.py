@@ -0,0 +1,71 @@
+"""
+Consumer scaling with uneven per-item cost: central queue vs sharded queues.
+
+One Producer feeds 1-32 Consumers. Item costs follow a heavy-tailed (Pareto)
+distribution and are simulated with sleeps, so a few items are much more
+expensive than the rest. Compares the single-lock BlockingQueue, a sharded
+WorkStealingQueue with stealing disabled (consumers stuck behind expensive
+items in their own shard) and with stealing enabled.
+
+Usage (from Assignment_1/):
+    python -m benchmarks.bench_work_stealing
+"""
+import argparse
+import logging
+import random
+import time
+
+from src.blocking_queue import BlockingQueue
+from src.consumer import Consumer
+from src.producer import Producer
+from src.work_stealing_queue import WorkStealingQueue
+
+
+def run(queue, consumers: int, costs, batch_size: int) -> float:
+    def handler(payload):
+        time.sleep(costs[payload])
+
+    workers = [Consumer(queue, handler=handler, batch_size=batch_size) for _ in range(consumers)]
+    producer = Producer(queue, len(costs) - 1, delay=0, send_poison_pill=False)
+    started = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    producer.start()
+    producer.join()
+    queue.close()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - started
+    assert sum(worker.processed for worker in workers) == len(costs) - 1
+    return (len(costs) - 1) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--capacity", type=int, default=256)
+    parser.add_argument("--base-cost", type=float, default=0.0005, help="minimum per-item cost (s)")
+    parser.add_argument("--batch-size", type=int, default=4)
+    parser.add_argument("--consumers", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    # Per-item INFO logging would dominate the timings
+    logging.disable(logging.INFO)
+
+    rng = random.Random(args.seed)
+    # Payloads are 1..items; index 0 is unused
+    costs = [0.0] + [args.base_cost * min(rng.paretovariate(1.5), 100.0) for _ in range(args.items)]
+    print(f"{args.items} items, mean cost {sum(costs) / args.items * 1e3:.2f}ms, "
+          f"max {max(costs) * 1e3:.1f}ms, consumer batch {args.batch_size}")
+
+    print(f"{'consumers':>9} {'central':>10} {'sharded':>10} {'stealing':>10}   (items/sec)")
+    for consumers in args.consumers:
+        central = run(BlockingQueue(args.capacity), consumers, costs, args.batch_size)
+        sharded = run(WorkStealingQueue(args.capacity, consumers, steal=False), consumers, costs, args.batch_size)
+        stealing = run(WorkStealingQueue(args.capacity, consumers), consumers, costs, args.batch_size)
+        print(f"{consumers:>9} {central:>10.0f} {sharded:>10.0f} {stealing:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Baseline handling shared by the throughput suites.
+
+A suite measures named cases (higher is better), wraps them in a report
+with make_report() and passes it to check_baseline(), which either stores
+it as the baseline or compares it with the stored one. A case more than
+--tolerance slower than its baseline is measured once more before it
+counts as a regression (exit status 1).
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+from typing import Callable, Dict, List, Optional
+
+
+def add_baseline_arguments(parser: argparse.ArgumentParser, default_baseline: str) -> None:
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", default=default_baseline, help="baseline JSON to compare with")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="allowed slowdown before a regression")
+
+
+def environment() -> Dict[str, object]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def make_report(suite: str, unit: str, settings: Dict[str, object], results: Dict[str, float]) -> Dict:
+    return {"suite": suite, "unit": unit, "environment": environment(),
+            "settings": settings, "results": results}
+
+
+def write_json(path: str, data: Dict) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def load_json(path: str) -> Optional[Dict]:
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], tolerance: float,
+            unit: str = "items/s") -> List[str]:
+    # Prints every case against its baseline and returns the regressed ones
+    regressions = []
+    print(f"\n{'case':<32} {unit:>12} {'baseline':>12} {'ratio':>7}")
+    for name, rate in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            print(f"{name:<32} {rate:>12,.0f} {'-':>12} {'new':>7}")
+            continue
+        ratio = rate / reference
+        flag = ""
+        if ratio < 1 - tolerance:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<32} {rate:>12,.0f} {reference:>12,.0f} {ratio:>6.2f}x{flag}")
+    return regressions
+
+
+def check_baseline(report: Dict, args: argparse.Namespace, measure: Callable[[str], float]) -> None:
+    # Saves or compares `report` as add_baseline_arguments() asked; `measure`
+    # re-runs one case by name. Exits with status 1 on a regression.
+    results = report["results"]
+    regressions = []
+    if args.save_baseline:
+        write_json(args.baseline, report)
+        print(f"\nBaseline saved to {args.baseline}")
+    else:
+        baseline = load_json(args.baseline)
+        if baseline is None:
+            print(f"\nNo baseline at {args.baseline}; run with --save-baseline to create one.")
+        else:
+            if baseline.get("environment") != report["environment"]:
+                print("\nNote: the baseline was recorded on a different machine or Python; "
+                      "ratios are indicative only.")
+            reference = baseline.get("results", {})
+            # Timings are noisy: re-measure suspect cases once before reporting them
+            for name, rate in results.items():
+                if name in reference and rate < reference[name] * (1 - args.tolerance):
+                    results[name] = max(rate, measure(name))
+            regressions = compare(results, reference, args.tolerance, report["unit"])
+    if args.output:
+        write_json(args.output, report)
+    if regressions:
+        print(f"\n{len(regressions)} case(s) slower than the baseline by more than {args.tolerance:.0%}")
+        sys.exit(1)
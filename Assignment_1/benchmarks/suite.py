@@ -0,0 +1,100 @@
+"""
+Queue throughput suite with JSON results and a stored baseline.
+
+Runs producer and consumer threads over a grid of producer counts,
+consumer counts and queue capacities, for the BlockingQueue and for the queue that
+create_queue() picks (SPSCQueue at one producer / one consumer). Each case
+reports the best items/sec of --repeat runs. Results can be written as JSON
+and are compared with benchmarks/baseline.json: a case more than
+--tolerance slower than its baseline (also after one re-measurement) is
+a regression (exit status 1).
+
+Usage (from Assignment_1/):
+    python -m benchmarks.suite [--output results.json] [--save-baseline]
+"""
+import argparse
+import os
+import threading
+import time
+
+from benchmarks.regression import add_baseline_arguments, check_baseline, make_report
+from src.blocking_queue import BlockingQueue, QueueClosed
+from src.data_item import DataItem
+from src.queue_factory import create_queue
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+QUEUE_KINDS = {
+    "blocking": lambda capacity, producers, consumers: BlockingQueue(capacity),
+    "factory": lambda capacity, producers, consumers: create_queue(capacity, producers, consumers),
+}
+
+
+def run_case(kind: str, producers: int, consumers: int, capacity: int, items: int) -> float:
+    # Items/sec moving `items` items (split over the producers) through one queue.
+    # Plain put/take threads: a Producer paces itself with time.sleep() even at
+    # delay=0, which would dominate the numbers.
+    queue = QUEUE_KINDS[kind](capacity, producers, consumers)
+    per_producer = [items // producers + (i < items % producers) for i in range(producers)]
+    consumed = [0] * consumers
+
+    def produce(count: int) -> None:
+        for i in range(count):
+            queue.put(DataItem(i))
+
+    def consume(slot: int) -> None:
+        taken = 0
+        try:
+            while True:
+                queue.take()
+                taken += 1
+        except QueueClosed:
+            consumed[slot] = taken
+
+    producer_threads = [threading.Thread(target=produce, args=(count,)) for count in per_producer]
+    consumer_threads = [threading.Thread(target=consume, args=(slot,)) for slot in range(consumers)]
+
+    started = time.perf_counter()
+    for thread in consumer_threads + producer_threads:
+        thread.start()
+    for thread in producer_threads:
+        thread.join()
+    # Closing wakes the consumers once the queue is drained
+    queue.close()
+    for thread in consumer_threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    if sum(consumed) != items:
+        raise RuntimeError(f"{kind}: {sum(consumed)} of {items} items consumed")
+    return items / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--producers", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--consumers", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--capacities", type=int, nargs="+", default=[16, 1024])
+    parser.add_argument("--kinds", nargs="+", choices=sorted(QUEUE_KINDS), default=sorted(QUEUE_KINDS))
+    parser.add_argument("--items", type=int, default=20000, help="items per case")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per case; the best is kept")
+    add_baseline_arguments(parser, BASELINE_PATH)
+    args = parser.parse_args()
+    cases = {f"{kind}/p{producers}-c{consumers}-cap{capacity}": (kind, producers, consumers, capacity)
+             for kind in args.kinds for producers in args.producers
+             for consumers in args.consumers for capacity in args.capacities}
+
+    def measure(name: str) -> float:
+        return max(run_case(*cases[name], args.items) for _ in range(args.repeat))
+
+    results = {}
+    for name in cases:
+        results[name] = measure(name)
+        print(f"{name:<32} {results[name]:>12,.0f} items/s")
+
+    report = make_report("queue_throughput", "items/s", {"items": args.items, "repeat": args.repeat}, results)
+    check_baseline(report, args, measure)
+
+
+if __name__ == "__main__":
+    main()
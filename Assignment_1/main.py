@@ -1,8 +1,9 @@
 import logging
 import sys
-from src.blocking_queue import BlockingQueue
+from src.queue_factory import create_queue
 from src.producer import Producer
 from src.consumer import Consumer
+from src.metrics import MetricsReporter
 
 # Configure Logging
 logging.basicConfig(
@@ -19,13 +20,33 @@ def main():
         QUEUE_CAPACITY = 3
         # Define the total number of items the producer needs to generate
         TOTAL_ITEMS = 10
+        # Maximum time (seconds) to wait for the consumer to finish draining
+        SHUTDOWN_TIMEOUT = 5.0
+        # Log queue/producer/consumer metrics every N seconds (None disables the reporter)
+        METRICS_INTERVAL = 0.5
         
         # Initialization
-        # Create the thread-safe shared queue
-        shared_queue = BlockingQueue(QUEUE_CAPACITY)
+        # Create the thread-safe shared queue. With one producer and one consumer
+        # the factory returns the lock-free SPSC queue; both share the same API.
+        shared_queue = create_queue(QUEUE_CAPACITY, producers=1, consumers=1)
         
-        producer = Producer(queue=shared_queue, item_count=TOTAL_ITEMS, delay=0.05)
+        # The queue is closed once production is done, so no Poison Pill is needed
+        producer = Producer(queue=shared_queue, item_count=TOTAL_ITEMS, delay=0.05, send_poison_pill=False)
         consumer = Consumer(queue=shared_queue, processing_time=0.1)
+        # Daemon consumer: a stuck handler cannot keep the process alive after the timeout
+        consumer.daemon = True
+
+        reporter = None
+        if METRICS_INTERVAL:
+            reporter = MetricsReporter(
+                {
+                    "queue": shared_queue.metrics_snapshot,
+                    "producer": producer.metrics_snapshot,
+                    "consumer": consumer.metrics_snapshot,
+                },
+                interval=METRICS_INTERVAL,
+            )
+            reporter.start()
 
         # Start Threads
         # Begin the execution of the Producer and Consumer threads concurrently
@@ -33,11 +54,20 @@ def main():
         consumer.start()
 
         # Wait for completion
-        # Block the main thread until both the Producer and Consumer threads have finished execution
+        # Block the main thread until the Producer has finished, then close the queue.
+        # Closing wakes every waiting consumer at once; they drain what is left and exit.
         producer.join()
-        consumer.join()
+        shared_queue.close()
+        consumer.join(timeout=SHUTDOWN_TIMEOUT)
+
+        # Stop the reporter and log one final snapshot
+        if reporter is not None:
+            reporter.stop()
 
-        logging.info("All tasks completed successfully.")
+        if consumer.is_alive():
+            logging.warning("Consumer did not finish within %.1fs. Exiting anyway.", SHUTDOWN_TIMEOUT)
+        else:
+            logging.info("All tasks completed successfully.")
 
     except KeyboardInterrupt:
         logging.warning("Application interrupted by user.")
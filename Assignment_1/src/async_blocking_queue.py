@@ -0,0 +1,248 @@
+import asyncio
+import collections
+import threading
+import time
+import logging
+from typing import Deque, Iterable, List, Optional
+from .blocking_queue import QueueClosed
+from .data_item import DataItem
+
+logger = logging.getLogger(__name__)
+
+
+def _resolve(fut: asyncio.Future) -> None:
+    if not fut.done():
+        fut.set_result(None)
+
+
+class AsyncBlockingQueue:
+    """
+    Bounded queue shared between asyncio tasks and ordinary threads.
+
+    Coroutines use `await put()`, `await take()` and `async for`; threads use
+    the blocking view returned by `.sync`, which has the BlockingQueue API, so
+    an unchanged Producer/Consumer can sit on the other side of the buffer.
+
+    Threads wait on a Condition and coroutines wait on futures, and every put
+    or take wakes one waiter of each kind. Coroutines are woken with
+    call_soon_threadsafe, so no executor thread is needed per item.
+    """
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError("Queue capacity must be positive")
+
+        self._buffer: Deque[DataItem] = collections.deque()
+        self._capacity = capacity
+        self._closed = False
+
+        self._lock = threading.Lock()
+        self._not_full = threading.Condition(self._lock)
+        self._not_empty = threading.Condition(self._lock)
+        # Futures of coroutines waiting for a free slot / for an item
+        self._put_waiters: Deque[asyncio.Future] = collections.deque()
+        self._take_waiters: Deque[asyncio.Future] = collections.deque()
+
+        self.sync = _SyncView(self)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._buffer)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def put(self, item: DataItem) -> None:
+
+        # Inserts an item. Suspends the calling task (not the loop) while full.
+        while True:
+            with self._lock:
+                if self._closed:
+                    raise QueueClosed("Cannot put into a closed queue")
+                if len(self._buffer) < self._capacity:
+                    self._append(item)
+                    return
+                fut = asyncio.get_running_loop().create_future()
+                self._put_waiters.append(fut)
+
+            logger.debug("Queue full. Producer task waiting...")
+            await self._wait(fut, self._put_waiters, self._wake_putter)
+
+    async def take(self) -> DataItem:
+
+        # Removes an item. Suspends the calling task (not the loop) while empty.
+        while True:
+            with self._lock:
+                if self._buffer:
+                    return self._popleft()
+                if self._closed:
+                    raise QueueClosed("Queue is closed and drained")
+                fut = asyncio.get_running_loop().create_future()
+                self._take_waiters.append(fut)
+
+            logger.debug("Queue empty. Consumer task waiting...")
+            await self._wait(fut, self._take_waiters, self._wake_taker)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> DataItem:
+        # Yields items until a Poison Pill arrives or the queue is closed and drained.
+        try:
+            item = await self.take()
+        except QueueClosed:
+            raise StopAsyncIteration
+        if item.is_poison_pill():
+            raise StopAsyncIteration
+        return item
+
+    def close(self) -> None:
+
+        # Rejects further puts and wakes every waiting thread and task.
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._not_full.notify_all()
+            self._not_empty.notify_all()
+            while self._put_waiters:
+                self._wake(self._put_waiters.popleft())
+            while self._take_waiters:
+                self._wake(self._take_waiters.popleft())
+
+    # Blocking operations used by the thread-side view
+
+    def _put_blocking(self, item: DataItem, timeout: Optional[float]) -> bool:
+        deadline = None
+        with self._lock:
+            while len(self._buffer) >= self._capacity and not self._closed:
+                logger.debug("Queue full. Producer waiting...")
+                if timeout is None:
+                    self._not_full.wait()
+                    continue
+                if deadline is None:
+                    deadline = time.monotonic() + timeout
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._not_full.wait(remaining)
+
+            if self._closed:
+                raise QueueClosed("Cannot put into a closed queue")
+            self._append(item)
+            return True
+
+    def _take_blocking(self, max_items: int, timeout: Optional[float]) -> List[DataItem]:
+        deadline = None
+        with self._lock:
+            while not self._buffer and not self._closed:
+                logger.debug("Queue empty. Consumer waiting...")
+                if timeout is None:
+                    self._not_empty.wait()
+                    continue
+                if deadline is None:
+                    deadline = time.monotonic() + timeout
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return []
+                self._not_empty.wait(remaining)
+
+            if not self._buffer:
+                raise QueueClosed("Queue is closed and drained")
+            return [self._popleft() for _ in range(min(max_items, len(self._buffer)))]
+
+    # Internal helpers. _append, _popleft and the _wake* helpers need self._lock held.
+
+    def _append(self, item: DataItem) -> None:
+        self._buffer.append(item)
+        self._wake_taker()
+
+    def _popleft(self) -> DataItem:
+        item = self._buffer.popleft()
+        self._wake_putter()
+        return item
+
+    def _wake_taker(self) -> None:
+        self._not_empty.notify()
+        if self._take_waiters:
+            self._wake(self._take_waiters.popleft())
+
+    def _wake_putter(self) -> None:
+        self._not_full.notify()
+        if self._put_waiters:
+            self._wake(self._put_waiters.popleft())
+
+    @staticmethod
+    def _wake(fut: asyncio.Future) -> None:
+        loop = fut.get_loop()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            _resolve(fut)
+        else:
+            # Called from a thread (or another loop): hand the wakeup to fut's loop
+            loop.call_soon_threadsafe(_resolve, fut)
+
+    async def _wait(self, fut: asyncio.Future, waiters: Deque[asyncio.Future], wake_next) -> None:
+        try:
+            await fut
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    waiters.remove(fut)
+                except ValueError:
+                    # Already signalled: pass the wakeup on so it is not lost
+                    wake_next()
+            raise
+
+
+class _SyncView:
+    # Thread-side face of an AsyncBlockingQueue with the BlockingQueue API,
+    # so Producer, Consumer and ConsumerPool can use it unchanged.
+    def __init__(self, queue: AsyncBlockingQueue):
+        self._queue = queue
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    @property
+    def capacity(self) -> int:
+        return self._queue.capacity
+
+    @property
+    def closed(self) -> bool:
+        return self._queue.closed
+
+    def put(self, item: DataItem) -> None:
+        self._queue._put_blocking(item, None)
+
+    def offer(self, item: DataItem, timeout: float = 0.0) -> bool:
+        return self._queue._put_blocking(item, timeout)
+
+    def take(self) -> DataItem:
+        return self._queue._take_blocking(1, None)[0]
+
+    def poll(self, timeout: float = 0.0) -> Optional[DataItem]:
+        try:
+            items = self._queue._take_blocking(1, timeout)
+        except QueueClosed:
+            return None
+        return items[0] if items else None
+
+    def put_many(self, items: Iterable[DataItem]) -> None:
+        for item in items:
+            self._queue._put_blocking(item, None)
+
+    def take_many(self, max_items: int, timeout: Optional[float] = None) -> List[DataItem]:
+        if max_items <= 0:
+            raise ValueError("max_items must be positive")
+        return self._queue._take_blocking(max_items, timeout)
+
+    def close(self) -> None:
+        self._queue.close()
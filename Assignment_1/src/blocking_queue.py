@@ -1,64 +1,294 @@
 import threading
+import time
 import logging
-from typing import List
+from typing import Dict, Iterable, List, Optional
 from .data_item import DataItem
+from .metrics import QueueMetrics
 
 logger = logging.getLogger(__name__)
 
+
+class QueueClosed(Exception):
+    # Raised by put operations once the queue is closed, and by take operations
+    # once the queue is closed and every remaining item has been drained.
+    pass
+
+
 class BlockingQueue:
 
     # thread-safe bounded buffer implementing the Producer-Consumer pattern.
-    def __init__(self, capacity: int):
+    # Items live in a preallocated ring buffer so put/take are O(1), and
+    # producers/consumers wait on separate conditions so a put only wakes a
+    # consumer and a take only wakes a producer.
+    def __init__(self, capacity: int, collect_metrics: bool = True):
         if capacity <= 0:
             raise ValueError("Queue capacity must be positive")
-        
-        self._buffer: List[DataItem] = []
+
+        self._buffer: List[Optional[DataItem]] = [None] * capacity
         self._capacity = capacity
-        self._cv = threading.Condition()
+        self._head = 0   # index of the next item to take
+        self._tail = 0   # index of the next free slot to put into
+        self._count = 0
+        self._closed = False
+
+        # Both conditions share one lock, so the buffer state is guarded once
+        self._lock = threading.Lock()
+        self._not_full = threading.Condition(self._lock)
+        self._not_empty = threading.Condition(self._lock)
+
+        # Depth, blocked time and latency counters (see metrics_snapshot)
+        self._metrics: Optional[QueueMetrics] = QueueMetrics() if collect_metrics else None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._count
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def metrics_snapshot(self) -> Optional[Dict[str, object]]:
+        # Point-in-time copy of the queue metrics, or None if collection is disabled.
+        if self._metrics is None:
+            return None
+        with self._lock:
+            return self._metrics.snapshot(self._count, self._capacity)
 
     def put(self, item: DataItem) -> None:
-        
-       
-        # Inserts an item into the queue. Blocks if the queue is full. 
+
+        # Inserts an item into the queue. Blocks if the queue is full.
+        start = time.perf_counter()
         try:
-            with self._cv:
+            with self._lock:
+                self._await_slot(None)
+                self._enqueue(item)
+                if self._metrics is not None:
+                    self._metrics.record_put(1, time.perf_counter() - start, self._count)
 
-                # A while loop is used instead of an if statement to handle wakeups
-                while len(self._buffer) == self._capacity:
-                    logger.debug("Queue full. Producer waiting...")
+        except RuntimeError as e:
+            logger.error(f"Critical error in Queue put operation: {e}")
+            raise
 
-                    #Release the lock and wait until notified by the Consumer
-                    self._cv.wait()
-                
-                # Once space is available, add the item to the buffer
-                self._buffer.append(item)
-                logger.debug(f"Item added: {item}")
+    def offer(self, item: DataItem, timeout: float = 0.0) -> bool:
 
-                # Notify all waiting threads
-                self._cv.notify_all()
+        # Inserts an item, waiting at most `timeout` seconds for a free slot.
+        # Returns False instead of blocking forever when the queue stays full.
+        start = time.perf_counter()
+        try:
+            with self._lock:
+                if not self._await_slot(timeout):
+                    return False
+                self._enqueue(item)
+                if self._metrics is not None:
+                    self._metrics.record_put(1, time.perf_counter() - start, self._count)
+                return True
 
         except RuntimeError as e:
-            logger.error(f"Critical error in Queue put operation: {e}")
+            logger.error(f"Critical error in Queue offer operation: {e}")
             raise
 
     def take(self) -> DataItem:
-        
+
         #Removes an item from the queue. Blocks if the queue is empty.
+        start = time.perf_counter()
         try:
-            with self._cv:
+            with self._lock:
+                self._await_item(None)
+                item = self._dequeue()
+                if self._metrics is not None:
+                    self._metrics.record_take(1, time.perf_counter() - start)
+                return item
+        except RuntimeError as e:
+            logger.error(f"Critical error in Queue take operation: {e}")
+            raise
 
-                # Wait while there is no data to consume.
-                while len(self._buffer) == 0:
-                    logger.debug("Queue empty. Consumer waiting...")
+    def poll(self, timeout: float = 0.0) -> Optional[DataItem]:
 
-                    # Release the lock and wait until notified by the Producer
-                    self._cv.wait()
-                
-                item = self._buffer.pop(0)
-                logger.debug(f"Item removed: {item}")
-                # Notify all waiting threads 
-                self._cv.notify_all()
+        # Removes an item, waiting at most `timeout` seconds for one to arrive.
+        # Returns None on timeout or when the queue is closed and drained.
+        start = time.perf_counter()
+        try:
+            with self._lock:
+                try:
+                    if not self._await_item(timeout):
+                        return None
+                except QueueClosed:
+                    return None
+                item = self._dequeue()
+                if self._metrics is not None:
+                    self._metrics.record_take(1, time.perf_counter() - start)
                 return item
         except RuntimeError as e:
-            logger.error(f"Critical error in Queue take operation: {e}")
-            raise
\ No newline at end of file
+            logger.error(f"Critical error in Queue poll operation: {e}")
+            raise
+
+    def put_many(self, items: Iterable[DataItem]) -> None:
+
+        # Inserts a batch of items. Each lock acquisition moves as many items as
+        # there are free slots, so a producer only blocks while the queue is full.
+        batch = list(items)
+        index = 0
+        start = time.perf_counter()
+        try:
+            with self._lock:
+                while index < len(batch):
+                    self._await_slot(None)
+
+                    free = min(self._capacity - self._count, len(batch) - index)
+                    moved = 0
+                    try:
+                        while moved < free:
+                            self._store(batch[index])
+                            index += 1
+                            moved += 1
+                    finally:
+                        # Account for whatever was stored, even if a storage hook raised
+                        self._count += moved
+                        logger.debug("Items added: %d", moved)
+
+                        # Wake one consumer per item that became available
+                        self._not_empty.notify(moved)
+                        if self._metrics is not None and moved:
+                            self._metrics.record_put(moved, time.perf_counter() - start, self._count)
+
+        except RuntimeError as e:
+            logger.error(f"Critical error in Queue put_many operation: {e}")
+            raise
+
+    def take_many(self, max_items: int, timeout: Optional[float] = None) -> List[DataItem]:
+
+        # Removes up to max_items in one lock acquisition. Blocks only until at
+        # least one item is available; returns an empty list if the timeout expires.
+        if max_items <= 0:
+            raise ValueError("max_items must be positive")
+
+        start = time.perf_counter()
+        try:
+            with self._lock:
+                if not self._await_item(timeout):
+                    return []
+
+                moved = min(self._count, max_items)
+                items = [self._remove() for _ in range(moved)]
+                self._count -= moved
+                logger.debug("Items removed: %d", moved)
+
+                # Wake one producer per slot that was freed
+                self._not_full.notify(moved)
+                if self._metrics is not None:
+                    self._metrics.record_take(moved, time.perf_counter() - start)
+                return items
+        except RuntimeError as e:
+            logger.error(f"Critical error in Queue take_many operation: {e}")
+            raise
+
+    def close(self) -> None:
+
+        # Closes the queue: further puts raise QueueClosed, consumers keep
+        # draining what is left and then get QueueClosed instead of blocking.
+        # A single call releases every waiting thread, however many there are.
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            logger.debug("Queue closed. Waking all waiters.")
+            self._not_full.notify_all()
+            self._not_empty.notify_all()
+
+    # Internal helpers. All of them must be called with self._lock held.
+
+    def _await_slot(self, timeout: Optional[float]) -> bool:
+        # Waits for a free slot. Returns False if the timeout expired first.
+        if self._count == self._capacity and not self._closed:
+            deadline = None
+            blocked_at = time.perf_counter()
+            try:
+                # A while loop is used instead of an if statement to handle wakeups
+                while self._count == self._capacity and not self._closed:
+                    logger.debug("Queue full. Producer waiting...")
+                    if timeout is None:
+                        #Release the lock and wait until notified by a Consumer
+                        self._not_full.wait()
+                        continue
+                    if deadline is None:
+                        deadline = time.monotonic() + timeout
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    self._not_full.wait(remaining)
+            finally:
+                if self._metrics is not None:
+                    self._metrics.producer_blocked += time.perf_counter() - blocked_at
+
+        if self._closed:
+            raise QueueClosed("Cannot put into a closed queue")
+        return True
+
+    def _await_item(self, timeout: Optional[float]) -> bool:
+        # Waits for an item. Returns False if the timeout expired first.
+        if self._count == 0 and not self._closed:
+            deadline = None
+            blocked_at = time.perf_counter()
+            try:
+                # Wait while there is no data to consume.
+                while self._count == 0 and not self._closed:
+                    logger.debug("Queue empty. Consumer waiting...")
+                    if timeout is None:
+                        # Release the lock and wait until notified by a Producer
+                        self._not_empty.wait()
+                        continue
+                    if deadline is None:
+                        deadline = time.monotonic() + timeout
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    self._not_empty.wait(remaining)
+            finally:
+                if self._metrics is not None:
+                    self._metrics.consumer_blocked += time.perf_counter() - blocked_at
+
+        # A closed queue still hands out its remaining items
+        if self._count == 0:
+            raise QueueClosed("Queue is closed and drained")
+        return True
+
+    def _enqueue(self, item: DataItem) -> None:
+        # Once space is available, store the item
+        self._store(item)
+        self._count += 1
+        logger.debug("Item added: %s", item)
+
+        # Exactly one new item is available, so wake exactly one consumer
+        self._not_empty.notify()
+
+    def _dequeue(self) -> DataItem:
+        item = self._remove()
+        self._count -= 1
+        logger.debug("Item removed: %s", item)
+
+        # Exactly one slot was freed, so wake exactly one producer
+        self._not_full.notify()
+        return item
+
+    # Storage hooks. Subclasses swap the ordering policy by overriding these two;
+    # capacity, counting, blocking and wakeups stay in the methods above.
+
+    def _store(self, item: DataItem) -> None:
+        # Write the item into the tail slot of the ring buffer
+        self._buffer[self._tail] = item
+        self._tail += 1
+        if self._tail == self._capacity:
+            self._tail = 0
+
+    def _remove(self) -> DataItem:
+        item = self._buffer[self._head]
+        # Clear the slot so the queue does not keep the item alive
+        self._buffer[self._head] = None
+        self._head += 1
+        if self._head == self._capacity:
+            self._head = 0
+        return item
@@ -1,34 +1,110 @@
 import threading
 import time
 import logging
-from .blocking_queue import BlockingQueue
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from .blocking_queue import BlockingQueue, QueueClosed
+from .data_item import DataItem, DataItemPool
+from .metrics import WorkerMetrics
 
 logger = logging.getLogger(__name__)
 
 class Consumer(threading.Thread):
-    def __init__(self, queue: BlockingQueue, processing_time: float = 0.2):
+    def __init__(self, queue: BlockingQueue, processing_time: float = 0.2, batch_size: int = 1,
+                 handler: Optional[Callable[[Any], Any]] = None, item_pool: Optional[DataItemPool] = None):
         super().__init__()
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
         self.queue = queue
         self.processing_time = processing_time
+        # Maximum items taken from the queue per lock acquisition (1 = item-by-item take)
+        self.batch_size = batch_size
+        # Called with each payload. Without one, processing is simulated with a sleep.
+        self.handler = handler
+        # Optional envelope pool: handled items are released back to it
+        self.item_pool = item_pool
+        # Items handled, time spent in queue calls and time spent handling
+        # (only written by this thread)
+        self.metrics = WorkerMetrics()
+
+    @property
+    def processed(self) -> int:
+        return self.metrics.items
+
+    def metrics_snapshot(self) -> Dict[str, object]:
+        return self.metrics.snapshot()
 
     def run(self):
         logger.info("Consumer started.")
+        # Rates are measured from the moment the thread starts working
+        self.metrics.started = time.perf_counter()
         try:
             # Infinite loop to keep consuming until instructed to stop
             while True:
 
-                # Retrieve an item from the queue.
-                item = self.queue.take()
-
+                # Retrieve one item, or up to batch_size items, from the queue.
+                # A closed and drained queue ends the loop just like a Poison Pill.
+                started = time.perf_counter()
+                try:
+                    if self.batch_size == 1:
+                        batch = [self.queue.take()]
+                    else:
+                        batch = self.queue.take_many(self.batch_size)
+                except QueueClosed:
+                    logger.info("Queue closed. Shutting down Consumer.")
+                    break
+                finally:
+                    self.metrics.queue_time += time.perf_counter() - started
 
-                # Check if the retrieved item is the special "Poison Pill" (shutdown signal)
-                if item.is_poison_pill():
+                if not self._process_batch(batch):
                     logger.info("Poison Pill received. Shutting down Consumer.")
                     break
+                
+        except Exception as e:
+            logger.error(f"Consumer encountered an unexpected error: {e}")
 
-                logger.info(f"Consuming: {item.payload}")
+    def _process_batch(self, batch: List[DataItem]) -> bool:
+        # Handles the regular items of a batch in the order they were taken and
+        # returns False if the batch held a Poison Pill. Items taken after the
+        # pill are handled here too, before the consumer stops, rather than put
+        # back behind items queued since: every item is handled exactly once and
+        # in queue order. Extra pills, meant for other consumers, are handed back.
+        items, pills = self._split_pills(batch)
+        if items:
+            started = time.perf_counter()
+            self._handle_items(items)
+            self.metrics.work_time += time.perf_counter() - started
+            if self.item_pool is not None:
+                for item in items:
+                    self.item_pool.release(item)
+        if len(pills) > 1:
+            self._return_pills(pills[1:])
+        return not pills
+
+    @staticmethod
+    def _split_pills(batch: List[DataItem]) -> Tuple[List[DataItem], List[DataItem]]:
+        # (regular items, Poison Pills), each in batch order
+        items = [item for item in batch if not item.is_poison_pill()]
+        if len(items) == len(batch):
+            return batch, []
+        return items, [item for item in batch if item.is_poison_pill()]
+
+    def _return_pills(self, pills: List[DataItem]) -> None:
+        # With offer() an exiting consumer never waits for a slot. A pill that
+        # does not fit is dropped with a warning; close() still stops the others.
+        for pill in pills:
+            try:
+                returned = self.queue.offer(pill)
+            except QueueClosed:
+                return
+            if not returned:
+                logger.warning("Queue full; a Poison Pill for another consumer was dropped.")
+
+    def _handle_items(self, items: List[DataItem]) -> None:
+        for item in items:
+            logger.info("Consuming: %s", item.payload)
+            if self.handler is not None:
+                self.handler(item.payload)
+            else:
                 # Simulate processing time
                 time.sleep(self.processing_time)
-                
-        except Exception as e:
-            logger.error(f"Consumer encountered an unexpected error: {e}")
\ No newline at end of file
+            self.metrics.items += 1
@@ -0,0 +1,97 @@
+import logging
+import multiprocessing
+from typing import Any, Callable, List, Optional
+from .blocking_queue import BlockingQueue
+from .consumer import Consumer
+from .data_item import DataItem
+
+logger = logging.getLogger(__name__)
+
+THREAD_BACKEND = "thread"
+PROCESS_BACKEND = "process"
+
+
+class _ProcessConsumer(Consumer):
+    # Dispatcher thread for the process backend: it drains the shared queue in
+    # batches and runs the handler for the whole batch inside the worker pool.
+    # The BlockingQueue itself never leaves this process; only payloads are pickled.
+    def __init__(self, queue: BlockingQueue, handler: Callable[[Any], Any], batch_size: int,
+                 pool):
+        super().__init__(queue, batch_size=batch_size, handler=handler)
+        self._pool = pool
+
+    def _handle_items(self, items: List[DataItem]) -> None:
+        logger.debug("Dispatching %d items to worker processes", len(items))
+        self._pool.map(self.handler, [item.payload for item in items])
+        self.metrics.items += len(items)
+
+
+class ConsumerPool:
+    """
+    Runs N consumers against one shared BlockingQueue.
+
+    Backends:
+        "thread":  N Consumer threads calling the handler directly. Suited to
+                   I/O-bound handlers that release the GIL.
+        "process": N dispatcher threads feeding a multiprocessing.Pool of N
+                   worker processes. Suited to CPU-bound handlers; the handler
+                   and payloads must be picklable.
+
+    Shutdown works like a single Consumer: close the queue (one signal for the
+    whole pool), or send one Poison Pill per worker.
+    """
+    def __init__(self, queue: BlockingQueue, handler: Callable[[Any], Any], workers: int = 4,
+                 backend: str = THREAD_BACKEND, batch_size: Optional[int] = None):
+        if workers <= 0:
+            raise ValueError("workers must be positive")
+        if backend not in (THREAD_BACKEND, PROCESS_BACKEND):
+            raise ValueError(f"Unknown backend: {backend!r}")
+
+        self.queue = queue
+        self.handler = handler
+        self.workers = workers
+        self.backend = backend
+        # Process workers pay an IPC round trip per dispatch, so batch by default
+        if batch_size is None:
+            batch_size = 1 if backend == THREAD_BACKEND else 64
+        self.batch_size = batch_size
+
+        self._pool = None
+        self._consumers: List[Consumer] = []
+
+    def start(self) -> None:
+        if self._consumers:
+            raise RuntimeError("ConsumerPool already started")
+
+        if self.backend == PROCESS_BACKEND:
+            self._pool = multiprocessing.Pool(self.workers)
+            self._consumers = [
+                _ProcessConsumer(self.queue, self.handler, self.batch_size, self._pool)
+                for _ in range(self.workers)
+            ]
+        else:
+            self._consumers = [
+                Consumer(self.queue, batch_size=self.batch_size, handler=self.handler)
+                for _ in range(self.workers)
+            ]
+
+        logger.info(f"Starting ConsumerPool with {self.workers} {self.backend} workers.")
+        for consumer in self._consumers:
+            consumer.start()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        # Waits for every consumer (each gets the full timeout), then stops the process pool.
+        for consumer in self._consumers:
+            consumer.join(timeout)
+
+        if self._pool is not None and not self.is_alive():
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def is_alive(self) -> bool:
+        return any(consumer.is_alive() for consumer in self._consumers)
+
+    @property
+    def processed(self) -> int:
+        return sum(consumer.processed for consumer in self._consumers)
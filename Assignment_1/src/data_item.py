@@ -1,18 +1,80 @@
-from typing import Optional, Any
+import collections
+from typing import Deque, Optional, Any
 
 class DataItem:
     """
     A wrapper class for data transferred between Producer and Consumer.
-    
+
+    Uses __slots__, so an envelope has no per-instance __dict__.
+
     Attributes:
-        payload (Any): The actual data. If None, represents a Poison Pill.
+        payload (Any): The actual data. Any value, including None, is a valid payload.
+        priority (int): Scheduling hint for PriorityBlockingQueue. Higher values
+            are served first; plain FIFO queues ignore it.
+
+    Shutdown is signalled with the POISON_PILL singleton, not with a payload value.
     """
-    def __init__(self, payload: Optional[Any]):
+    __slots__ = ("payload", "priority")
+
+    def __init__(self, payload: Optional[Any], priority: int = 0):
         self.payload = payload
+        self.priority = priority
 
     def is_poison_pill(self) -> bool:
         """Checks if this item is the signal to stop processing."""
-        return self.payload is None
+        return self is POISON_PILL
+
+    def __reduce__(self):
+        # The pill stays a singleton when pickled to another process
+        if self is POISON_PILL:
+            return "POISON_PILL"
+        return (DataItem, (self.payload, self.priority))
 
     def __repr__(self) -> str:
-        return f"DataItem(payload={self.payload})"
\ No newline at end of file
+        if self is POISON_PILL:
+            return "POISON_PILL"
+        if self.priority:
+            return f"DataItem(payload={self.payload}, priority={self.priority})"
+        return f"DataItem(payload={self.payload})"
+
+
+# The one and only shutdown signal. Compare with `is` / is_poison_pill().
+POISON_PILL = DataItem(None)
+
+
+class DataItemPool:
+    """
+    Free list of reusable DataItem envelopes for high-rate producers.
+
+    The producer calls acquire() instead of DataItem(...), and the consumer
+    calls release() once it no longer needs the item. Nobody may keep a
+    reference to a released item. acquire() and release() may run on
+    different threads: deque append/pop are atomic under the GIL.
+    """
+    def __init__(self, max_size: int = 1024):
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        self.max_size = max_size
+        self._free: Deque[DataItem] = collections.deque()
+        # Envelopes allocated because the free list was empty
+        self.created = 0
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    def acquire(self, payload: Any, priority: int = 0) -> DataItem:
+        try:
+            item = self._free.pop()
+        except IndexError:
+            self.created += 1
+            return DataItem(payload, priority)
+        item.payload = payload
+        item.priority = priority
+        return item
+
+    def release(self, item: DataItem) -> None:
+        if item is POISON_PILL or len(self._free) >= self.max_size:
+            return
+        # Drop the payload reference so pooled envelopes do not keep data alive
+        item.payload = None
+        self._free.append(item)
@@ -0,0 +1,195 @@
+import threading
+import time
+import logging
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Every recorder below is updated either under the owning queue's lock or by a
+# single worker thread, so there is no extra locking on the hot path: a
+# recording costs a couple of perf_counter() calls and a few integer updates.
+
+
+class LatencyHistogram:
+    """
+    Fixed-size latency histogram with power-of-two microsecond buckets.
+
+    Bucket 0 counts latencies below 1us and bucket i counts [2^(i-1), 2^i) us,
+    so percentiles are reported as the upper bound of their bucket.
+    """
+    BUCKETS = 32
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts: List[int] = [0] * self.BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        index = int(seconds * 1e6).bit_length()
+        if index >= self.BUCKETS:
+            index = self.BUCKETS - 1
+        self.counts[index] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        # Adds `other`'s recordings to this histogram and returns it
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        return self
+
+    def percentile(self, fraction: float) -> float:
+        # Upper bound (in seconds) of the bucket holding the given rank
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            seen += bucket
+            if seen >= rank:
+                return min((1 << index) / 1e6, self.max)
+        return self.max
+
+    def snapshot(self) -> Dict[str, object]:
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(0.50),
+            "p90": self.percentile(0.90),
+            "p99": self.percentile(0.99),
+            "max": self.max,
+            # {bucket upper bound in us: count}, empty buckets omitted
+            "buckets": {1 << i: c for i, c in enumerate(self.counts) if c},
+        }
+
+
+class QueueMetrics:
+    # Counters kept by a BlockingQueue. Updated with the queue lock held.
+    # Counters are exact; latencies are recorded for one operation in every
+    # `sample_every` (a power of two) to keep the per-operation cost low.
+    __slots__ = ("started", "enqueued", "dequeued", "high_water",
+                 "producer_blocked", "consumer_blocked", "put_latency", "take_latency",
+                 "sample_every", "_sample_mask", "_puts", "_takes")
+
+    def __init__(self, sample_every: int = 8):
+        if sample_every <= 0 or sample_every & (sample_every - 1):
+            raise ValueError("sample_every must be a power of two")
+        self.sample_every = sample_every
+        self._sample_mask = sample_every - 1
+        self._puts = 0
+        self._takes = 0
+        self.started = time.perf_counter()
+        self.enqueued = 0
+        self.dequeued = 0
+        self.high_water = 0
+        self.producer_blocked = 0.0   # cumulative seconds producers spent waiting for a slot
+        self.consumer_blocked = 0.0   # cumulative seconds consumers spent waiting for an item
+        self.put_latency = LatencyHistogram()
+        self.take_latency = LatencyHistogram()
+
+    def record_put(self, items: int, latency: float, depth: int) -> bool:
+        # Returns True when this put's latency was sampled
+        self.enqueued += items
+        if depth > self.high_water:
+            self.high_water = depth
+        self._puts += 1
+        if not self._puts & self._sample_mask:
+            self.put_latency.record(latency)
+            return True
+        return False
+
+    def record_take(self, items: int, latency: float) -> None:
+        self.dequeued += items
+        self._takes += 1
+        if not self._takes & self._sample_mask:
+            self.take_latency.record(latency)
+
+    def snapshot(self, depth: int, capacity: int) -> Dict[str, object]:
+        elapsed = time.perf_counter() - self.started
+        return {
+            "depth": depth,
+            "capacity": capacity,
+            "high_water": self.high_water,
+            "enqueued": self.enqueued,
+            "dequeued": self.dequeued,
+            "items_per_sec": self.dequeued / elapsed if elapsed > 0 else 0.0,
+            "producer_blocked_sec": self.producer_blocked,
+            "consumer_blocked_sec": self.consumer_blocked,
+            "latency_sample_every": self.sample_every,
+            "put_latency": self.put_latency.snapshot(),
+            "take_latency": self.take_latency.snapshot(),
+        }
+
+
+class WorkerMetrics:
+    # Counters kept by a single Producer or Consumer thread.
+    __slots__ = ("started", "items", "queue_time", "work_time")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.items = 0
+        self.queue_time = 0.0   # seconds spent inside queue calls (including blocking)
+        self.work_time = 0.0    # seconds spent producing / handling items
+
+    def snapshot(self) -> Dict[str, object]:
+        elapsed = time.perf_counter() - self.started
+        return {
+            "items": self.items,
+            "items_per_sec": self.items / elapsed if elapsed > 0 else 0.0,
+            "queue_time_sec": self.queue_time,
+            "work_time_sec": self.work_time,
+        }
+
+
+class MetricsReporter(threading.Thread):
+    """
+    Daemon thread that logs metric snapshots every `interval` seconds.
+
+    `sources` maps a name to a zero-argument callable returning a snapshot dict,
+    e.g. {"queue": queue.metrics_snapshot, "producer": producer.metrics_snapshot}.
+    """
+    def __init__(self, sources: Dict[str, Callable[[], Optional[Dict[str, object]]]],
+                 interval: float = 1.0, log_level: int = logging.INFO):
+        super().__init__(name="MetricsReporter", daemon=True)
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.sources = sources
+        self.interval = interval
+        self.log_level = log_level
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            self.report()
+
+    def stop(self, final_report: bool = True) -> None:
+        self._stopped.set()
+        if final_report:
+            self.report()
+
+    def report(self) -> None:
+        for name, snapshot in self.sources.items():
+            data = snapshot()
+            if data is not None:
+                logger.log(self.log_level, "metrics %s: %s", name, format_snapshot(data))
+
+
+def format_snapshot(data: Dict[str, object]) -> str:
+    # One-line rendering; latency histograms are shortened to count/p50/p99.
+    parts = []
+    for key, value in data.items():
+        if isinstance(value, dict) and "p99" in value:
+            parts.append(f"{key}=n:{value['count']} p50:{value['p50'] * 1e6:.0f}us "
+                         f"p99:{value['p99'] * 1e6:.0f}us")
+        elif isinstance(value, float):
+            parts.append(f"{key}={value:.3f}")
+        else:
+            parts.append(f"{key}={value}")
+    return ", ".join(parts)
@@ -0,0 +1,118 @@
+import collections
+import heapq
+import itertools
+import logging
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+from .blocking_queue import BlockingQueue
+from .data_item import DataItem
+
+logger = logging.getLogger(__name__)
+
+
+class PriorityBlockingQueue(BlockingQueue):
+    """
+    Bounded blocking queue that serves the highest DataItem.priority first.
+
+    Items of equal priority keep FIFO order. Poison Pills always sort after
+    every regular item, so a pill never overtakes queued work. Capacity,
+    blocking, timeouts, close() and metrics behave exactly as in BlockingQueue;
+    enqueue and dequeue are O(log n) heap operations.
+    """
+    def __init__(self, capacity: int, collect_metrics: bool = True):
+        super().__init__(capacity, collect_metrics)
+        # The ring buffer is replaced by a heap of (pill?, -priority, sequence, item)
+        self._buffer = []
+        self._sequence = itertools.count()
+
+    def _store(self, item: DataItem) -> None:
+        if item.is_poison_pill():
+            key = (1, 0, next(self._sequence), item)
+        else:
+            key = (0, -item.priority, next(self._sequence), item)
+        heapq.heappush(self._buffer, key)
+
+    def _remove(self) -> DataItem:
+        return heapq.heappop(self._buffer)[3]
+
+
+class _Lane:
+    __slots__ = ("name", "weight", "stride", "pass_value", "items")
+
+    def __init__(self, name: str, weight: int, stride: float):
+        self.name = name
+        self.weight = weight
+        self.stride = stride
+        self.pass_value = 0.0
+        self.items: Deque[DataItem] = collections.deque()
+
+
+class MultiLaneQueue(BlockingQueue):
+    """
+    Bounded blocking queue with named lanes served by weighted fair scheduling.
+
+    `lanes` maps lane name to an integer weight: with {"urgent": 4, "bulk": 1},
+    "urgent" gets four dequeues for every "bulk" one while both have items, and
+    an idle lane's share goes to the others. `lane_of(item)` routes each put;
+    by default everything goes to the first lane. Capacity is shared by all lanes.
+
+    Scheduling is stride scheduling over a heap of non-empty lanes: O(1) per
+    lane append/pop plus O(log lanes) per lane selection. Poison Pills wait in
+    their own lane that is only served once every regular lane is empty.
+    """
+    STRIDE_SCALE = 1 << 20
+
+    def __init__(self, capacity: int, lanes: Dict[str, int],
+                 lane_of: Optional[Callable[[DataItem], str]] = None,
+                 collect_metrics: bool = True):
+        super().__init__(capacity, collect_metrics)
+        if not lanes:
+            raise ValueError("At least one lane is required")
+        for name, weight in lanes.items():
+            if weight <= 0:
+                raise ValueError(f"Lane {name!r} weight must be positive")
+
+        self._buffer = None
+        self._lanes: Dict[str, _Lane] = {
+            name: _Lane(name, weight, self.STRIDE_SCALE / weight) for name, weight in lanes.items()
+        }
+        default_lane = next(iter(lanes))
+        self._lane_of = lane_of or (lambda item: default_lane)
+        # Heap of (pass value, tie-breaker, lane) for lanes that currently hold items
+        self._ready: List[Tuple[float, int, _Lane]] = []
+        self._tiebreak = itertools.count()
+        # Virtual time: pass value of the lane served most recently
+        self._virtual_time = 0.0
+        self._pills: Deque[DataItem] = collections.deque()
+
+    def lane_depths(self) -> Dict[str, int]:
+        with self._lock:
+            return {name: len(lane.items) for name, lane in self._lanes.items()}
+
+    def _store(self, item: DataItem) -> None:
+        if item.is_poison_pill():
+            self._pills.append(item)
+            return
+
+        name = self._lane_of(item)
+        lane = self._lanes.get(name)
+        if lane is None:
+            raise KeyError(f"Unknown lane: {name!r}")
+
+        if not lane.items:
+            # A lane waking up from idle must not cash in credit for the time it
+            # had nothing to send, so it rejoins at the current virtual time.
+            lane.pass_value = max(lane.pass_value, self._virtual_time)
+            heapq.heappush(self._ready, (lane.pass_value, next(self._tiebreak), lane))
+        lane.items.append(item)
+
+    def _remove(self) -> DataItem:
+        if not self._ready:
+            return self._pills.popleft()
+
+        pass_value, _, lane = heapq.heappop(self._ready)
+        self._virtual_time = pass_value
+        item = lane.items.popleft()
+        lane.pass_value = pass_value + lane.stride
+        if lane.items:
+            heapq.heappush(self._ready, (lane.pass_value, next(self._tiebreak), lane))
+        return item
@@ -1,35 +1,101 @@
 import threading
 import time
 import logging
-from .blocking_queue import BlockingQueue
-from .data_item import DataItem
+from typing import Dict, Optional
+from .blocking_queue import BlockingQueue, QueueClosed
+from .data_item import DataItem, DataItemPool, POISON_PILL
+from .metrics import WorkerMetrics
+from .rate_control import RateController
 
 logger = logging.getLogger(__name__)
 
 class Producer(threading.Thread):
-    def __init__(self, queue: BlockingQueue, item_count: int, delay: float = 0.1):
+    def __init__(self, queue: BlockingQueue, item_count: int, delay: float = 0.1, batch_size: int = 1,
+                 send_poison_pill: bool = True, item_pool: Optional[DataItemPool] = None,
+                 rate_controller: Optional[RateController] = None):
         super().__init__()
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
         self.queue = queue
         self.item_count = item_count
         self.delay = delay
+        # Items handed to the queue per lock acquisition (1 = item-by-item put)
+        self.batch_size = batch_size
+        # When False the owner shuts consumers down with queue.close() instead
+        self.send_poison_pill = send_poison_pill
+        # Optional envelope pool; the consumer must release items back to it
+        self.item_pool = item_pool
+        # Optional adaptive pacing; when set it replaces the fixed delay
+        self.rate_controller = rate_controller
+        # Items produced, time spent in queue calls and time spent producing
+        self.metrics = WorkerMetrics()
+
+    def metrics_snapshot(self) -> Dict[str, object]:
+        return self.metrics.snapshot()
 
     def run(self):
         logger.info("Producer started.")
+        # Rates are measured from the moment the thread starts working
+        self.metrics.started = time.perf_counter()
         try:
-            # Loop from 1 up to the specific item_count
-            for i in range(1, self.item_count + 1):
-                item = DataItem(i)
-                logger.info(f"Producing: {item}")
-
-                # Insert the item into the shared queue.
-                self.queue.put(item)
-
-                # Sleep to simulate the time it takes to produce an item
-                time.sleep(self.delay)
-            
-            # Send Poison Pill (Shutdown Signal)
-            logger.info("Producer finished. Sending Poison Pill.")
-            self.queue.put(DataItem(None))
-            
+            if self.batch_size == 1:
+                self._produce_single()
+            else:
+                self._produce_batched()
+
+            if self.send_poison_pill:
+                # Send Poison Pill (Shutdown Signal)
+                logger.info("Producer finished. Sending Poison Pill.")
+                self.queue.put(POISON_PILL)
+            else:
+                logger.info("Producer finished.")
+
+        except QueueClosed:
+            logger.warning("Queue closed. Stopping Producer.")
         except Exception as e:
-            logger.error(f"Producer encountered an unexpected error: {e}")
\ No newline at end of file
+            logger.error(f"Producer encountered an unexpected error: {e}")
+
+    def _new_item(self, payload) -> DataItem:
+        if self.item_pool is not None:
+            return self.item_pool.acquire(payload)
+        return DataItem(payload)
+
+    def _produce_single(self):
+        # Loop from 1 up to the specific item_count
+        for i in range(1, self.item_count + 1):
+            item = self._new_item(i)
+            logger.info("Producing: %s", item)
+
+            # Insert the item into the shared queue.
+            started = time.perf_counter()
+            self.queue.put(item)
+            put_done = time.perf_counter()
+            self.metrics.queue_time += put_done - started
+            self.metrics.items += 1
+
+            # Sleep to simulate the time it takes to produce an item
+            time.sleep(self._pause(1))
+            self.metrics.work_time += time.perf_counter() - put_done
+
+    def _produce_batched(self):
+        # Build batches of up to batch_size items and move each one with put_many()
+        for start in range(1, self.item_count + 1, self.batch_size):
+            stop = min(start + self.batch_size, self.item_count + 1)
+            batch = [self._new_item(i) for i in range(start, stop)]
+            logger.info("Producing batch: %s..%s (%d items)", batch[0], batch[-1], len(batch))
+
+            started = time.perf_counter()
+            self.queue.put_many(batch)
+            put_done = time.perf_counter()
+            self.metrics.queue_time += put_done - started
+            self.metrics.items += len(batch)
+
+            # Simulate the production time of every item in the batch
+            time.sleep(self._pause(len(batch)))
+            self.metrics.work_time += time.perf_counter() - put_done
+
+    def _pause(self, produced: int) -> float:
+        # Fixed delay per item, or whatever the controller makes of the current backlog
+        if self.rate_controller is None:
+            return self.delay * produced
+        return self.rate_controller.next_delay(len(self.queue), self.queue.capacity, produced)
@@ -0,0 +1,18 @@
+from typing import Union
+from .blocking_queue import BlockingQueue
+from .spsc_queue import SPSCQueue
+
+
+def create_queue(capacity: int, producers: int = 1, consumers: int = 1,
+                 collect_metrics: bool = True) -> Union[BlockingQueue, SPSCQueue]:
+    """
+    Picks the cheapest queue that is safe for the given number of threads.
+
+    Exactly one producer and one consumer get the lock-free SPSCQueue fast path;
+    anything else gets the general BlockingQueue. Both expose the same API.
+    """
+    if producers <= 0 or consumers <= 0:
+        raise ValueError("producers and consumers must be positive")
+    if producers == 1 and consumers == 1:
+        return SPSCQueue(capacity, collect_metrics=collect_metrics)
+    return BlockingQueue(capacity, collect_metrics=collect_metrics)
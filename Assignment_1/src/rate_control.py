@@ -0,0 +1,132 @@
+import time
+import logging
+from abc import ABC, abstractmethod
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RateController(ABC):
+    """
+    Base class for adaptive Producer pacing.
+
+    After every put the Producer calls next_delay() with the queue depth, the
+    queue capacity and how many items it has just put; the controller answers
+    with the pause before the next item. Subclasses implement _update(), which
+    turns the latest observation into a target production rate (items/sec).
+
+    The drain rate of the consumers is estimated from the same observations:
+    items drained = items put - growth in depth, smoothed with an EWMA. The
+    estimate assumes this producer is the only one feeding the queue.
+    """
+    def __init__(self, initial_rate: float, min_rate: float = 1.0, max_rate: float = 100000.0,
+                 smoothing: float = 0.2):
+        if not 0 < min_rate <= initial_rate <= max_rate:
+            raise ValueError("Rates must satisfy 0 < min_rate <= initial_rate <= max_rate")
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be in (0, 1]")
+        self.rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.smoothing = smoothing
+        # Estimated consumer drain rate (items/sec), None until two observations exist
+        self.drain_rate: Optional[float] = None
+
+        self._last_time: Optional[float] = None
+        self._last_depth = 0
+
+    def next_delay(self, depth: int, capacity: int, produced: int = 1) -> float:
+        now = time.perf_counter()
+        if self._last_time is not None:
+            elapsed = now - self._last_time
+            if elapsed > 0:
+                drained = max(produced - (depth - self._last_depth), 0)
+                sample = drained / elapsed
+                if self.drain_rate is None:
+                    self.drain_rate = sample
+                else:
+                    self.drain_rate += self.smoothing * (sample - self.drain_rate)
+        self._last_time = now
+        self._last_depth = depth
+
+        rate = self._update(depth, capacity, now)
+        self.rate = min(max(rate, self.min_rate), self.max_rate)
+        return produced / self.rate
+
+    @abstractmethod
+    def _update(self, depth: int, capacity: int, now: float) -> float:
+        # Target production rate (items/sec) after the latest observation
+        ...
+
+
+class AIMDRateController(RateController):
+    """
+    Additive-increase / multiplicative-decrease pacing toward a target occupancy.
+
+    While the queue is below `target_fill` (fraction of capacity) the rate
+    grows by `increase` items/sec per observation; once it is at or above the
+    target the rate is multiplied by `decrease`, at most once per
+    `cooldown` seconds so a single backlog does not collapse the rate.
+    """
+    def __init__(self, target_fill: float = 0.5, initial_rate: float = 100.0,
+                 increase: float = 5.0, decrease: float = 0.7, cooldown: float = 0.05, **kwargs):
+        super().__init__(initial_rate, **kwargs)
+        if not 0 < target_fill <= 1:
+            raise ValueError("target_fill must be in (0, 1]")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be in (0, 1)")
+        self.target_fill = target_fill
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self._last_decrease = float("-inf")
+
+    def _update(self, depth: int, capacity: int, now: float) -> float:
+        if depth >= self.target_fill * capacity:
+            if now - self._last_decrease >= self.cooldown:
+                self._last_decrease = now
+                return self.rate * self.decrease
+            return self.rate
+        return self.rate + self.increase
+
+
+class PIDRateController(RateController):
+    """
+    PID pacing that holds the queue depth at `target_depth` items.
+
+    The rate is the estimated drain rate plus a correction proportional to
+    the depth error, its integral and its derivative. Matching the drain rate
+    keeps the depth flat; the error term fills or empties the queue toward
+    the target.
+    """
+    def __init__(self, target_depth: float, initial_rate: float = 100.0,
+                 kp: float = 20.0, ki: float = 5.0, kd: float = 0.0, **kwargs):
+        super().__init__(initial_rate, **kwargs)
+        if target_depth < 0:
+            raise ValueError("target_depth must not be negative")
+        self.target_depth = target_depth
+        self.kp = kp
+        self.ki = ki
+        self.kd = kd
+        self._integral = 0.0
+        self._last_error: Optional[float] = None
+        self._last_update: Optional[float] = None
+
+    def _update(self, depth: int, capacity: int, now: float) -> float:
+        error = self.target_depth - depth
+        dt = now - self._last_update if self._last_update is not None else 0.0
+        derivative = 0.0
+        if dt > 0:
+            self._integral += error * dt
+            if self._last_error is not None:
+                derivative = (error - self._last_error) / dt
+        self._last_error = error
+        self._last_update = now
+
+        base = self.drain_rate if self.drain_rate is not None else self.rate
+        rate = base + self.kp * error + self.ki * self._integral + self.kd * derivative
+
+        # Anti-windup: stop integrating while the output is pinned at a limit
+        if not self.min_rate <= rate <= self.max_rate and dt > 0:
+            self._integral -= error * dt
+        return rate
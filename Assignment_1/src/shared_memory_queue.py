@@ -0,0 +1,287 @@
+import logging
+import multiprocessing
+import struct
+import time
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Iterator, Optional, Tuple
+from .blocking_queue import QueueClosed
+
+logger = logging.getLogger(__name__)
+
+# Shared header: head, read, tail (monotonic byte counters) and the closed flag.
+#   head: oldest byte still owned by a consumer; space before it can be reused
+#   read: next record to hand out to a consumer
+#   tail: next byte a producer will write
+_STATE = struct.Struct("<QQQQ")
+# Per-record header: payload length and flags
+_RECORD = struct.Struct("<II")
+
+_WRAP = 1       # padding record: the rest of the buffer is skipped
+_RELEASED = 2   # the consumer is done with the record, its space can be reused
+
+_ALIGN = 8
+
+
+def _aligned(size: int) -> int:
+    return (size + _ALIGN - 1) & ~(_ALIGN - 1)
+
+
+class SharedMemoryQueue:
+    """
+    Bounded cross-process queue of byte payloads backed by a shared-memory ring buffer.
+
+    Same contract as BlockingQueue: put() blocks while there is no room, take()
+    blocks while there is nothing to read, close() rejects further puts and lets
+    consumers drain. Payloads are length-prefixed records, so both fixed-size and
+    variable-size messages work; nothing is pickled on the put/take path.
+
+    take_view() hands out a zero-copy memoryview of a record. Its space is only
+    reused after the view's context exits, so slow consumers never see their
+    data overwritten.
+
+    The creating process owns the segment and must call unlink() when done.
+    Pass the queue to child processes as a multiprocessing.Process argument.
+    """
+    def __init__(self, capacity_bytes: int, ctx=None):
+        if capacity_bytes <= 0:
+            raise ValueError("Queue capacity must be positive")
+
+        ctx = ctx or multiprocessing.get_context()
+        self._size = _aligned(capacity_bytes)
+        self._shm = shared_memory.SharedMemory(create=True, size=_STATE.size + self._size)
+        _STATE.pack_into(self._shm.buf, 0, 0, 0, 0, 0)
+
+        self._lock = ctx.Lock()
+        self._not_full = ctx.Condition(self._lock)
+        self._not_empty = ctx.Condition(self._lock)
+        self._attach()
+
+    def _attach(self) -> None:
+        self._data = self._shm.buf[_STATE.size:]
+
+    def __getstate__(self):
+        # Only the segment name travels; the child re-attaches to the same memory.
+        return {
+            "name": self._shm.name,
+            "size": self._size,
+            "lock": self._lock,
+            "not_full": self._not_full,
+            "not_empty": self._not_empty,
+        }
+
+    def __setstate__(self, state):
+        self._size = state["size"]
+        self._shm = shared_memory.SharedMemory(name=state["name"])
+        self._lock = state["lock"]
+        self._not_full = state["not_full"]
+        self._not_empty = state["not_empty"]
+        self._attach()
+
+    @property
+    def capacity(self) -> int:
+        return self._size
+
+    @property
+    def closed(self) -> bool:
+        with self._lock:
+            return bool(_STATE.unpack_from(self._shm.buf, 0)[3])
+
+    def __len__(self) -> int:
+        # Number of records that have been put but not yet taken
+        with self._lock:
+            _, read, tail, _ = _STATE.unpack_from(self._shm.buf, 0)
+            count = 0
+            while read < tail:
+                pos = read % self._size
+                length, flags = _RECORD.unpack_from(self._data, pos)
+                if flags & _WRAP:
+                    read += self._size - pos
+                    continue
+                read += _RECORD.size + _aligned(length)
+                count += 1
+            return count
+
+    def put(self, payload: bytes) -> None:
+
+        # Copies the payload into the ring buffer. Blocks while there is no room.
+        self._write(payload, None)
+
+    def offer(self, payload: bytes, timeout: float = 0.0) -> bool:
+
+        # Like put(), but returns False if no room appears within `timeout` seconds.
+        return self._write(payload, timeout)
+
+    def take(self) -> bytes:
+
+        # Removes a record and returns a copy of its payload. Blocks while empty.
+        # Claim, copy and release happen under a single lock acquisition.
+        with self._lock:
+            return self._copy_out(self._claim(None))
+
+    def poll(self, timeout: float = 0.0) -> Optional[bytes]:
+
+        # Like take(), but returns None on timeout or once closed and drained.
+        with self._lock:
+            try:
+                claimed = self._claim(timeout)
+            except QueueClosed:
+                return None
+            if claimed is None:
+                return None
+            return self._copy_out(claimed)
+
+    @contextmanager
+    def take_view(self) -> Iterator[memoryview]:
+
+        # Zero-copy take: yields a read-only view straight into shared memory.
+        # The record's space is handed back to producers when the block exits.
+        with self._lock:
+            start, pos, length = self._claim(None)
+        raw = self._data[pos + _RECORD.size:pos + _RECORD.size + length]
+        view = raw.toreadonly()
+        try:
+            yield view
+        finally:
+            # Views must not outlive the mapping, so release them eagerly
+            view.release()
+            raw.release()
+            with self._lock:
+                self._release(start)
+
+    def close(self) -> None:
+
+        # Rejects further puts and wakes every waiting producer and consumer.
+        with self._lock:
+            head, read, tail, closed = _STATE.unpack_from(self._shm.buf, 0)
+            if closed:
+                return
+            _STATE.pack_into(self._shm.buf, 0, head, read, tail, 1)
+            self._not_full.notify_all()
+            self._not_empty.notify_all()
+
+    def detach(self) -> None:
+        # Unmaps the segment from this process. The queue is unusable afterwards.
+        self._data.release()
+        self._shm.close()
+
+    def unlink(self) -> None:
+        # Owner only: detaches and destroys the shared-memory segment.
+        self.detach()
+        self._shm.unlink()
+
+    # Internal helpers. _claim, _release and _copy_out must be called with self._lock held.
+
+    def _write(self, payload: bytes, timeout: Optional[float]) -> bool:
+        length = len(payload)
+        needed = _RECORD.size + _aligned(length)
+        if needed > self._size:
+            raise ValueError(f"Payload of {length} bytes does not fit in a {self._size}-byte queue")
+
+        deadline = None
+        with self._lock:
+            while True:
+                head, read, tail, closed = _STATE.unpack_from(self._shm.buf, 0)
+                if closed:
+                    raise QueueClosed("Cannot put into a closed queue")
+
+                # An empty buffer restarts at offset 0, so any record up to the
+                # full capacity fits without padding.
+                if head == tail and tail % self._size:
+                    tail += self._size - tail % self._size
+                    head = read = tail
+
+                # Records never straddle the end of the buffer, so a record that
+                # does not fit before the end is preceded by a padding record.
+                pos = tail % self._size
+                contiguous = self._size - pos
+                padding = contiguous if contiguous < needed else 0
+                if self._size - (tail - head) >= padding + needed:
+                    break
+
+                logger.debug("Shared queue full. Producer waiting...")
+                if timeout is None:
+                    self._not_full.wait()
+                    continue
+                if deadline is None:
+                    deadline = time.monotonic() + timeout
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._not_full.wait(remaining)
+
+            if padding:
+                _RECORD.pack_into(self._data, pos, 0, _WRAP)
+                tail += padding
+                pos = 0
+
+            _RECORD.pack_into(self._data, pos, length, 0)
+            self._data[pos + _RECORD.size:pos + _RECORD.size + length] = payload
+            tail += needed
+            _STATE.pack_into(self._shm.buf, 0, head, read, tail, closed)
+
+            self._not_empty.notify()
+            return True
+
+    def _claim(self, timeout: Optional[float]) -> Optional[Tuple[int, int, int]]:
+        # Hands the next record to the caller: (logical start, buffer offset, length).
+        deadline = None
+        while True:
+            head, read, tail, closed = _STATE.unpack_from(self._shm.buf, 0)
+            if read < tail:
+                break
+            if closed:
+                raise QueueClosed("Queue is closed and drained")
+
+            logger.debug("Shared queue empty. Consumer waiting...")
+            if timeout is None:
+                self._not_empty.wait()
+                continue
+            if deadline is None:
+                deadline = time.monotonic() + timeout
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            self._not_empty.wait(remaining)
+
+        pos = read % self._size
+        length, flags = _RECORD.unpack_from(self._data, pos)
+        if flags & _WRAP:
+            # A writer only pads when a real record follows at offset 0
+            read += self._size - pos
+            pos = 0
+            length, flags = _RECORD.unpack_from(self._data, pos)
+
+        start = read
+        read += _RECORD.size + _aligned(length)
+        _STATE.pack_into(self._shm.buf, 0, head, read, tail, closed)
+        return start, pos, length
+
+    def _release(self, start: int) -> None:
+        # Marks a claimed record as done and reclaims every leading released record.
+        pos = start % self._size
+        length, flags = _RECORD.unpack_from(self._data, pos)
+        _RECORD.pack_into(self._data, pos, length, flags | _RELEASED)
+
+        head, read, tail, closed = _STATE.unpack_from(self._shm.buf, 0)
+        reclaimed = head
+        while head < read:
+            pos = head % self._size
+            length, flags = _RECORD.unpack_from(self._data, pos)
+            if flags & _WRAP:
+                head += self._size - pos
+            elif flags & _RELEASED:
+                head += _RECORD.size + _aligned(length)
+            else:
+                break
+
+        if head != reclaimed:
+            _STATE.pack_into(self._shm.buf, 0, head, read, tail, closed)
+            # Freed space may fit several waiting producers of different sizes
+            self._not_full.notify_all()
+
+    def _copy_out(self, claimed: Tuple[int, int, int]) -> bytes:
+        start, pos, length = claimed
+        payload = bytes(self._data[pos + _RECORD.size:pos + _RECORD.size + length])
+        self._release(start)
+        return payload
@@ -0,0 +1,230 @@
+import threading
+import time
+import logging
+from typing import Dict, Iterable, List, Optional
+from .blocking_queue import QueueClosed
+from .data_item import DataItem
+from .metrics import QueueMetrics
+
+logger = logging.getLogger(__name__)
+
+
+class SPSCQueue:
+    """
+    Bounded queue for exactly one producer thread and one consumer thread.
+
+    The slot array is indexed by two monotonic counters: `_tail` is only
+    written by the producer and `_head` only by the consumer, so the fast path
+    (queue neither full nor empty) takes no lock at all; each side publishes its
+    counter after touching the slot, which the GIL makes visible in order.
+    The lock and conditions are only used when a side has to sleep: a side
+    flags itself as waiting and re-checks under the lock, and the other side
+    only takes the lock to notify when it sees that flag.
+
+    Metrics use the QueueMetrics recorder of BlockingQueue without its lock:
+    each side only writes its own fields (producer: high_water, put_latency,
+    producer_blocked; consumer: take_latency, consumer_blocked), and only
+    sampled operations read the clock. enqueued/dequeued are the counters.
+
+    Same API as BlockingQueue, so Producer and Consumer work unchanged. Using
+    it from more than one producer or consumer thread corrupts the queue;
+    use create_queue() to pick the right implementation.
+    """
+    def __init__(self, capacity: int, collect_metrics: bool = True):
+        if capacity <= 0:
+            raise ValueError("Queue capacity must be positive")
+
+        self._slots: List[Optional[DataItem]] = [None] * capacity
+        self._capacity = capacity
+        self._head = 0   # items taken so far (consumer-owned)
+        self._tail = 0   # items put so far (producer-owned)
+        self._closed = False
+
+        # Slow path only
+        self._lock = threading.Lock()
+        self._not_full = threading.Condition(self._lock)
+        self._not_empty = threading.Condition(self._lock)
+        self._producer_waiting = False
+        self._consumer_waiting = False
+
+        self._metrics: Optional[QueueMetrics] = QueueMetrics() if collect_metrics else None
+        self._sample_mask = self._metrics.sample_every - 1 if self._metrics is not None else 0
+
+    def __len__(self) -> int:
+        return self._tail - self._head
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def metrics_snapshot(self) -> Optional[Dict[str, object]]:
+        # Same keys as BlockingQueue.metrics_snapshot, or None if collection is disabled.
+        metrics = self._metrics
+        if metrics is None:
+            return None
+        head, tail = self._head, self._tail
+        # The counters double as enqueued/dequeued totals
+        metrics.enqueued, metrics.dequeued = tail, head
+        return metrics.snapshot(tail - head, self._capacity)
+
+    def put(self, item: DataItem) -> None:
+
+        # Inserts an item. Lock-free unless the queue is full.
+        self._put(item, None)
+
+    def offer(self, item: DataItem, timeout: float = 0.0) -> bool:
+        return self._put(item, timeout)
+
+    def take(self) -> DataItem:
+
+        # Removes an item. Lock-free unless the queue is empty.
+        head = self._head
+        start = self._sample_start(head)
+        if self._tail == head:
+            self._await_item(None)
+        return self._pop(head, start)
+
+    def poll(self, timeout: float = 0.0) -> Optional[DataItem]:
+        head = self._head
+        start = self._sample_start(head)
+        if self._tail == head:
+            try:
+                if not self._await_item(timeout):
+                    return None
+            except QueueClosed:
+                return None
+        return self._pop(head, start)
+
+    def put_many(self, items: Iterable[DataItem]) -> None:
+        for item in items:
+            self._put(item, None)
+
+    def take_many(self, max_items: int, timeout: Optional[float] = None) -> List[DataItem]:
+
+        # Takes everything available (up to max_items) once at least one item is there.
+        if max_items <= 0:
+            raise ValueError("max_items must be positive")
+        head = self._head
+        start = self._sample_start(head)
+        if self._tail == head and not self._await_item(timeout):
+            return []
+        available = min(self._tail - head, max_items)
+        items = []
+        for offset in range(available):
+            index = (head + offset) % self._capacity
+            items.append(self._slots[index])
+            self._slots[index] = None
+        self._head = head + available
+        if start is not None:
+            self._metrics.take_latency.record(time.perf_counter() - start)
+        self._wake_producer()
+        return items
+
+    def close(self) -> None:
+
+        # Rejects further puts and wakes whichever side is sleeping.
+        with self._lock:
+            self._closed = True
+            self._not_full.notify_all()
+            self._not_empty.notify_all()
+
+    # Internal helpers
+
+    def _sample_start(self, counter: int) -> Optional[float]:
+        # Start time if this operation's latency is sampled (one in sample_every)
+        if self._metrics is not None and not counter & self._sample_mask:
+            return time.perf_counter()
+        return None
+
+    def _put(self, item: DataItem, timeout: Optional[float]) -> bool:
+        if self._closed:
+            raise QueueClosed("Cannot put into a closed queue")
+        tail = self._tail
+        start = self._sample_start(tail)
+        if tail - self._head == self._capacity and not self._await_slot(timeout):
+            return False
+        self._slots[tail % self._capacity] = item
+        # Publish only after the slot is written
+        self._tail = tail + 1
+        metrics = self._metrics
+        if metrics is not None:
+            depth = tail + 1 - self._head
+            if depth > metrics.high_water:
+                metrics.high_water = depth
+            if start is not None:
+                metrics.put_latency.record(time.perf_counter() - start)
+        if self._consumer_waiting:
+            with self._lock:
+                self._not_empty.notify()
+        return True
+
+    def _pop(self, head: int, start: Optional[float]) -> DataItem:
+        index = head % self._capacity
+        item = self._slots[index]
+        self._slots[index] = None
+        # Publish only after the slot is read
+        self._head = head + 1
+        if start is not None:
+            self._metrics.take_latency.record(time.perf_counter() - start)
+        self._wake_producer()
+        return item
+
+    def _wake_producer(self) -> None:
+        if self._producer_waiting:
+            with self._lock:
+                self._not_full.notify()
+
+    def _await_slot(self, timeout: Optional[float]) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        blocked_at = time.perf_counter()
+        with self._lock:
+            # Raise the flag first, then re-check: a consumer that frees a slot
+            # after this point sees the flag and notifies under the lock.
+            self._producer_waiting = True
+            try:
+                while self._tail - self._head == self._capacity and not self._closed:
+                    logger.debug("Queue full. Producer waiting...")
+                    if deadline is None:
+                        self._not_full.wait()
+                        continue
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    self._not_full.wait(remaining)
+            finally:
+                self._producer_waiting = False
+                if self._metrics is not None:
+                    self._metrics.producer_blocked += time.perf_counter() - blocked_at
+
+            if self._closed:
+                raise QueueClosed("Cannot put into a closed queue")
+            return True
+
+    def _await_item(self, timeout: Optional[float]) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        blocked_at = time.perf_counter()
+        with self._lock:
+            self._consumer_waiting = True
+            try:
+                while self._tail == self._head and not self._closed:
+                    logger.debug("Queue empty. Consumer waiting...")
+                    if deadline is None:
+                        self._not_empty.wait()
+                        continue
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    self._not_empty.wait(remaining)
+            finally:
+                self._consumer_waiting = False
+                if self._metrics is not None:
+                    self._metrics.consumer_blocked += time.perf_counter() - blocked_at
+
+            # A closed queue still hands out its remaining items
+            if self._tail == self._head:
+                raise QueueClosed("Queue is closed and drained")
+            return True
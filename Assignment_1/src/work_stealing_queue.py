@@ -0,0 +1,310 @@
+import collections
+import itertools
+import threading
+import time
+import logging
+from typing import Deque, Dict, Iterable, List, Optional
+from .blocking_queue import QueueClosed
+from .data_item import DataItem
+from .metrics import LatencyHistogram, QueueMetrics
+
+logger = logging.getLogger(__name__)
+
+
+class _Shard:
+    __slots__ = ("items", "capacity", "lock", "stolen", "steals", "metrics")
+
+    def __init__(self, capacity: int, collect_metrics: bool):
+        self.items: Deque[DataItem] = collections.deque()
+        self.capacity = capacity
+        self.lock = threading.Lock()
+        self.stolen = 0   # items other consumers took from this shard
+        self.steals = 0   # times another consumer stole from this shard
+        # Puts/takes of this shard, recorded under its lock
+        self.metrics: Optional[QueueMetrics] = QueueMetrics() if collect_metrics else None
+
+
+class WorkStealingQueue:
+    """
+    Bounded queue split into per-consumer shards with work stealing.
+
+    Puts are spread round-robin over the shards. Each consumer thread is
+    bound to a home shard on its first take and serves it in FIFO order;
+    when the home shard is empty it steals from the tail of the others
+    (half of the victim's items for take_many), so a consumer stuck on
+    expensive items does not hold back the items queued behind it.
+
+    Every shard has its own lock, so producers and consumers touching
+    different shards never contend. A global lock and conditions are only
+    used to sleep and wake (same waiting-flag scheme as SPSCQueue).
+    Poison Pills are kept aside and only handed out once every shard is
+    empty. Same API as BlockingQueue, so Producer and Consumer work unchanged.
+
+    Metrics are kept per shard under the shard lock and merged by
+    metrics_snapshot(), which has BlockingQueue's keys plus the shard depths
+    and steal counts. There is no lock over the total depth, so high_water is
+    the highest total depth seen at sampled puts and snapshots.
+    """
+    def __init__(self, capacity: int, shards: int, steal: bool = True, collect_metrics: bool = True):
+        if capacity <= 0:
+            raise ValueError("Queue capacity must be positive")
+        if not 0 < shards <= capacity:
+            raise ValueError("shards must be between 1 and capacity")
+
+        # Split the capacity as evenly as possible
+        base, extra = divmod(capacity, shards)
+        self._shards: List[_Shard] = [_Shard(base + (i < extra), collect_metrics) for i in range(shards)]
+        self._capacity = capacity
+        # With steal=False consumers only serve their home shard (plain sharding)
+        self._steal = steal
+        self._pills: Deque[DataItem] = collections.deque()
+        self._closed = False
+
+        # itertools.count() is advanced atomically, so no lock is needed to spread puts
+        self._next_shard = itertools.count()
+        self._next_home = itertools.count()
+        self._home = threading.local()
+
+        # Slow path only
+        self._lock = threading.Lock()
+        self._not_full = threading.Condition(self._lock)
+        self._not_empty = threading.Condition(self._lock)
+        self._producers_waiting = 0
+        self._consumers_waiting = 0
+
+        # Queue-wide part of the metrics: start time, blocked time (under
+        # self._lock) and the sampled high-water mark
+        self._metrics: Optional[QueueMetrics] = QueueMetrics() if collect_metrics else None
+
+    def __len__(self) -> int:
+        return sum(len(shard.items) for shard in self._shards) + len(self._pills)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def metrics_snapshot(self) -> Optional[Dict[str, object]]:
+        # BlockingQueue's snapshot keys with the shards merged, plus per-shard
+        # depths and steal counts; None if collection is disabled.
+        metrics = self._metrics
+        if metrics is None:
+            return None
+        put_latency, take_latency = LatencyHistogram(), LatencyHistogram()
+        enqueued = dequeued = 0
+        for shard in self._shards:
+            with shard.lock:
+                enqueued += shard.metrics.enqueued
+                dequeued += shard.metrics.dequeued
+                put_latency.merge(shard.metrics.put_latency)
+                take_latency.merge(shard.metrics.take_latency)
+        depth = self._observe_depth()
+        snapshot = metrics.snapshot(depth, self._capacity)
+        elapsed = time.perf_counter() - metrics.started
+        snapshot.update({
+            "enqueued": enqueued,
+            "dequeued": dequeued,
+            "items_per_sec": dequeued / elapsed if elapsed > 0 else 0.0,
+            "put_latency": put_latency.snapshot(),
+            "take_latency": take_latency.snapshot(),
+            "shard_depths": [len(shard.items) for shard in self._shards],
+            "stolen": sum(shard.stolen for shard in self._shards),
+            "steals": sum(shard.steals for shard in self._shards),
+        })
+        return snapshot
+
+    def put(self, item: DataItem) -> None:
+        self._put(item, None)
+
+    def offer(self, item: DataItem, timeout: float = 0.0) -> bool:
+        return self._put(item, timeout)
+
+    def put_many(self, items: Iterable[DataItem]) -> None:
+        for item in items:
+            self._put(item, None)
+
+    def take(self) -> DataItem:
+        return self._take(1, None)[0]
+
+    def poll(self, timeout: float = 0.0) -> Optional[DataItem]:
+        try:
+            items = self._take(1, timeout)
+        except QueueClosed:
+            return None
+        return items[0] if items else None
+
+    def take_many(self, max_items: int, timeout: Optional[float] = None) -> List[DataItem]:
+        if max_items <= 0:
+            raise ValueError("max_items must be positive")
+        return self._take(max_items, timeout)
+
+    def close(self) -> None:
+
+        # Rejects further puts and wakes every waiter.
+        with self._lock:
+            self._closed = True
+            self._not_full.notify_all()
+            self._not_empty.notify_all()
+
+    # Internal helpers
+
+    def _put(self, item: DataItem, timeout: Optional[float]) -> bool:
+        if self._closed:
+            raise QueueClosed("Cannot put into a closed queue")
+        start = time.perf_counter()
+        if item.is_poison_pill():
+            # Pills do not take a slot; they are served after all regular items.
+            # Their metrics go to the first shard.
+            self._pills.append(item)
+            self._record_put(self._shards[0], start)
+        elif not self._try_store(item, start):
+            deadline = None if timeout is None else time.monotonic() + timeout
+            blocked_at = time.perf_counter()
+            with self._lock:
+                self._producers_waiting += 1
+                try:
+                    # Re-check after raising the flag: a consumer that frees a
+                    # slot from now on sees it and notifies under the lock.
+                    while not self._try_store(item, start):
+                        if self._closed:
+                            raise QueueClosed("Cannot put into a closed queue")
+                        logger.debug("Queue full. Producer waiting...")
+                        if deadline is None:
+                            self._not_full.wait()
+                            continue
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            return False
+                        self._not_full.wait(remaining)
+                finally:
+                    self._producers_waiting -= 1
+                    if self._metrics is not None:
+                        self._metrics.producer_blocked += time.perf_counter() - blocked_at
+        if self._consumers_waiting:
+            with self._lock:
+                if self._steal:
+                    self._not_empty.notify()
+                else:
+                    # Only the home consumer of that shard can use the item
+                    self._not_empty.notify_all()
+        return True
+
+    def _try_store(self, item: DataItem, start: float) -> bool:
+        # Round-robin start, falling through to the next shard with a free slot
+        count = len(self._shards)
+        first = next(self._next_shard)
+        for offset in range(count):
+            shard = self._shards[(first + offset) % count]
+            with shard.lock:
+                if len(shard.items) < shard.capacity:
+                    shard.items.append(item)
+                    sampled = (shard.metrics is not None and
+                               shard.metrics.record_put(1, time.perf_counter() - start, len(shard.items)))
+                    break
+        else:
+            return False
+        if sampled:
+            self._observe_depth()
+        return True
+
+    def _record_put(self, shard: _Shard, start: float) -> None:
+        if shard.metrics is not None:
+            with shard.lock:
+                shard.metrics.record_put(1, time.perf_counter() - start, len(shard.items))
+
+    def _observe_depth(self) -> int:
+        # Current total depth, folded into the high-water mark. Producers on
+        # different shards may race here, so the mark is approximate.
+        depth = len(self)
+        if self._metrics is not None and depth > self._metrics.high_water:
+            self._metrics.high_water = depth
+        return depth
+
+    def _take(self, max_items: int, timeout: Optional[float]) -> List[DataItem]:
+        start = time.perf_counter()
+        items = self._try_take(max_items, start)
+        if not items:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            blocked_at = time.perf_counter()
+            with self._lock:
+                self._consumers_waiting += 1
+                try:
+                    while True:
+                        items = self._try_take(max_items, start)
+                        if items:
+                            break
+                        # A closed queue still hands out its remaining items
+                        if self._closed:
+                            raise QueueClosed("Queue is closed and drained")
+                        logger.debug("Queue empty. Consumer waiting...")
+                        if deadline is None:
+                            self._not_empty.wait()
+                            continue
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            return []
+                        self._not_empty.wait(remaining)
+                finally:
+                    self._consumers_waiting -= 1
+                    if self._metrics is not None:
+                        self._metrics.consumer_blocked += time.perf_counter() - blocked_at
+        if self._producers_waiting:
+            with self._lock:
+                self._not_full.notify(len(items))
+        if self._pills and self._consumers_waiting:
+            # Draining the last regular items may have released a waiting pill
+            with self._lock:
+                self._not_empty.notify_all()
+        return items
+
+    def _try_take(self, max_items: int, start: float) -> List[DataItem]:
+        home = self._home_index()
+        shard = self._shards[home]
+        with shard.lock:
+            items = shard.items
+            if items:
+                batch = [items.popleft() for _ in range(min(len(items), max_items))]
+                if shard.metrics is not None:
+                    shard.metrics.record_take(len(batch), time.perf_counter() - start)
+                return batch
+
+        if self._steal:
+            count = len(self._shards)
+            for offset in range(1, count):
+                victim = self._shards[(home + offset) % count]
+                with victim.lock:
+                    items = victim.items
+                    if items:
+                        # Take half of the victim's backlog (at least one) from its tail
+                        stolen = min((len(items) + 1) // 2, max_items)
+                        victim.stolen += stolen
+                        victim.steals += 1
+                        batch = [items.pop() for _ in range(stolen)]
+                        batch.reverse()
+                        if victim.metrics is not None:
+                            victim.metrics.record_take(stolen, time.perf_counter() - start)
+                        return batch
+        elif any(shard.items for shard in self._shards):
+            # Without stealing, a pill must still wait for every other shard
+            return []
+
+        # Every shard is empty: only now may a Poison Pill go out
+        try:
+            pill = self._pills.popleft()
+        except IndexError:
+            return []
+        first = self._shards[0]
+        if first.metrics is not None:
+            with first.lock:
+                first.metrics.record_take(1, time.perf_counter() - start)
+        return [pill]
+
+    def _home_index(self) -> int:
+        try:
+            return self._home.index
+        except AttributeError:
+            self._home.index = next(self._next_home) % len(self._shards)
+            return self._home.index
@@ -0,0 +1,104 @@
+import unittest
+import asyncio
+import threading
+from src.async_blocking_queue import AsyncBlockingQueue
+from src.blocking_queue import QueueClosed
+from src.consumer import Consumer
+from src.data_item import DataItem, POISON_PILL
+from src.producer import Producer
+
+
+class TestAsyncBlockingQueue(unittest.TestCase):
+    def test_async_fifo_and_backpressure(self):
+        """Test that a full queue suspends the producer task until the consumer catches up."""
+        queue = AsyncBlockingQueue(capacity=2)
+
+        async def scenario():
+            async def produce():
+                for i in range(10):
+                    await queue.put(DataItem(i))
+                await queue.put(POISON_PILL)
+
+            task = asyncio.create_task(produce())
+            await asyncio.sleep(0.01)
+            # The producer is parked on the full queue
+            self.assertEqual(len(queue), 2)
+            self.assertFalse(task.done())
+
+            received = [item.payload async for item in queue]
+            await task
+            return received
+
+        self.assertEqual(asyncio.run(scenario()), list(range(10)))
+
+    def test_thread_producer_async_consumer(self):
+        """Test that an unchanged thread Producer feeds an asyncio consumer."""
+        queue = AsyncBlockingQueue(capacity=3)
+        producer = Producer(queue.sync, item_count=20, delay=0)
+
+        async def consume():
+            producer.start()
+            return [item.payload async for item in queue]
+
+        received = asyncio.run(consume())
+        producer.join(timeout=2)
+
+        self.assertEqual(received, list(range(1, 21)))
+        self.assertFalse(producer.is_alive())
+
+    def test_async_producer_thread_consumer(self):
+        """Test that an unchanged thread Consumer drains an asyncio producer."""
+        queue = AsyncBlockingQueue(capacity=3)
+        seen = []
+        consumer = Consumer(queue.sync, handler=seen.append)
+        consumer.start()
+
+        async def produce():
+            for i in range(20):
+                await queue.put(DataItem(i))
+            queue.close()
+
+        asyncio.run(produce())
+        consumer.join(timeout=2)
+
+        self.assertEqual(seen, list(range(20)))
+        self.assertFalse(consumer.is_alive())
+
+    def test_close_wakes_waiting_tasks(self):
+        """Test that close() releases a task blocked on an empty queue."""
+        queue = AsyncBlockingQueue(capacity=1)
+
+        async def scenario():
+            waiter = asyncio.create_task(queue.take())
+            await asyncio.sleep(0.01)
+            threading.Thread(target=queue.close).start()
+            with self.assertRaises(QueueClosed):
+                await asyncio.wait_for(waiter, timeout=2)
+
+        asyncio.run(scenario())
+
+    def test_cancelled_taker_passes_wakeup_on(self):
+        """Test that cancelling a woken task does not strand the item."""
+        queue = AsyncBlockingQueue(capacity=1)
+
+        async def scenario():
+            first = asyncio.create_task(queue.take())
+            second = asyncio.create_task(queue.take())
+            await asyncio.sleep(0.01)
+            await queue.put(DataItem("x"))
+            first.cancel()
+            item = await asyncio.wait_for(second, timeout=2)
+            return item.payload
+
+        self.assertEqual(asyncio.run(scenario()), "x")
+
+    def test_sync_view_timeouts(self):
+        """Test offer/poll on the thread-side view."""
+        queue = AsyncBlockingQueue(capacity=1)
+        self.assertIsNone(queue.sync.poll(timeout=0.01))
+        self.assertTrue(queue.sync.offer(DataItem(1)))
+        self.assertFalse(queue.sync.offer(DataItem(2), timeout=0.01))
+        self.assertEqual(queue.sync.poll().payload, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from benchmarks.regression import add_baseline_arguments, check_baseline, compare, load_json, make_report
+
+
+class TestCompare(unittest.TestCase):
+    def compare(self, results, baseline, tolerance=0.3):
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            regressions = compare(results, baseline, tolerance, "items/s")
+        return regressions, out.getvalue()
+
+    def test_flags_only_cases_beyond_tolerance(self):
+        """Test that only a slowdown larger than the tolerance is a regression."""
+        regressions, out = self.compare({"a": 60.0, "b": 80.0, "c": 200.0},
+                                        {"a": 100.0, "b": 100.0, "c": 100.0})
+        self.assertEqual(regressions, ["a"])
+        self.assertIn("0.60x  REGRESSION", out)
+        self.assertIn("2.00x", out)
+
+    def test_new_cases_are_not_regressions(self):
+        """Test that a case missing from the baseline is reported as new."""
+        regressions, out = self.compare({"a": 1.0}, {})
+        self.assertEqual(regressions, [])
+        self.assertIn("new", out)
+
+
+class TestCheckBaseline(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.baseline = os.path.join(self.directory, "baseline.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def check(self, results, measure, save=False):
+        parser = argparse.ArgumentParser()
+        add_baseline_arguments(parser, self.baseline)
+        args = parser.parse_args(["--save-baseline"] if save else [])
+        report = make_report("test", "items/s", {}, dict(results))
+        with contextlib.redirect_stdout(io.StringIO()):
+            check_baseline(report, args, measure)
+        return report
+
+    def test_saved_baseline_round_trips(self):
+        """Test that a saved report is loaded back with the same results."""
+        self.check({"a": 100.0}, measure=None, save=True)
+        self.assertEqual(load_json(self.baseline)["results"], {"a": 100.0})
+
+    def test_suspect_case_is_measured_again(self):
+        """Test that a slow case is re-measured and only fails if it stays slow."""
+        self.check({"a": 100.0, "b": 100.0}, measure=None, save=True)
+        remeasured = []
+
+        def measure(name):
+            remeasured.append(name)
+            return 95.0
+        report = self.check({"a": 50.0, "b": 90.0}, measure)
+        self.assertEqual(remeasured, ["a"])
+        self.assertEqual(report["results"]["a"], 95.0)
+
+        with self.assertRaises(SystemExit) as raised:
+            self.check({"a": 50.0}, lambda name: 40.0)
+        self.assertEqual(raised.exception.code, 1)
@@ -1,8 +1,8 @@
 import unittest
 import threading
 import time
-from src.blocking_queue import BlockingQueue
-from src.data_item import DataItem
+from src.blocking_queue import BlockingQueue, QueueClosed
+from src.data_item import DataItem, POISON_PILL
 
 class TestBlockingQueue(unittest.TestCase):
     def setUp(self):
@@ -63,5 +63,166 @@ class TestBlockingQueue(unittest.TestCase):
         self.assertEqual(self.queue.take().payload, 3)
         self.assertGreaterEqual(end_time - start_time, 0.1)
 
+    def test_wraparound_preserves_fifo(self):
+        """Test that FIFO order holds after the ring buffer indices wrap around."""
+        for i in range(10):
+            self.queue.put(DataItem(i))
+            self.assertEqual(self.queue.take().payload, i)
+        self.assertEqual(len(self.queue), 0)
+
+    def test_len_tracks_contents(self):
+        """Test that len() reflects the number of queued items."""
+        self.queue.put(DataItem(1))
+        self.assertEqual(len(self.queue), 1)
+        self.queue.put(DataItem(2))
+        self.assertEqual(len(self.queue), 2)
+        self.queue.take()
+        self.assertEqual(len(self.queue), 1)
+
+    def test_invalid_capacity(self):
+        """Test that a non-positive capacity is rejected."""
+        with self.assertRaises(ValueError):
+            BlockingQueue(capacity=0)
+
+    def test_many_producers_and_consumers(self):
+        """Test that every item is delivered exactly once under contention."""
+        per_producer = 200
+        received = []
+        lock = threading.Lock()
+
+        def produce(base):
+            for i in range(per_producer):
+                self.queue.put(DataItem(base + i))
+
+        def consume():
+            while True:
+                item = self.queue.take()
+                if item.is_poison_pill():
+                    break
+                with lock:
+                    received.append(item.payload)
+
+        producers = [threading.Thread(target=produce, args=(n * per_producer,)) for n in range(4)]
+        consumers = [threading.Thread(target=consume) for _ in range(4)]
+        for t in producers + consumers:
+            t.start()
+        for t in producers:
+            t.join(timeout=5)
+        for _ in consumers:
+            self.queue.put(POISON_PILL)
+        for t in consumers:
+            t.join(timeout=5)
+
+        self.assertEqual(sorted(received), list(range(4 * per_producer)))
+
+    def test_put_many_take_many_fifo(self):
+        """Test that batches larger than the capacity flow through in order."""
+        received = []
+
+        def drain():
+            while len(received) < 5:
+                received.extend(item.payload for item in self.queue.take_many(10))
+
+        t = threading.Thread(target=drain)
+        t.start()
+        self.queue.put_many([DataItem(i) for i in range(5)])
+        t.join(timeout=2)
+
+        self.assertFalse(t.is_alive())
+        self.assertEqual(received, [0, 1, 2, 3, 4])
+
+    def test_take_many_returns_available_items(self):
+        """Test that take_many() does not wait to fill the whole batch."""
+        self.queue.put(DataItem(1))
+        items = self.queue.take_many(5)
+        self.assertEqual([i.payload for i in items], [1])
+
+    def test_take_many_timeout(self):
+        """Test that take_many() returns an empty list when the timeout expires."""
+        start_time = time.time()
+        self.assertEqual(self.queue.take_many(5, timeout=0.1), [])
+        self.assertGreaterEqual(time.time() - start_time, 0.1)
+
+    def test_take_many_invalid_size(self):
+        """Test that a non-positive batch size is rejected."""
+        with self.assertRaises(ValueError):
+            self.queue.take_many(0)
+
+    def test_offer_times_out_when_full(self):
+        """Test that offer() gives up after the timeout instead of blocking."""
+        self.assertTrue(self.queue.offer(DataItem(1)))
+        self.assertTrue(self.queue.offer(DataItem(2)))
+
+        start_time = time.time()
+        self.assertFalse(self.queue.offer(DataItem(3), timeout=0.1))
+        self.assertGreaterEqual(time.time() - start_time, 0.1)
+        self.assertEqual(len(self.queue), 2)
+
+    def test_poll_times_out_when_empty(self):
+        """Test that poll() returns None after the timeout when nothing arrives."""
+        self.assertIsNone(self.queue.poll())
+        start_time = time.time()
+        self.assertIsNone(self.queue.poll(timeout=0.1))
+        self.assertGreaterEqual(time.time() - start_time, 0.1)
+
+        self.queue.put(DataItem(7))
+        self.assertEqual(self.queue.poll(timeout=0.1).payload, 7)
+
+    def test_close_wakes_all_waiting_consumers(self):
+        """Test that a single close() releases every blocked take()."""
+        results = []
+
+        def blocked_take():
+            try:
+                self.queue.take()
+            except QueueClosed:
+                results.append("closed")
+
+        threads = [threading.Thread(target=blocked_take) for _ in range(8)]
+        for t in threads:
+            t.start()
+        time.sleep(0.05)
+        self.queue.close()
+        for t in threads:
+            t.join(timeout=2)
+
+        self.assertFalse(any(t.is_alive() for t in threads))
+        self.assertEqual(results, ["closed"] * 8)
+
+    def test_close_drains_remaining_items(self):
+        """Test that items queued before close() are still delivered."""
+        self.queue.put(DataItem(1))
+        self.queue.put(DataItem(2))
+        self.queue.close()
+
+        self.assertTrue(self.queue.closed)
+        self.assertEqual(self.queue.take().payload, 1)
+        self.assertEqual([i.payload for i in self.queue.take_many(5)], [2])
+        with self.assertRaises(QueueClosed):
+            self.queue.take()
+        self.assertIsNone(self.queue.poll())
+
+    def test_close_rejects_puts_and_wakes_producers(self):
+        """Test that blocked and future puts fail with QueueClosed."""
+        self.queue.put(DataItem(1))
+        self.queue.put(DataItem(2))
+        errors = []
+
+        def blocked_put():
+            try:
+                self.queue.put(DataItem(3))
+            except QueueClosed:
+                errors.append("closed")
+
+        t = threading.Thread(target=blocked_put)
+        t.start()
+        time.sleep(0.05)
+        self.queue.close()
+        t.join(timeout=2)
+
+        self.assertEqual(errors, ["closed"])
+        with self.assertRaises(QueueClosed):
+            self.queue.offer(DataItem(4))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -2,7 +2,7 @@ import unittest
 import threading
 from src.consumer import Consumer
 from src.blocking_queue import BlockingQueue
-from src.data_item import DataItem
+from src.data_item import DataItem, POISON_PILL
 
 class TestConsumer(unittest.TestCase):
     def test_consumer_shutdown(self):
@@ -14,7 +14,7 @@ class TestConsumer(unittest.TestCase):
         # Pre-fill queue: 2 valid items + 1 Poison Pill
         queue.put(DataItem(10))
         queue.put(DataItem(20))
-        queue.put(DataItem(None)) # Poison Pill
+        queue.put(POISON_PILL) # Poison Pill
         
         # Initialize Consumer with 0 delay
         consumer = Consumer(queue, processing_time=0)
@@ -35,5 +35,55 @@ class TestConsumer(unittest.TestCase):
         # Since queue is FIFO, it must have consumed 10 and 20 first.
         pass
 
+    def test_batched_consumer_leaves_other_pills(self):
+        """
+        Verify a batched consumer stops at its pill and hands back items taken after it.
+        """
+        queue = BlockingQueue(capacity=10)
+        queue.put_many([DataItem(10), POISON_PILL, POISON_PILL])
+
+        consumer = Consumer(queue, processing_time=0, batch_size=5)
+        consumer.start()
+        consumer.join(timeout=2.0)
+
+        self.assertFalse(consumer.is_alive(), "Consumer failed to shut down")
+        # The second pill is still there for another consumer
+        self.assertEqual(len(queue), 1)
+        self.assertTrue(queue.take().is_poison_pill())
+
+    def test_items_after_pill_are_handled_in_order(self):
+        """
+        Verify items taken after the pill are handled before stopping, not re-queued.
+        """
+        queue = BlockingQueue(capacity=10)
+        queue.put_many([DataItem(1), POISON_PILL, DataItem(2), DataItem(3)])
+        handled = []
+
+        consumer = Consumer(queue, batch_size=5, handler=handled.append)
+        consumer.start()
+        consumer.join(timeout=2.0)
+
+        self.assertFalse(consumer.is_alive(), "Consumer failed to shut down")
+        self.assertEqual(handled, [1, 2, 3])
+        self.assertEqual(len(queue), 0)
+
+    def test_extra_pill_does_not_block_on_full_queue(self):
+        """
+        Verify a consumer holding another consumer's pill exits even if the queue refilled.
+        """
+        queue = BlockingQueue(capacity=3)
+        queue.put_many([POISON_PILL, DataItem(0), POISON_PILL])
+
+        def refill(payload):
+            # A producer fills the freed slots before the pill can go back
+            queue.put_many([DataItem(i) for i in range(3)])
+
+        consumer = Consumer(queue, batch_size=3, handler=refill)
+        with self.assertLogs("src.consumer", level="WARNING"):
+            consumer.start()
+            consumer.join(timeout=2.0)
+        self.assertFalse(consumer.is_alive(), "Consumer blocked handing back a pill")
+        self.assertEqual(len(queue), 3)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
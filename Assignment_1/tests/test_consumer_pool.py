@@ -0,0 +1,80 @@
+import unittest
+import threading
+from src.blocking_queue import BlockingQueue
+from src.consumer import Consumer
+from src.consumer_pool import ConsumerPool
+from src.data_item import DataItem, POISON_PILL
+
+
+def square(x):
+    # Module-level so the process backend can pickle it
+    return x * x
+
+
+class TestConsumerPool(unittest.TestCase):
+    def test_consumer_uses_handler(self):
+        """Test that a Consumer passes each payload to the supplied handler."""
+        queue = BlockingQueue(capacity=10)
+        seen = []
+        queue.put_many([DataItem(1), DataItem(2), POISON_PILL])
+
+        consumer = Consumer(queue, handler=seen.append)
+        consumer.start()
+        consumer.join(timeout=2)
+
+        self.assertEqual(seen, [1, 2])
+        self.assertEqual(consumer.processed, 2)
+
+    def test_thread_backend_processes_every_item(self):
+        """Test that N thread workers share the queue and handle every item once."""
+        queue = BlockingQueue(capacity=8)
+        seen = []
+        lock = threading.Lock()
+
+        def handler(payload):
+            with lock:
+                seen.append(payload)
+
+        pool = ConsumerPool(queue, handler, workers=4)
+        pool.start()
+        queue.put_many(DataItem(i) for i in range(100))
+        queue.close()
+        pool.join(timeout=5)
+
+        self.assertFalse(pool.is_alive(), "ConsumerPool failed to shut down")
+        self.assertEqual(sorted(seen), list(range(100)))
+        self.assertEqual(pool.processed, 100)
+
+    def test_thread_backend_stops_on_pills(self):
+        """Test that one Poison Pill per worker also shuts the pool down."""
+        queue = BlockingQueue(capacity=8)
+        pool = ConsumerPool(queue, lambda payload: None, workers=3, batch_size=4)
+        pool.start()
+        queue.put_many([DataItem(1), DataItem(2)] + [POISON_PILL] * 3)
+        pool.join(timeout=5)
+
+        self.assertFalse(pool.is_alive(), "ConsumerPool failed to shut down")
+        self.assertEqual(pool.processed, 2)
+
+    def test_process_backend_processes_every_item(self):
+        """Test that the multiprocessing backend handles every item."""
+        queue = BlockingQueue(capacity=16)
+        pool = ConsumerPool(queue, square, workers=2, backend="process", batch_size=8)
+        pool.start()
+        queue.put_many(DataItem(i) for i in range(50))
+        queue.close()
+        pool.join(timeout=10)
+
+        self.assertFalse(pool.is_alive(), "ConsumerPool failed to shut down")
+        self.assertEqual(pool.processed, 50)
+
+    def test_invalid_configuration(self):
+        """Test that bad worker counts and backends are rejected."""
+        queue = BlockingQueue(capacity=1)
+        with self.assertRaises(ValueError):
+            ConsumerPool(queue, square, workers=0)
+        with self.assertRaises(ValueError):
+            ConsumerPool(queue, square, backend="fiber")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
-from src.data_item import DataItem
+import pickle
+from src.data_item import DataItem, DataItemPool, POISON_PILL
 
 class TestDataItem(unittest.TestCase):
     def test_initialization(self):
@@ -9,14 +10,57 @@ class TestDataItem(unittest.TestCase):
         self.assertEqual(str(item), "DataItem(payload=123)")
 
     def test_poison_pill_check_true(self):
-        """Test that a None payload is correctly identified as a poison pill."""
-        item = DataItem(None)
+        """Test that the POISON_PILL sentinel is identified as a poison pill."""
+        item = POISON_PILL
         self.assertTrue(item.is_poison_pill())
+        self.assertEqual(repr(item), "POISON_PILL")
+
+    def test_none_payload_is_not_a_pill(self):
+        """Test that None is a legitimate payload."""
+        item = DataItem(None)
+        self.assertFalse(item.is_poison_pill())
+        self.assertIsNone(item.payload)
 
     def test_poison_pill_check_false(self):
         """Test that a valid payload is NOT identified as a poison pill."""
         item = DataItem("Valid Data")
         self.assertFalse(item.is_poison_pill())
 
+    def test_slots(self):
+        """Test that DataItem has no per-instance __dict__."""
+        item = DataItem(1)
+        self.assertFalse(hasattr(item, "__dict__"))
+        with self.assertRaises(AttributeError):
+            item.extra = 1
+
+    def test_pickle_round_trip(self):
+        """Test that items pickle by value and the pill stays a singleton."""
+        copy = pickle.loads(pickle.dumps(DataItem("x", priority=2)))
+        self.assertEqual((copy.payload, copy.priority), ("x", 2))
+        self.assertIs(pickle.loads(pickle.dumps(POISON_PILL)), POISON_PILL)
+
+
+class TestDataItemPool(unittest.TestCase):
+    def test_reuses_released_envelopes(self):
+        """Test that released envelopes are handed out again with the new payload."""
+        pool = DataItemPool(max_size=2)
+        first = pool.acquire("a")
+        pool.release(first)
+        self.assertIsNone(first.payload)
+
+        second = pool.acquire("b", priority=3)
+        self.assertIs(second, first)
+        self.assertEqual((second.payload, second.priority), ("b", 3))
+        self.assertEqual(pool.created, 1)
+
+    def test_bounded_and_ignores_pill(self):
+        """Test that the pool never grows past max_size and never stores the pill."""
+        pool = DataItemPool(max_size=1)
+        pool.release(POISON_PILL)
+        self.assertEqual(len(pool), 0)
+        pool.release(DataItem(1))
+        pool.release(DataItem(2))
+        self.assertEqual(len(pool), 1)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
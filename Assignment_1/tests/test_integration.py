@@ -2,6 +2,7 @@ import unittest
 from src.blocking_queue import BlockingQueue
 from src.producer import Producer
 from src.consumer import Consumer
+from src.data_item import DataItemPool
 
 class TestIntegration(unittest.TestCase):
     def test_full_cycle(self):
@@ -27,5 +28,60 @@ class TestIntegration(unittest.TestCase):
         self.assertFalse(producer.is_alive(), "Producer failed to shut down")
         self.assertFalse(consumer.is_alive(), "Consumer failed to shut down")
 
+    def test_full_cycle_batched(self):
+        """
+        Same as test_full_cycle but with put_many/take_many batching enabled.
+        """
+        queue = BlockingQueue(capacity=4)
+        producer = Producer(queue, 20, delay=0, batch_size=3)
+        consumer = Consumer(queue, processing_time=0, batch_size=4)
+
+        producer.start()
+        consumer.start()
+        producer.join(timeout=2)
+        consumer.join(timeout=2)
+
+        self.assertFalse(producer.is_alive(), "Producer failed to shut down")
+        self.assertFalse(consumer.is_alive(), "Consumer failed to shut down")
+        self.assertEqual(len(queue), 0)
+
+    def test_close_shuts_down_many_consumers(self):
+        """
+        One close() replaces a Poison Pill per consumer.
+        """
+        queue = BlockingQueue(capacity=3)
+        producer = Producer(queue, 20, delay=0, send_poison_pill=False)
+        consumers = [Consumer(queue, processing_time=0.001) for _ in range(4)]
+
+        producer.start()
+        for consumer in consumers:
+            consumer.start()
+        producer.join(timeout=2)
+        queue.close()
+        for consumer in consumers:
+            consumer.join(timeout=2)
+
+        self.assertFalse(any(c.is_alive() for c in consumers), "Consumers failed to shut down")
+        self.assertEqual(len(queue), 0)
+
+    def test_full_cycle_pooled_envelopes(self):
+        """
+        Envelopes released by the consumer are reused by the producer.
+        """
+        queue = BlockingQueue(capacity=2)
+        pool = DataItemPool(max_size=8)
+        received = []
+        producer = Producer(queue, 200, delay=0, item_pool=pool)
+        consumer = Consumer(queue, handler=received.append, item_pool=pool)
+
+        producer.start()
+        consumer.start()
+        producer.join(timeout=2)
+        consumer.join(timeout=2)
+
+        self.assertEqual(received, list(range(1, 201)))
+        # Only a handful of envelopes were ever allocated
+        self.assertLess(pool.created, 20)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
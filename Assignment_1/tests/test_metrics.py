@@ -0,0 +1,116 @@
+import unittest
+import logging
+import threading
+import time
+from src.blocking_queue import BlockingQueue
+from src.consumer import Consumer
+from src.data_item import DataItem
+from src.metrics import LatencyHistogram, MetricsReporter, QueueMetrics
+from src.producer import Producer
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_buckets_and_percentiles(self):
+        """Test that latencies land in power-of-two buckets and percentiles follow."""
+        histogram = LatencyHistogram()
+        for _ in range(99):
+            histogram.record(0.000003)   # 3us -> (2, 4] bucket
+        histogram.record(0.010)          # 10ms outlier
+
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot["count"], 100)
+        self.assertEqual(snapshot["buckets"][4], 99)
+        self.assertEqual(snapshot["p50"], 4e-6)
+        self.assertAlmostEqual(snapshot["max"], 0.010)
+        self.assertAlmostEqual(histogram.percentile(1.0), 0.010)
+
+    def test_empty(self):
+        """Test that an empty histogram reports zeros."""
+        snapshot = LatencyHistogram().snapshot()
+        self.assertEqual(snapshot["count"], 0)
+        self.assertEqual(snapshot["p99"], 0.0)
+
+    def test_sample_rate_validation(self):
+        """Test that the latency sample rate must be a power of two."""
+        with self.assertRaises(ValueError):
+            QueueMetrics(sample_every=3)
+
+
+class TestQueueMetrics(unittest.TestCase):
+    def test_depth_and_counters(self):
+        """Test depth, high-water mark and enqueue/dequeue counters."""
+        queue = BlockingQueue(capacity=4)
+        queue.put_many([DataItem(i) for i in range(3)])
+        queue.take()
+
+        snapshot = queue.metrics_snapshot()
+        self.assertEqual(snapshot["depth"], 2)
+        self.assertEqual(snapshot["high_water"], 3)
+        self.assertEqual(snapshot["enqueued"], 3)
+        self.assertEqual(snapshot["dequeued"], 1)
+        self.assertGreater(snapshot["items_per_sec"], 0)
+
+    def test_blocked_time(self):
+        """Test that time spent waiting on an empty queue is accumulated."""
+        queue = BlockingQueue(capacity=1)
+
+        def delayed_put():
+            time.sleep(0.1)
+            queue.put(DataItem(1))
+
+        t = threading.Thread(target=delayed_put)
+        t.start()
+        queue.take()
+        t.join()
+
+        snapshot = queue.metrics_snapshot()
+        self.assertGreaterEqual(snapshot["consumer_blocked_sec"], 0.09)
+        self.assertEqual(snapshot["producer_blocked_sec"], 0.0)
+
+    def test_latency_sampling(self):
+        """Test that one operation in every sample_every is recorded."""
+        queue = BlockingQueue(capacity=64)
+        for i in range(32):
+            queue.put(DataItem(i))
+        self.assertEqual(queue.metrics_snapshot()["put_latency"]["count"], 32 // 8)
+
+    def test_disabled(self):
+        """Test that metrics collection can be switched off."""
+        queue = BlockingQueue(capacity=1, collect_metrics=False)
+        queue.put(DataItem(1))
+        self.assertIsNone(queue.metrics_snapshot())
+
+
+class TestWorkerMetrics(unittest.TestCase):
+    def test_producer_and_consumer_counts(self):
+        """Test that Producer and Consumer count the items they moved."""
+        queue = BlockingQueue(capacity=2)
+        producer = Producer(queue, item_count=10, delay=0)
+        consumer = Consumer(queue, processing_time=0)
+        producer.start()
+        consumer.start()
+        producer.join(timeout=2)
+        consumer.join(timeout=2)
+
+        self.assertEqual(producer.metrics_snapshot()["items"], 10)
+        self.assertEqual(consumer.metrics_snapshot()["items"], 10)
+
+
+class TestMetricsReporter(unittest.TestCase):
+    def test_periodic_report(self):
+        """Test that the reporter logs every source periodically and on stop."""
+        queue = BlockingQueue(capacity=1)
+        reporter = MetricsReporter({"queue": queue.metrics_snapshot}, interval=0.02)
+
+        with self.assertLogs("src.metrics", level=logging.INFO) as logs:
+            reporter.start()
+            time.sleep(0.1)
+            reporter.stop()
+            reporter.join(timeout=1)
+
+        self.assertFalse(reporter.is_alive())
+        self.assertGreaterEqual(len(logs.records), 2)
+        self.assertIn("metrics queue: depth=0", logs.output[0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+import threading
+import time
+from src.blocking_queue import QueueClosed
+from src.consumer import Consumer
+from src.data_item import DataItem, POISON_PILL
+from src.priority_queue import MultiLaneQueue, PriorityBlockingQueue
+
+
+class TestPriorityBlockingQueue(unittest.TestCase):
+    def setUp(self):
+        self.queue = PriorityBlockingQueue(capacity=5)
+
+    def test_highest_priority_first_fifo_within_priority(self):
+        """Test that higher priorities are served first and ties keep FIFO order."""
+        self.queue.put(DataItem("a", priority=0))
+        self.queue.put(DataItem("b", priority=5))
+        self.queue.put(DataItem("c", priority=0))
+        self.queue.put(DataItem("d", priority=5))
+        self.queue.put(DataItem("e", priority=-1))
+
+        order = [self.queue.take().payload for _ in range(5)]
+        self.assertEqual(order, ["b", "d", "a", "c", "e"])
+
+    def test_poison_pill_never_overtakes_items(self):
+        """Test that a pill is served after every regular item."""
+        self.queue.put(DataItem(1))
+        self.queue.put(POISON_PILL)
+        self.queue.put(DataItem(2, priority=-10))
+
+        self.assertEqual(self.queue.take().payload, 1)
+        self.assertEqual(self.queue.take().payload, 2)
+        self.assertTrue(self.queue.take().is_poison_pill())
+
+    def test_bounded_and_blocking(self):
+        """Test that capacity, offer timeouts and close() match BlockingQueue."""
+        self.queue.put_many(DataItem(i) for i in range(5))
+        self.assertFalse(self.queue.offer(DataItem(9, priority=100), timeout=0.05))
+        self.assertEqual([i.payload for i in self.queue.take_many(10)], [0, 1, 2, 3, 4])
+
+        self.queue.close()
+        with self.assertRaises(QueueClosed):
+            self.queue.take()
+
+    def test_blocking_on_empty(self):
+        """Test that take() blocks until an item arrives."""
+        def delayed_put():
+            time.sleep(0.1)
+            self.queue.put(DataItem(99, priority=3))
+
+        t = threading.Thread(target=delayed_put)
+        t.start()
+        self.assertEqual(self.queue.take().payload, 99)
+        t.join()
+
+
+class TestMultiLaneQueue(unittest.TestCase):
+    def _queue(self, capacity=100):
+        return MultiLaneQueue(capacity, {"urgent": 3, "bulk": 1},
+                              lane_of=lambda item: "urgent" if item.priority > 0 else "bulk")
+
+    def test_weighted_share(self):
+        """Test that backlogged lanes are served in proportion to their weights."""
+        queue = self._queue()
+        queue.put_many(DataItem(f"b{i}") for i in range(40))
+        queue.put_many(DataItem(f"u{i}", priority=1) for i in range(40))
+
+        first = [queue.take().payload for _ in range(40)]
+        urgent = sum(1 for p in first if p.startswith("u"))
+        self.assertEqual(urgent, 30)
+        # FIFO within each lane
+        self.assertEqual([p for p in first if p.startswith("u")], [f"u{i}" for i in range(30)])
+
+    def test_idle_lane_gets_no_backlog_credit(self):
+        """Test that a lane that was idle does not monopolise the queue when it wakes up."""
+        queue = self._queue()
+        queue.put_many(DataItem(f"b{i}") for i in range(20))
+        for _ in range(10):
+            queue.take()
+        queue.put_many(DataItem(f"u{i}", priority=1) for i in range(20))
+
+        next_eight = [queue.take().payload for _ in range(8)]
+        self.assertEqual(sum(1 for p in next_eight if p.startswith("b")), 2)
+
+    def test_lane_depths_and_unknown_lane(self):
+        """Test per-lane depth reporting and rejection of unknown lanes."""
+        queue = MultiLaneQueue(10, {"a": 1, "b": 1}, lane_of=lambda item: item.payload)
+        queue.put(DataItem("a"))
+        queue.put(DataItem("b"))
+        self.assertEqual(queue.lane_depths(), {"a": 1, "b": 1})
+        with self.assertRaises(KeyError):
+            queue.put(DataItem("c"))
+        with self.assertRaises(KeyError):
+            queue.put_many([DataItem("a"), DataItem("zzz")])
+        # The valid item before the bad one was still accounted for
+        self.assertEqual(len(queue), 3)
+
+    def test_invalid_configuration(self):
+        """Test that empty lane sets and non-positive weights are rejected."""
+        with self.assertRaises(ValueError):
+            MultiLaneQueue(10, {})
+        with self.assertRaises(ValueError):
+            MultiLaneQueue(10, {"a": 0})
+
+    def test_consumer_drains_all_lanes_before_pill(self):
+        """Test that a Consumer sees every item before the Poison Pill."""
+        queue = self._queue()
+        seen = []
+        queue.put_many([DataItem(1), DataItem(2, priority=1), POISON_PILL, DataItem(3)])
+        consumer = Consumer(queue, handler=seen.append)
+        consumer.start()
+        consumer.join(timeout=2)
+
+        self.assertEqual(sorted(seen), [1, 2, 3])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -27,5 +27,18 @@ class TestProducer(unittest.TestCase):
         last_item = queue.take()
         self.assertTrue(last_item.is_poison_pill())
 
+    def test_producer_batched(self):
+        """
+        Verify a batched producer adds the same items in the same order.
+        """
+        queue = BlockingQueue(capacity=10)
+        producer = Producer(queue, item_count=5, delay=0, batch_size=2)
+
+        producer.start()
+        producer.join()
+
+        payloads = [item.payload for item in queue.take_many(10)]
+        self.assertEqual(payloads, [1, 2, 3, 4, 5, None])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,101 @@
+import time
+import unittest
+from src.rate_control import AIMDRateController, PIDRateController, RateController
+from src.blocking_queue import BlockingQueue
+from src.consumer import Consumer
+from src.producer import Producer
+
+class TestAIMDRateController(unittest.TestCase):
+    def test_increases_below_target(self):
+        """
+        Verify the rate grows additively while the queue stays below the target fill.
+        """
+        controller = AIMDRateController(target_fill=0.5, initial_rate=100.0, increase=10.0)
+        delay = controller.next_delay(depth=0, capacity=10)
+        self.assertEqual(controller.rate, 110.0)
+        self.assertAlmostEqual(delay, 1 / 110.0)
+
+    def test_decreases_at_target_once_per_cooldown(self):
+        """
+        Verify the rate is cut multiplicatively at the target, at most once per cooldown.
+        """
+        controller = AIMDRateController(target_fill=0.5, initial_rate=100.0,
+                                        decrease=0.5, cooldown=60.0)
+        controller.next_delay(depth=5, capacity=10)
+        self.assertEqual(controller.rate, 50.0)
+        controller.next_delay(depth=8, capacity=10)
+        self.assertEqual(controller.rate, 50.0)
+
+    def test_rate_is_clamped(self):
+        """
+        Verify the rate never leaves [min_rate, max_rate].
+        """
+        controller = AIMDRateController(initial_rate=10.0, min_rate=5.0, max_rate=12.0,
+                                        increase=10.0, decrease=0.1, cooldown=0.0)
+        controller.next_delay(depth=0, capacity=10)
+        self.assertEqual(controller.rate, 12.0)
+        controller.next_delay(depth=10, capacity=10)
+        self.assertEqual(controller.rate, 5.0)
+
+    def test_invalid_configuration(self):
+        """
+        Verify inconsistent settings are rejected.
+        """
+        with self.assertRaises(ValueError):
+            AIMDRateController(target_fill=0)
+        with self.assertRaises(ValueError):
+            AIMDRateController(decrease=1.5)
+        with self.assertRaises(ValueError):
+            AIMDRateController(initial_rate=1000.0, max_rate=10.0)
+
+    def test_base_class_is_abstract(self):
+        """
+        Verify the base class cannot be used without an _update rule.
+        """
+        with self.assertRaises(TypeError):
+            RateController(initial_rate=1.0)
+
+
+class TestPIDRateController(unittest.TestCase):
+    def test_estimates_drain_rate(self):
+        """
+        Verify the drain rate is derived from items put and the change in depth.
+        """
+        controller = PIDRateController(target_depth=2)
+        controller.next_delay(depth=2, capacity=10)
+        time.sleep(0.05)
+        # One item put and the depth fell by one: two items drained
+        controller.next_delay(depth=1, capacity=10)
+        self.assertGreater(controller.drain_rate, 0)
+        self.assertLess(controller.drain_rate, 2 / 0.05 * 1.01)
+
+    def test_backlog_slows_producer(self):
+        """
+        Verify a queue above the target depth lowers the rate below one below it.
+        """
+        over = PIDRateController(target_depth=2, initial_rate=100.0)
+        under = PIDRateController(target_depth=2, initial_rate=100.0)
+        over.next_delay(depth=8, capacity=10)
+        under.next_delay(depth=0, capacity=10)
+        self.assertLess(over.rate, under.rate)
+
+
+class TestAdaptiveProducer(unittest.TestCase):
+    def test_producer_with_controller(self):
+        """
+        Verify a paced producer still delivers every item and is slowed down by the backlog.
+        """
+        queue = BlockingQueue(capacity=8)
+        controller = AIMDRateController(target_fill=0.5, initial_rate=200.0, increase=20.0)
+        producer = Producer(queue, item_count=40, rate_controller=controller)
+        consumer = Consumer(queue, processing_time=0.002)
+
+        producer.start()
+        consumer.start()
+        producer.join()
+        consumer.join(timeout=5)
+
+        self.assertEqual(consumer.processed, 40)
+
+if __name__ == '__main__':
+    unittest.main()
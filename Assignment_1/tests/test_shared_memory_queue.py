@@ -0,0 +1,110 @@
+import unittest
+import multiprocessing
+import threading
+import time
+from src.blocking_queue import QueueClosed
+from src.shared_memory_queue import SharedMemoryQueue
+
+
+def drain_into(queue, results):
+    # Child process: take every payload until the queue is closed and drained
+    try:
+        while True:
+            results.put(queue.take())
+    except QueueClosed:
+        results.put(None)
+
+
+class TestSharedMemoryQueue(unittest.TestCase):
+    def setUp(self):
+        self.queue = SharedMemoryQueue(capacity_bytes=64)
+
+    def tearDown(self):
+        self.queue.unlink()
+
+    def test_fifo_order_variable_sizes(self):
+        """Test that variable-length payloads come back in order and intact."""
+        self.queue.put(b"a")
+        self.queue.put(b"hello world")
+        self.queue.put(b"")
+
+        self.assertEqual(len(self.queue), 3)
+        self.assertEqual(self.queue.take(), b"a")
+        self.assertEqual(self.queue.take(), b"hello world")
+        self.assertEqual(self.queue.take(), b"")
+
+    def test_wraparound(self):
+        """Test that records wrap around the end of the buffer without corruption."""
+        for i in range(50):
+            payload = bytes([i]) * (i % 20)
+            self.queue.put(payload)
+            self.assertEqual(self.queue.take(), payload)
+
+    def test_take_view_is_zero_copy_until_released(self):
+        """Test that a view's space is not reused until its context exits."""
+        self.queue.put(b"x" * 24)
+        with self.queue.take_view() as view:
+            self.assertEqual(bytes(view), b"x" * 24)
+            self.assertTrue(view.readonly)
+            # 32 bytes are still held by the view, so a 32-byte record cannot fit yet
+            self.assertFalse(self.queue.offer(b"y" * 40, timeout=0.05))
+        self.assertTrue(self.queue.offer(b"y" * 40))
+
+    def test_blocking_on_full(self):
+        """Test that put() blocks until a consumer frees space."""
+        self.queue.put(b"z" * 56)
+
+        def delayed_take():
+            time.sleep(0.1)
+            self.queue.take()
+
+        t = threading.Thread(target=delayed_take)
+        t.start()
+        start_time = time.time()
+        self.queue.put(b"q" * 8)
+        t.join()
+
+        self.assertGreaterEqual(time.time() - start_time, 0.1)
+        self.assertEqual(self.queue.take(), b"q" * 8)
+
+    def test_oversized_payload_rejected(self):
+        """Test that a payload larger than the buffer is rejected."""
+        with self.assertRaises(ValueError):
+            self.queue.put(b"x" * 100)
+
+    def test_close_and_poll(self):
+        """Test close() drain semantics and poll() timeouts."""
+        self.assertIsNone(self.queue.poll(timeout=0.05))
+        self.queue.put(b"last")
+        self.queue.close()
+
+        self.assertTrue(self.queue.closed)
+        with self.assertRaises(QueueClosed):
+            self.queue.put(b"late")
+        self.assertEqual(self.queue.poll(), b"last")
+        with self.assertRaises(QueueClosed):
+            self.queue.take()
+
+    def test_cross_process(self):
+        """Test that a consumer in another process receives every payload."""
+        results = multiprocessing.Queue()
+        child = multiprocessing.Process(target=drain_into, args=(self.queue, results))
+        child.start()
+
+        payloads = [str(i).encode() * 3 for i in range(200)]
+        for payload in payloads:
+            self.queue.put(payload)
+        self.queue.close()
+
+        received = []
+        while True:
+            item = results.get(timeout=5)
+            if item is None:
+                break
+            received.append(item)
+        child.join(timeout=5)
+
+        self.assertEqual(received, payloads)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+import unittest
+import threading
+import time
+from src.blocking_queue import BlockingQueue, QueueClosed
+from src.consumer import Consumer
+from src.data_item import DataItem
+from src.producer import Producer
+from src.queue_factory import create_queue
+from src.spsc_queue import SPSCQueue
+
+
+class TestSPSCQueue(unittest.TestCase):
+    def setUp(self):
+        self.queue = SPSCQueue(capacity=2)
+
+    def test_fifo_order_with_wraparound(self):
+        """Test FIFO order across many wraps of the slot array."""
+        for i in range(10):
+            self.queue.put(DataItem(i))
+            self.assertEqual(self.queue.take().payload, i)
+        self.assertEqual(len(self.queue), 0)
+
+    def test_blocking_on_empty(self):
+        """Test that take() sleeps until the producer publishes an item."""
+        def delayed_put():
+            time.sleep(0.1)
+            self.queue.put(DataItem(99))
+
+        t = threading.Thread(target=delayed_put)
+        t.start()
+        start_time = time.time()
+        item = self.queue.take()
+        t.join()
+
+        self.assertEqual(item.payload, 99)
+        self.assertGreaterEqual(time.time() - start_time, 0.1)
+
+    def test_blocking_on_full(self):
+        """Test that put() sleeps until the consumer frees a slot."""
+        self.queue.put(DataItem(1))
+        self.queue.put(DataItem(2))
+
+        def delayed_take():
+            time.sleep(0.1)
+            self.queue.take()
+
+        t = threading.Thread(target=delayed_take)
+        t.start()
+        start_time = time.time()
+        self.queue.put(DataItem(3))
+        t.join()
+
+        self.assertGreaterEqual(time.time() - start_time, 0.1)
+        self.assertEqual([i.payload for i in self.queue.take_many(5)], [2, 3])
+
+    def test_timeouts_and_close(self):
+        """Test offer/poll timeouts and close() drain semantics."""
+        self.assertIsNone(self.queue.poll(timeout=0.05))
+        self.queue.put(DataItem(1))
+        self.queue.put(DataItem(2))
+        self.assertFalse(self.queue.offer(DataItem(3), timeout=0.05))
+
+        self.queue.close()
+        with self.assertRaises(QueueClosed):
+            self.queue.put(DataItem(4))
+        self.assertEqual(self.queue.take().payload, 1)
+        self.assertEqual(self.queue.poll().payload, 2)
+        with self.assertRaises(QueueClosed):
+            self.queue.take()
+
+    def test_close_wakes_sleeping_consumer(self):
+        """Test that close() releases a consumer blocked on an empty queue."""
+        errors = []
+
+        def blocked_take():
+            try:
+                self.queue.take()
+            except QueueClosed:
+                errors.append("closed")
+
+        t = threading.Thread(target=blocked_take)
+        t.start()
+        time.sleep(0.05)
+        self.queue.close()
+        t.join(timeout=2)
+        self.assertEqual(errors, ["closed"])
+
+    def test_producer_consumer_stress(self):
+        """Test that every item crosses a tiny queue in order without lost wakeups."""
+        queue = SPSCQueue(capacity=3)
+        received = []
+        consumer = Consumer(queue, handler=received.append, batch_size=2)
+        producer = Producer(queue, item_count=5000, delay=0)
+        consumer.start()
+        producer.start()
+        producer.join(timeout=10)
+        consumer.join(timeout=10)
+
+        self.assertEqual(received, list(range(1, 5001)))
+        snapshot = queue.metrics_snapshot()
+        self.assertEqual(snapshot["enqueued"], 5001)
+        self.assertEqual(snapshot["dequeued"], 5001)
+
+    def test_metrics_match_blocking_queue(self):
+        """Test that the snapshot has BlockingQueue's keys, high-water mark and sampled latencies."""
+        queue = SPSCQueue(capacity=4)
+        for i in range(3):
+            queue.put(DataItem(i))
+        for _ in range(3):
+            queue.take()
+        for i in range(29):
+            queue.put(DataItem(i))
+            queue.take()
+
+        snapshot = queue.metrics_snapshot()
+        self.assertEqual(snapshot.keys(), BlockingQueue(1).metrics_snapshot().keys())
+        self.assertEqual(snapshot["high_water"], 3)
+        self.assertEqual((snapshot["enqueued"], snapshot["dequeued"], snapshot["depth"]), (32, 32, 0))
+        # One operation in every latency_sample_every is timed
+        self.assertEqual(snapshot["put_latency"]["count"], 32 // 8)
+        self.assertEqual(snapshot["take_latency"]["count"], 32 // 8)
+        self.assertIsNone(SPSCQueue(capacity=1, collect_metrics=False).metrics_snapshot())
+
+    def test_factory_selection(self):
+        """Test that create_queue() only uses SPSC for one producer and one consumer."""
+        self.assertIsInstance(create_queue(4), SPSCQueue)
+        self.assertIsInstance(create_queue(4, producers=2), BlockingQueue)
+        self.assertIsInstance(create_queue(4, consumers=3), BlockingQueue)
+        with self.assertRaises(ValueError):
+            create_queue(4, producers=0)
+
+if __name__ == '__main__':
+    unittest.main()
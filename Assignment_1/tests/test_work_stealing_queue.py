@@ -0,0 +1,137 @@
+import threading
+import time
+import unittest
+from src.work_stealing_queue import WorkStealingQueue
+from src.blocking_queue import BlockingQueue, QueueClosed
+from src.data_item import DataItem, POISON_PILL
+from src.producer import Producer
+from src.consumer import Consumer
+
+class TestWorkStealingQueue(unittest.TestCase):
+    def test_fifo_within_home_shard(self):
+        """
+        Verify a single consumer with a single shard gets items in FIFO order.
+        """
+        queue = WorkStealingQueue(capacity=5, shards=1)
+        for i in range(5):
+            queue.put(DataItem(i))
+        self.assertEqual([queue.take().payload for _ in range(5)], [0, 1, 2, 3, 4])
+
+    def test_steals_from_other_shards(self):
+        """
+        Verify a consumer drains every shard, not only its home shard.
+        """
+        queue = WorkStealingQueue(capacity=8, shards=4)
+        for i in range(8):
+            queue.put(DataItem(i))
+        payloads = []
+        while len(queue):
+            payloads.extend(item.payload for item in queue.take_many(8))
+        self.assertEqual(sorted(payloads), list(range(8)))
+        self.assertGreater(queue.metrics_snapshot()["stolen"], 0)
+
+    def test_metrics_snapshot(self):
+        """
+        Verify the snapshot has BlockingQueue's keys plus shard depths and steal counts.
+        """
+        queue = WorkStealingQueue(capacity=16, shards=2)
+        for i in range(16):
+            queue.put(DataItem(i))
+        queue.put(POISON_PILL)
+        while not queue.take().is_poison_pill():
+            pass
+
+        snapshot = queue.metrics_snapshot()
+        self.assertLessEqual(BlockingQueue(1).metrics_snapshot().keys(), snapshot.keys())
+        self.assertEqual((snapshot["enqueued"], snapshot["dequeued"], snapshot["depth"]), (17, 17, 0))
+        self.assertEqual(snapshot["shard_depths"], [0, 0])
+        # The other shard's 8 items are stolen in single-item takes
+        self.assertEqual((snapshot["stolen"], snapshot["steals"]), (8, 8))
+        # The 8th put of each shard is sampled, and the total depth with it
+        self.assertEqual(snapshot["put_latency"]["count"], 2)
+        self.assertGreaterEqual(snapshot["high_water"], 15)
+        self.assertIsNone(WorkStealingQueue(capacity=2, shards=1, collect_metrics=False).metrics_snapshot())
+
+    def test_no_stealing(self):
+        """
+        Verify steal=False keeps a consumer on its home shard.
+        """
+        queue = WorkStealingQueue(capacity=4, shards=2, steal=False)
+        for i in range(4):
+            queue.put(DataItem(i))
+        self.assertEqual([item.payload for item in queue.take_many(4)], [0, 2])
+        self.assertIsNone(queue.poll(timeout=0.01))
+
+    def test_capacity_blocks_and_offer_times_out(self):
+        """
+        Verify the total capacity is enforced across shards.
+        """
+        queue = WorkStealingQueue(capacity=4, shards=2)
+        for i in range(4):
+            self.assertTrue(queue.offer(DataItem(i)))
+        self.assertFalse(queue.offer(DataItem(4), timeout=0.01))
+        self.assertEqual(len(queue), 4)
+
+    def test_blocked_take_wakes_on_put(self):
+        """
+        Verify a consumer waiting on an empty queue is woken by a put.
+        """
+        queue = WorkStealingQueue(capacity=4, shards=2)
+        result = []
+        consumer = threading.Thread(target=lambda: result.append(queue.take().payload))
+        consumer.start()
+        time.sleep(0.05)
+        queue.put(DataItem("x"))
+        consumer.join(timeout=1)
+        self.assertEqual(result, ["x"])
+
+    def test_pill_after_regular_items(self):
+        """
+        Verify a Poison Pill is only handed out once every shard is empty.
+        """
+        queue = WorkStealingQueue(capacity=4, shards=2)
+        queue.put(DataItem(1))
+        queue.put(POISON_PILL)
+        queue.put(DataItem(2))
+        self.assertFalse(queue.take().is_poison_pill())
+        self.assertFalse(queue.take().is_poison_pill())
+        self.assertTrue(queue.take().is_poison_pill())
+
+    def test_close(self):
+        """
+        Verify close() rejects puts and ends takes once drained.
+        """
+        queue = WorkStealingQueue(capacity=4, shards=2)
+        queue.put(DataItem(1))
+        queue.close()
+        with self.assertRaises(QueueClosed):
+            queue.put(DataItem(2))
+        self.assertEqual(queue.take().payload, 1)
+        with self.assertRaises(QueueClosed):
+            queue.take()
+
+    def test_with_producer_and_consumers(self):
+        """
+        Verify unchanged Producer/Consumer threads move every item exactly once.
+        """
+        queue = WorkStealingQueue(capacity=16, shards=4)
+        seen = []
+        lock = threading.Lock()
+
+        def handler(payload):
+            with lock:
+                seen.append(payload)
+
+        consumers = [Consumer(queue, handler=handler, batch_size=3) for _ in range(4)]
+        producer = Producer(queue, item_count=200, delay=0, send_poison_pill=False)
+        for c in consumers:
+            c.start()
+        producer.start()
+        producer.join()
+        queue.close()
+        for c in consumers:
+            c.join(timeout=5)
+        self.assertEqual(sorted(seen), list(range(1, 201)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+"""
+Cold vs warm aggregation with the on-disk AggregateCache.
+
+Runs cached_aggregate twice over the sample dataset scaled up (100x by
+default) with an empty cache directory: the first call parses and
+aggregates the CSV, the second only fingerprints the file (size and mtime)
+and loads the stored result. The "content hash" line times the opt-in
+content_hash=True fingerprint for comparison.
+
+Usage (from Assignment_2/):
+    python -m benchmarks.bench_aggregate_cache [--scale 100]
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from benchmarks.datasets import scaled_dataset
+from src.cache import AggregateCache, cached_aggregate, file_fingerprint
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scale", type=int, default=100, help="copies of the sample dataset")
+    parser.add_argument("--data-dir", default=tempfile.gettempdir(), help="where the scaled CSV is written")
+    args = parser.parse_args()
+
+    path = scaled_dataset(args.scale, args.data_dir)
+    cache_dir = tempfile.mkdtemp()
+    try:
+        cache = AggregateCache(cache_dir)
+        print(f"{path} ({os.path.getsize(path) / 2**20:.0f} MiB)")
+
+        started = time.perf_counter()
+        file_fingerprint(path, content_hash=True)
+        print(f"{'content hash':<12} {time.perf_counter() - started:>7.3f}s")
+
+        for label in ("cold", "warm"):
+            started = time.perf_counter()
+            result = cached_aggregate(path, lambda c: c.full_name,
+                                      lambda c: {'count': 1, 'revenue': c.price}, cache)
+            print(f"{label:<12} {time.perf_counter() - started:>7.3f}s  ({len(result)} keys)")
+        print(f"cache size   {cache.total_bytes / 2**10:.1f} KiB in {len(cache)} entries")
+    finally:
+        shutil.rmtree(cache_dir)
+
+
+if __name__ == "__main__":
+    main()
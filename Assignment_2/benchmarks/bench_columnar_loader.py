@@ -0,0 +1,98 @@
+"""
+Rows/sec and peak RSS: DictReader row loader vs columnar chunked loader.
+
+Scales data/Car_sales_dataset.csv up (1000x by default, ~2.5M rows) and
+runs every loader in a fresh process, so ru_maxrss is that loader's own
+peak. Each loader is measured twice: streaming (every row is read and
+its price summed, nothing kept) and fully loaded (all rows kept in memory).
+
+  dictreader  the original csv.DictReader -> CarSale generator
+  rows        car_sales_stream(): CarSale objects rebuilt from columnar chunks
+  columnar    car_sales_chunks(): typed arrays + dictionary-encoded strings
+
+Usage (from Assignment_2/):
+    python -m benchmarks.bench_columnar_loader [--scale 1000]
+"""
+import argparse
+import csv
+import multiprocessing
+import resource
+import tempfile
+import time
+
+from benchmarks.datasets import scaled_dataset
+from src.columnar import car_sales_chunks
+from src.models import CarSale
+from src.streams import car_sales_stream
+
+
+def dictreader_stream(filepath):
+    # The original loader, kept here as the baseline
+    with open(filepath, mode='r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            try:
+                yield CarSale(
+                    id=int(row['id']),
+                    price=float(row['price']),
+                    brand=row['brand'],
+                    model=row['model'],
+                    year=int(row['year']),
+                    title_status=row['title_status'],
+                    mileage=float(row['mileage']),
+                    color=row['color']
+                )
+            except (ValueError, KeyError):
+                continue
+
+
+def measure(loader: str, keep: bool, path: str, results):
+    started = time.perf_counter()
+    if loader == "columnar":
+        chunks = car_sales_chunks(path)
+        if keep:
+            chunks = list(chunks)
+        rows = sum(len(chunk) for chunk in chunks)
+        total = sum(sum(chunk.price) for chunk in chunks) if keep else None
+    else:
+        stream = dictreader_stream(path) if loader == "dictreader" else car_sales_stream(path)
+        if keep:
+            kept = list(stream)
+            rows, total = len(kept), sum(car.price for car in kept)
+        else:
+            rows = total = 0
+            for car in stream:
+                rows += 1
+                total += car.price
+    elapsed = time.perf_counter() - started
+    # ru_maxrss is reported in KiB on Linux
+    results.put((rows, elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024))
+
+
+def run(loader: str, keep: bool, path: str):
+    ctx = multiprocessing.get_context("spawn")
+    results = ctx.Queue()
+    process = ctx.Process(target=measure, args=(loader, keep, path, results))
+    process.start()
+    outcome = results.get()
+    process.join()
+    return outcome
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scale", type=int, default=1000, help="copies of the sample dataset")
+    parser.add_argument("--data-dir", default=tempfile.gettempdir(), help="where the scaled CSV is written")
+    args = parser.parse_args()
+
+    path = scaled_dataset(args.scale, args.data_dir)
+    print(f"{path}")
+    print(f"{'loader':<12} {'mode':<8} {'rows':>10} {'rows/sec':>10} {'peak RSS':>10}")
+    for keep in (False, True):
+        for loader in ("dictreader", "rows", "columnar"):
+            rows, elapsed, rss = run(loader, keep, path)
+            print(f"{loader:<12} {'load' if keep else 'stream':<8} {rows:>10,} "
+                  f"{rows / elapsed:>10,.0f} {rss / 2**20:>8.1f}MiB")
+
+
+if __name__ == "__main__":
+    main()
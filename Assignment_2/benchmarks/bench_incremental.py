@@ -0,0 +1,67 @@
+"""
+Full re-aggregation vs IncrementalAggregator on an append-only CSV.
+
+Copies the sample dataset scaled up (100x by default) to a scratch file,
+builds the checkpoint once, then repeatedly appends a batch of rows and
+compares a full functional_aggregate pass with an incremental update().
+
+Usage (from Assignment_2/):
+    python -m benchmarks.bench_incremental [--scale 100] [--append 2500]
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+from operator import attrgetter
+
+from benchmarks.datasets import DATA_PATH, scaled_dataset
+from src.analysis import functional_aggregate, count_and_revenue
+from src.incremental import IncrementalAggregator
+from src.streams import car_sales_stream
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scale", type=int, default=100, help="copies of the sample dataset")
+    parser.add_argument("--append", type=int, default=2500, help="rows appended per round")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--data-dir", default=tempfile.gettempdir(), help="where the scaled CSV is written")
+    args = parser.parse_args()
+
+    with open(DATA_PATH, encoding='utf-8') as f:
+        f.readline()
+        sample_rows = [line.rstrip('\r\n') + '\n' for line in f if line.strip()]
+    batch = ''.join(sample_rows[i % len(sample_rows)] for i in range(args.append))
+
+    scratch = tempfile.mkdtemp()
+    try:
+        path = os.path.join(scratch, "sales.csv")
+        shutil.copy(scaled_dataset(args.scale, args.data_dir), path)
+        aggregator = IncrementalAggregator(path, attrgetter('full_name'), count_and_revenue)
+
+        started = time.perf_counter()
+        aggregator.update()
+        print(f"initial build       {time.perf_counter() - started:>7.3f}s")
+
+        for round_no in range(1, args.rounds + 1):
+            with open(path, 'a', encoding='utf-8', newline='') as f:
+                f.write(batch)
+
+            started = time.perf_counter()
+            full = functional_aggregate(car_sales_stream(path), attrgetter('full_name'), count_and_revenue)
+            full_time = time.perf_counter() - started
+
+            started = time.perf_counter()
+            incremental = aggregator.update()
+            incremental_time = time.perf_counter() - started
+
+            same = all(incremental[k]['count'] == v['count'] for k, v in full.items())
+            print(f"round {round_no}: +{args.append} rows  full {full_time:>7.3f}s  "
+                  f"incremental {incremental_time:>7.3f}s  {'ok' if same else 'MISMATCH'}")
+    finally:
+        shutil.rmtree(scratch)
+
+
+if __name__ == "__main__":
+    main()
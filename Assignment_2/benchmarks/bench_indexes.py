@@ -0,0 +1,62 @@
+"""
+Index lookups vs full scans of car_sales_stream.
+
+On the sample dataset scaled up (100x by default), builds the secondary
+indexes once (and reopens them from disk), then answers point and range
+queries with CarSalesIndex.find()/find_range() and with a filtered scan.
+
+Usage (from Assignment_2/):
+    python -m benchmarks.bench_indexes [--scale 100]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.datasets import scaled_dataset
+from src.indexes import build_index, default_index_path, open_index, write_index
+from src.streams import car_sales_stream
+
+
+def timed(function):
+    started = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scale", type=int, default=100, help="copies of the sample dataset")
+    parser.add_argument("--data-dir", default=tempfile.gettempdir(), help="where the scaled CSV is written")
+    args = parser.parse_args()
+    path = scaled_dataset(args.scale, args.data_dir)
+
+    index, build_time = timed(lambda: build_index(path))
+    _, write_time = timed(lambda: write_index(index))
+    index, open_time = timed(lambda: open_index(path))
+    print(f"{len(index):,} rows indexed: build {build_time:.3f}s, write {write_time:.3f}s, "
+          f"reopen (fingerprint + load) {open_time:.3f}s, "
+          f"{os.path.getsize(default_index_path(path)) / 2**20:.1f} MiB on disk\n")
+
+    queries = (
+        ("brand == ford", lambda: index.find('brand', 'ford'), lambda c: c.brand == 'ford'),
+        ("brand == bmw", lambda: index.find('brand', 'bmw'), lambda c: c.brand == 'bmw'),
+        ("full_name == dodge charger", lambda: index.find('full_name', 'dodge charger'),
+         lambda c: c.full_name == 'dodge charger'),
+        ("price 10000-10500", lambda: index.find_range('price', 10000, 10500),
+         lambda c: 10000 <= c.price <= 10500),
+        ("year 2010-2012", lambda: index.find_range('year', 2010, 2012),
+         lambda c: 2010 <= c.year <= 2012),
+        ("mileage 0-1000", lambda: index.find_range('mileage', 0, 1000),
+         lambda c: 0 <= c.mileage <= 1000),
+    )
+    print(f"{'query':<28} {'rows':>8} {'scan':>8} {'index':>9} {'speedup':>8}  same")
+    for name, lookup, keep in queries:
+        scanned, scan_time = timed(lambda: [c for c in car_sales_stream(path) if keep(c)])
+        found, index_time = timed(lambda: list(lookup()))
+        print(f"{name:<28} {len(found):>8,} {scan_time:>7.3f}s {index_time:>8.4f}s "
+              f"{scan_time / index_time:>7.0f}x  {found == scanned}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+One pass per query vs a single multi-query pass over car_sales_stream.
+
+Evaluates four groupings (by model, brand, year and color) plus global price
+totals over the sample dataset scaled up (40x by default): first as five
+separate functional_aggregate passes, each re-reading the CSV, then with one
+multi_aggregate pass that also keeps running top-5 lists.
+
+Usage (from Assignment_2/):
+    python -m benchmarks.bench_multi_query [--scale 40]
+"""
+import argparse
+import tempfile
+import time
+
+from benchmarks.datasets import scaled_dataset
+from src.analysis import functional_aggregate
+from src.multi_query import Query, multi_aggregate
+from src.streams import car_sales_stream
+
+GROUPINGS = {
+    "by_model": lambda c: c.full_name,
+    "by_brand": lambda c: c.brand,
+    "by_year": lambda c: str(c.year),
+    "by_color": lambda c: c.color,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scale", type=int, default=40, help="copies of the sample dataset")
+    parser.add_argument("--data-dir", default=tempfile.gettempdir(), help="where the scaled CSV is written")
+    args = parser.parse_args()
+    path = scaled_dataset(args.scale, args.data_dir)
+
+    started = time.perf_counter()
+    separate = {name: functional_aggregate(car_sales_stream(path), selector,
+                                           lambda c: {'count': 1, 'revenue': c.price})
+                for name, selector in GROUPINGS.items()}
+    total_revenue = sum(car.price for car in car_sales_stream(path))
+    separate_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    combined = multi_aggregate(
+        car_sales_stream(path),
+        {name: Query(selector, lambda c: c.price, top_k=5) for name, selector in GROUPINGS.items()},
+        totals={"price": lambda c: c.price})
+    single_time = time.perf_counter() - started
+
+    same = all(combined.groups[name][key]['count'] == stats['count']
+               for name, groups in separate.items() for key, stats in groups.items())
+    same = same and abs(combined.totals["price"]["sum"] - total_revenue) < 1e-6 * total_revenue
+    print(f"{combined.rows:,} rows, {len(GROUPINGS)} groupings + totals")
+    print(f"separate passes  {separate_time:>7.2f}s")
+    print(f"single pass      {single_time:>7.2f}s  ({separate_time / single_time:.1f}x, "
+          f"{'ok' if same else 'MISMATCH'})")
+    print(f"top models by revenue: {combined.top['by_model'][:3]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Sequential functional_aggregate vs multi-process parallel_aggregate.
+
+Aggregates count/revenue per model over the sample dataset scaled up
+(200x by default, ~500k rows), first sequentially over car_sales_stream,
+then with parallel_aggregate at several worker counts. Speedup is bounded
+by the number of CPU cores available.
+
+Usage (from Assignment_2/):
+    python -m benchmarks.bench_parallel_aggregate [--scale 200] [--workers 1 2 4 8]
+"""
+import argparse
+import os
+import tempfile
+import time
+from operator import attrgetter
+
+from benchmarks.datasets import scaled_dataset
+from src.analysis import functional_aggregate, count_and_revenue
+from src.parallel import parallel_aggregate
+from src.streams import car_sales_stream
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scale", type=int, default=200, help="copies of the sample dataset")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--data-dir", default=tempfile.gettempdir(), help="where the scaled CSV is written")
+    args = parser.parse_args()
+
+    path = scaled_dataset(args.scale, args.data_dir)
+    key_selector = attrgetter('full_name')
+    print(f"{path} ({os.path.getsize(path) / 2**20:.0f} MiB), {os.cpu_count()} CPU(s)")
+
+    started = time.perf_counter()
+    expected = functional_aggregate(car_sales_stream(path), key_selector, count_and_revenue)
+    sequential = time.perf_counter() - started
+    print(f"{'sequential':<12} {sequential:>7.2f}s")
+
+    for workers in args.workers:
+        started = time.perf_counter()
+        result = parallel_aggregate(path, key_selector, count_and_revenue, workers=workers)
+        elapsed = time.perf_counter() - started
+        same = result.keys() == expected.keys() and all(
+            result[k]['count'] == v['count'] for k, v in expected.items())
+        print(f"{workers:>2} workers   {elapsed:>7.2f}s  speedup {sequential / elapsed:>4.2f}x"
+              f"  {'ok' if same else 'MISMATCH'}")
+
+
+if __name__ == "__main__":
+    main()
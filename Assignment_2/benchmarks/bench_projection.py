@@ -0,0 +1,61 @@
+"""
+Full-decode car_sales_stream vs column projection and predicate pushdown.
+
+On the sample dataset scaled up (100x by default), each query is run once
+on the full CarSale stream (filtering in Python afterwards) and once with
+car_sales_stream(columns=..., filters=...):
+  revenue by model      brand, model, price; no filter
+  clean cars 2015-2018  same columns; title_status and year filters
+  one brand             same columns; brand filter
+
+Usage (from Assignment_2/):
+    python -m benchmarks.bench_projection [--scale 100]
+"""
+import argparse
+import tempfile
+import time
+from operator import attrgetter
+
+from benchmarks.datasets import scaled_dataset
+from src.analysis import functional_aggregate, count_and_revenue
+from src.streams import car_sales_stream, equals, between
+
+COLUMNS = ('brand', 'model', 'price')
+
+
+def timed(function):
+    started = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scale", type=int, default=100, help="copies of the sample dataset")
+    parser.add_argument("--brand", default="ford", help="brand for the single-brand query")
+    parser.add_argument("--data-dir", default=tempfile.gettempdir(), help="where the scaled CSV is written")
+    args = parser.parse_args()
+    path = scaled_dataset(args.scale, args.data_dir)
+
+    queries = (
+        ("revenue by model", lambda c: True, None),
+        ("clean cars 2015-2018", lambda c: c.title_status == 'clean vehicle' and 2015 <= c.year <= 2018,
+         lambda: {'title_status': equals('clean vehicle'), 'year': between(2015, 2018)}),
+        (f"brand == {args.brand}", lambda c: c.brand == args.brand,
+         lambda: {'brand': equals(args.brand)}),
+    )
+    print(f"{'query':<22} {'rows':>8} {'full decode':>12} {'pushdown':>10} {'speedup':>8}  same")
+    for name, keep, filters in queries:
+        full, full_time = timed(lambda: functional_aggregate(
+            (c for c in car_sales_stream(path) if keep(c)), attrgetter('full_name'), count_and_revenue))
+        pushed, pushed_time = timed(lambda: functional_aggregate(
+            car_sales_stream(path, columns=COLUMNS, filters=filters() if filters else None),
+            attrgetter('full_name'), count_and_revenue))
+        rows = int(sum(v['count'] for v in full.values()))
+        same = pushed.keys() == full.keys() and all(pushed[k]['count'] == v['count'] for k, v in full.items())
+        print(f"{name:<22} {rows:>8,} {full_time:>11.3f}s {pushed_time:>9.3f}s "
+              f"{full_time / pushed_time:>7.1f}x  {same}")
+
+
+if __name__ == "__main__":
+    main()
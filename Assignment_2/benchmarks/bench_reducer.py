@@ -0,0 +1,83 @@
+"""
+Reducer cost: original functional_aggregate vs in-place accumulators.
+
+Loads the sample dataset scaled up (40x by default, ~100k rows) into memory
+once, then groups price by model with:
+
+  original    the first functional_aggregate reducer (new dict per row)
+  aggregate   functional_aggregate updating its accumulator in place
+  accumulate  functional_accumulate (parallel arrays per key id, no per-row dicts),
+              reporting count/sum/min/max/mean
+
+Reports rows/sec and the peak memory allocated during the reduce (tracemalloc).
+
+Usage (from Assignment_2/):
+    python -m benchmarks.bench_reducer [--scale 40]
+"""
+import argparse
+import gc
+import tempfile
+import time
+import tracemalloc
+from functools import reduce
+
+from benchmarks.datasets import scaled_dataset
+from src.analysis import functional_aggregate, functional_accumulate
+from src.streams import car_sales_stream
+
+
+def original_aggregate(stream, key_selector, value_mapper):
+    # The reducer as first written, kept here as the baseline
+    def reducer(acc, item):
+        key = key_selector(item)
+        values = value_mapper(item)
+        current = acc.get(key, {'count': 0.0, 'revenue': 0.0})
+        acc[key] = {
+            'count': current['count'] + values.get('count', 0),
+            'revenue': current['revenue'] + values.get('revenue', 0.0)
+        }
+        return acc
+    return reduce(reducer, stream, {})
+
+
+def measure(function, rows, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        function(rows)
+        best = min(best, time.perf_counter() - started)
+    gc.collect()
+    tracemalloc.start()
+    function(rows)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scale", type=int, default=40, help="copies of the sample dataset")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--data-dir", default=tempfile.gettempdir(), help="where the scaled CSV is written")
+    args = parser.parse_args()
+
+    rows = list(car_sales_stream(scaled_dataset(args.scale, args.data_dir)))
+    reducers = {
+        "original": lambda data: original_aggregate(
+            data, lambda c: c.full_name, lambda c: {'count': 1, 'revenue': c.price}),
+        "aggregate": lambda data: functional_aggregate(
+            data, lambda c: c.full_name, lambda c: {'count': 1, 'revenue': c.price}),
+        "accumulate": lambda data: functional_accumulate(
+            data, lambda c: c.full_name, lambda c: c.price).result(),
+    }
+
+    print(f"{len(rows):,} rows in memory")
+    print(f"{'reducer':<12} {'rows/sec':>12} {'peak alloc':>12}")
+    for name, function in reducers.items():
+        elapsed, peak = measure(function, rows, args.repeat)
+        print(f"{name:<12} {len(rows) / elapsed:>12,.0f} {peak / 2**10:>10.1f}KiB")
+
+
+if __name__ == "__main__":
+    main()
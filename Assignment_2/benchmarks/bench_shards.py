@@ -0,0 +1,79 @@
+"""
+Wall-clock of multi-file input as the same rows are split into more shards.
+
+The sample dataset scaled up (100x by default) is cut into 1/4/16/64 shard
+files, plain and gzip-compressed. Each layout is aggregated (revenue by
+model) three ways:
+  sequential   car_sales_stream(glob, readers=1)
+  threads      car_sales_stream(glob, readers=N): concurrent read/decompress
+  processes    parallel_aggregate(glob, workers=N): one task per shard
+
+Usage (from Assignment_2/):
+    python -m benchmarks.bench_shards [--scale 100] [--readers 4]
+"""
+import argparse
+import gzip
+import os
+import shutil
+import tempfile
+import time
+from operator import attrgetter
+
+from benchmarks.datasets import scaled_dataset
+from src.analysis import functional_aggregate, count_and_revenue
+from src.parallel import parallel_aggregate
+from src.streams import car_sales_stream
+
+
+def write_shards(source: str, directory: str, shards: int, compress: bool) -> str:
+    # Splits `source` round-robin into `shards` files and returns their glob pattern
+    with open(source, encoding='utf-8') as f:
+        header = f.readline()
+        rows = f.readlines()
+    suffix = ".csv.gz" if compress else ".csv"
+    for shard in range(shards):
+        opener = gzip.open if compress else open
+        with opener(os.path.join(directory, f"day-{shard:03d}{suffix}"), 'wt', encoding='utf-8') as out:
+            out.write(header)
+            out.writelines(rows[shard::shards])
+    return os.path.join(directory, f"day-*{suffix}")
+
+
+def timed(function):
+    started = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scale", type=int, default=100, help="copies of the sample dataset")
+    parser.add_argument("--shards", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--readers", type=int, default=4, help="reader threads / worker processes")
+    parser.add_argument("--data-dir", default=tempfile.gettempdir(), help="where the scaled CSV is written")
+    args = parser.parse_args()
+    source = scaled_dataset(args.scale, args.data_dir)
+
+    print(f"{os.cpu_count()} CPU(s), {args.readers} readers/workers\n")
+    print(f"{'layout':<14} {'sequential':>11} {'threads':>9} {'processes':>10}")
+    for compress in (False, True):
+        for shards in args.shards:
+            directory = tempfile.mkdtemp()
+            try:
+                pattern = write_shards(source, directory, shards, compress)
+                sequential, sequential_time = timed(lambda: functional_aggregate(
+                    car_sales_stream(pattern, readers=1), attrgetter('full_name'), count_and_revenue))
+                threaded, threads_time = timed(lambda: functional_aggregate(
+                    car_sales_stream(pattern, readers=args.readers), attrgetter('full_name'), count_and_revenue))
+                processes, processes_time = timed(lambda: parallel_aggregate(
+                    pattern, attrgetter('full_name'), count_and_revenue, workers=args.readers))
+            finally:
+                shutil.rmtree(directory)
+            counts = [{k: v['count'] for k, v in r.items()} for r in (sequential, threaded, processes)]
+            same = "" if counts[0] == counts[1] == counts[2] else "  (results differ!)"
+            layout = f"{shards} x {'gz' if compress else 'csv'}"
+            print(f"{layout:<14} {sequential_time:>10.3f}s {threads_time:>8.3f}s {processes_time:>9.3f}s{same}")
+
+
+if __name__ == "__main__":
+    main()
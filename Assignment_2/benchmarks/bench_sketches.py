@@ -0,0 +1,99 @@
+"""
+Accuracy and memory of the streaming sketches vs exact answers.
+
+Over the sample dataset scaled up (40x by default, ~100k rows):
+  top-5 models by units   SpaceSaving(epsilon)     vs Counter
+  distinct ids / models   HyperLogLog(error)       vs set
+  price/mileage quantiles QuantileSketch(rel_err)  vs sorted list
+Memory is the tracemalloc peak while each structure is built from
+the already-loaded column values.
+
+Usage (from Assignment_2/):
+    python -m benchmarks.bench_sketches [--scale 40]
+"""
+import argparse
+import gc
+import tempfile
+import tracemalloc
+from collections import Counter
+
+from benchmarks.datasets import scaled_dataset
+from src.sketches import HyperLogLog, QuantileSketch, SpaceSaving
+from src.streams import car_sales_stream
+
+
+def traced(build):
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak
+
+
+def space_saving(keys, epsilon):
+    sketch = SpaceSaving(epsilon=epsilon)
+    for key in keys:
+        sketch.update(key)
+    return sketch
+
+
+def hyperloglog(values, error):
+    sketch = HyperLogLog(error=error)
+    sketch.update(values)
+    return sketch
+
+
+def quantiles(values, error):
+    sketch = QuantileSketch(relative_error=error)
+    sketch.update(values)
+    return sketch
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scale", type=int, default=40, help="copies of the sample dataset")
+    parser.add_argument("--epsilon", type=float, default=0.01, help="SpaceSaving error (fraction of rows)")
+    parser.add_argument("--hll-error", type=float, default=0.02, help="HyperLogLog standard error")
+    parser.add_argument("--quantile-error", type=float, default=0.01, help="QuantileSketch relative error")
+    parser.add_argument("--data-dir", default=tempfile.gettempdir(), help="where the scaled CSV is written")
+    args = parser.parse_args()
+
+    cars = list(car_sales_stream(scaled_dataset(args.scale, args.data_dir)))
+    models = [c.full_name for c in cars]
+    ids = [str(c.id) for c in cars]
+    print(f"{len(cars):,} rows\n")
+
+    exact, exact_mem = traced(lambda: Counter(models))
+    sketch, sketch_mem = traced(lambda: space_saving(models, args.epsilon))
+    print(f"Top-5 models (SpaceSaving epsilon={args.epsilon}, exact {exact_mem / 2**10:.0f} KiB, "
+          f"sketch {sketch_mem / 2**10:.0f} KiB)")
+    for (key, true_count), (s_key, s_count, s_error) in zip(exact.most_common(5), sketch.top(5)):
+        print(f"  {key:<22} {true_count:>7}   {s_key:<22} {s_count:>7.0f} (+<= {s_error:.0f})")
+
+    print(f"\nDistinct values (HyperLogLog error={args.hll_error})")
+    for name, values in (("ids", ids), ("models", models)):
+        exact, exact_mem = traced(lambda: len(set(values)))
+        sketch, sketch_mem = traced(lambda: hyperloglog(values, args.hll_error))
+        estimate = sketch.count()
+        print(f"  {name:<8} exact {exact:>8,} ({exact_mem / 2**10:>6.0f} KiB)   "
+              f"estimate {estimate:>10,.0f} ({sketch_mem / 2**10:>4.0f} KiB)  "
+              f"error {abs(estimate - exact) / exact:.2%}")
+
+    print(f"\nQuantiles (QuantileSketch relative_error={args.quantile_error})")
+    for name, values in (("price", [c.price for c in cars]), ("mileage", [c.mileage for c in cars])):
+        ordered, exact_mem = traced(lambda: sorted(values))
+        sketch, sketch_mem = traced(lambda: quantiles(values, args.quantile_error))
+        worst = 0.0
+        for q in (0.5, 0.9, 0.99):
+            true = ordered[int(q * (len(ordered) - 1))]
+            estimate = sketch.quantile(q)
+            if true:
+                worst = max(worst, abs(estimate - true) / true)
+            print(f"  {name:<8} p{int(q * 100):<3} exact {true:>10,.0f}  estimate {estimate:>10,.0f}")
+        print(f"  {name:<8} worst relative error {worst:.2%}, exact {exact_mem / 2**10:.0f} KiB, "
+              f"sketch {sketch_mem / 2**10:.0f} KiB ({len(sketch.buckets)} buckets)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+CSV parsing vs the mmap-backed binary snapshot.
+
+On the sample dataset scaled up (200x by default), times:
+  csv       functional_aggregate(car_sales_stream(csv))
+  write     write_snapshot(csv) (one-off conversion)
+  open      Snapshot(path) (header only, columns are mapped lazily)
+  rows      functional_aggregate(snapshot.rows()) with the same lambdas
+  columns   snapshot_aggregate(snapshot) over the code/price columns
+
+Usage (from Assignment_2/):
+    python -m benchmarks.bench_snapshot [--scale 200]
+"""
+import argparse
+import os
+import tempfile
+import time
+from operator import attrgetter
+
+from benchmarks.datasets import scaled_dataset
+from src.analysis import functional_aggregate, count_and_revenue
+from src.snapshot import Snapshot, snapshot_aggregate, write_snapshot
+from src.streams import car_sales_stream
+
+
+def timed(function):
+    started = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scale", type=int, default=200, help="copies of the sample dataset")
+    parser.add_argument("--data-dir", default=tempfile.gettempdir(), help="where the scaled CSV is written")
+    args = parser.parse_args()
+
+    csv_path = scaled_dataset(args.scale, args.data_dir)
+    snapshot_path = os.path.join(args.data_dir, f"car_sales_x{args.scale}.snap")
+
+    expected, csv_time = timed(lambda: functional_aggregate(
+        car_sales_stream(csv_path), attrgetter('full_name'), count_and_revenue))
+    _, write_time = timed(lambda: write_snapshot(csv_path, snapshot_path))
+    snapshot, open_time = timed(lambda: Snapshot(snapshot_path))
+    with snapshot:
+        by_rows, rows_time = timed(lambda: functional_aggregate(
+            snapshot.rows(), attrgetter('full_name'), count_and_revenue))
+        by_columns, columns_time = timed(lambda: snapshot_aggregate(snapshot))
+        rows = len(snapshot)
+
+    print(f"{rows:,} rows, CSV {os.path.getsize(csv_path) / 2**20:.1f} MiB, "
+          f"snapshot {os.path.getsize(snapshot_path) / 2**20:.1f} MiB\n")
+    print(f"{'csv':<8} {csv_time:>8.3f}s  {rows / csv_time:>12,.0f} rows/s")
+    print(f"{'write':<8} {write_time:>8.3f}s")
+    print(f"{'open':<8} {open_time * 1000:>8.3f}ms")
+    for name, result, seconds in (("rows", by_rows, rows_time), ("columns", by_columns, columns_time)):
+        same = result.keys() == expected.keys() and all(
+            result[k]['count'] == v['count'] for k, v in expected.items())
+        print(f"{name:<8} {seconds:>8.3f}s  {rows / seconds:>12,.0f} rows/s  "
+              f"{csv_time / seconds:>5.1f}x vs csv  same result: {same}")
+
+
+if __name__ == "__main__":
+    main()
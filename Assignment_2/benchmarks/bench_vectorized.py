@@ -0,0 +1,56 @@
+"""
+functional_aggregate vs vectorized_aggregate (python and numpy backends).
+
+On the sample dataset scaled up (200x by default), the columns are loaded
+once; each run then aggregates revenue by model:
+  functional   functional_aggregate over CarSale rows (two lambdas per row)
+  python       vectorized_aggregate(backend='python')
+  numpy        vectorized_aggregate(backend='numpy'), if numpy is installed
+
+Usage (from Assignment_2/):
+    python -m benchmarks.bench_vectorized [--scale 200]
+"""
+import argparse
+import math
+import tempfile
+import time
+from operator import attrgetter
+
+from benchmarks.datasets import scaled_dataset
+from src import analysis
+from src.analysis import functional_aggregate, count_and_revenue, vectorized_aggregate
+from src.columnar import car_sales_chunks
+
+
+def timed(function):
+    started = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scale", type=int, default=200, help="copies of the sample dataset")
+    parser.add_argument("--data-dir", default=tempfile.gettempdir(), help="where the scaled CSV is written")
+    args = parser.parse_args()
+
+    chunks, load_time = timed(lambda: list(car_sales_chunks(scaled_dataset(args.scale, args.data_dir))))
+    rows = sum(len(chunk) for chunk in chunks)
+    print(f"{rows:,} rows loaded into columns in {load_time:.3f}s\n")
+
+    expected, functional_time = timed(lambda: functional_aggregate(
+        (car for chunk in chunks for car in chunk.rows()), attrgetter('full_name'), count_and_revenue))
+    print(f"{'functional':<11} {functional_time:>7.3f}s")
+    backends = ['python'] + (['numpy'] if analysis.np is not None else [])
+    for backend in backends:
+        result, seconds = timed(lambda: vectorized_aggregate(chunks, backend=backend))
+        same = result.keys() == expected.keys() and all(
+            result[k]['count'] == v['count'] and math.isclose(result[k]['revenue'], v['revenue'])
+            for k, v in expected.items())
+        print(f"{backend:<11} {seconds:>7.3f}s  {functional_time / seconds:>5.1f}x  same result: {same}")
+    if analysis.np is None:
+        print("numpy is not installed; skipped the numpy backend")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Helpers that build larger copies of data/Car_sales_dataset.csv for benchmarks.
+
+scaled_dataset() repeats the sample rows; synthetic_dataset() draws any
+number of rows (10k to 100M+) from the sample's value distributions with a
+fixed seed, so the same seed always gives the same file. Written in batches,
+memory stays flat; generation takes about 4s per million rows.
+
+Usage (from Assignment_2/):
+    python -m benchmarks.datasets --rows 1000000 [--seed 0] [--gzip] [--data-dir DIR]
+"""
+import argparse
+import csv
+import gzip
+import os
+import random
+import tempfile
+from collections import Counter
+
+DATA_PATH = os.path.join("data", "Car_sales_dataset.csv")
+
+SYNTHETIC_HEADER = "id,price,brand,model,year,title_status,mileage,color\n"
+# Rows generated and written per batch
+BATCH_ROWS = 100_000
+
+
+def scaled_dataset(factor: int, directory: str, source: str = DATA_PATH) -> str:
+    # Writes `factor` copies of the source rows (with fresh ids) and returns the path.
+    # Reuses an existing file of the same scale.
+    path = os.path.join(directory, f"car_sales_x{factor}.csv")
+    if os.path.exists(path):
+        return path
+
+    with open(source, encoding='utf-8') as f:
+        header = f.readline().rstrip('\r\n')
+        # Drop the id column; it is rewritten so ids stay unique
+        rows = [line.rstrip('\r\n').split(',', 1)[1] for line in f if line.strip()]
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as out:
+        out.write(header + '\n')
+        next_id = 0
+        for _ in range(factor):
+            out.write(''.join(f"{next_id + i},{row}\n" for i, row in enumerate(rows)))
+            next_id += len(rows)
+    os.replace(tmp_path, path)
+    return path
+
+
+def synthetic_dataset(rows: int, directory: str, seed: int = 0, compress: bool = False,
+                      invalid_rate: float = 0.001, source: str = DATA_PATH) -> str:
+    # Writes `rows` synthetic rows (see generate_car_sales) and returns the path.
+    # Reuses an existing file of the same size, seed and compression.
+    suffix = ".csv.gz" if compress else ".csv"
+    path = os.path.join(directory, f"car_sales_synthetic_{rows}_seed{seed}{suffix}")
+    if os.path.exists(path):
+        return path
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = path + ".tmp"
+    generate_car_sales(tmp_path, rows, seed, compress, invalid_rate, source)
+    os.replace(tmp_path, path)
+    return path
+
+
+def generate_car_sales(path: str, rows: int, seed: int = 0, compress: bool = False,
+                       invalid_rate: float = 0.001, source: str = DATA_PATH) -> None:
+
+    # Each column is drawn independently from its frequencies in `source`:
+    # (brand, model) as one pair so every model keeps its brand, the numeric
+    # columns from their raw texts. A share of `invalid_rate` rows gets the
+    # price "INVALID", exercising the skip path of the loaders.
+    if rows < 0 or not 0 <= invalid_rate < 1:
+        raise ValueError("rows must be >= 0 and invalid_rate in [0, 1)")
+    with open(source, encoding='utf-8', newline='') as f:
+        sample = [row for row in csv.DictReader(f) if _valid(row)]
+    columns = {
+        'price': Counter(row['price'] for row in sample),
+        'vehicle': Counter(f"{row['brand']},{row['model']}" for row in sample),
+        'year': Counter(row['year'] for row in sample),
+        'title_status': Counter(row['title_status'] for row in sample),
+        'mileage': Counter(row['mileage'] for row in sample),
+        'color': Counter(row['color'] for row in sample),
+    }
+    if invalid_rate:
+        columns['price']["INVALID"] = len(sample) * invalid_rate / (1 - invalid_rate)
+    # Sorted so the draw does not depend on the sample's row order
+    tables = {}
+    for name, counts in columns.items():
+        values = sorted(counts)
+        weights, total = [], 0.0
+        for value in values:
+            total += counts[value]
+            weights.append(total)
+        tables[name] = (values, weights)
+
+    rng = random.Random(seed)
+    opener = gzip.open if compress else open
+    with opener(path, 'wt', encoding='utf-8', newline='') as out:
+        out.write(SYNTHETIC_HEADER)
+        for start in range(0, rows, BATCH_ROWS):
+            size = min(BATCH_ROWS, rows - start)
+            drawn = [rng.choices(values, cum_weights=weights, k=size) for values, weights in tables.values()]
+            out.write(''.join(f"{start + i},{price},{vehicle},{year},{status},{mileage},{color}\n"
+                              for i, (price, vehicle, year, status, mileage, color) in enumerate(zip(*drawn))))
+
+
+def _valid(row) -> bool:
+    # Sample rows the loaders would accept (numeric fields parse)
+    try:
+        int(row['year'])
+        float(row['price'])
+        float(row['mileage'])
+    except (TypeError, ValueError):
+        return False
+    return all(row.get(name) is not None for name in ('brand', 'model', 'title_status', 'color'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, required=True)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--gzip", action="store_true", help="write a .csv.gz file")
+    parser.add_argument("--invalid-rate", type=float, default=0.001, help="share of rows with a bad price")
+    parser.add_argument("--data-dir", default=tempfile.gettempdir(), help="where the file is written")
+    args = parser.parse_args()
+    print(synthetic_dataset(args.rows, args.data_dir, args.seed, args.gzip, args.invalid_rate))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Opt-in cProfile / tracemalloc run of main.py.
+
+Runs main.py unchanged, as if started with `python main.py [source]`, with
+the profilers switched on around it. Arguments after the options are passed
+to main.py (e.g. a synthetic CSV from benchmarks.datasets or a shard glob).
+cProfile only sees the main thread; pass --all-threads when a glob source
+makes car_sales_stream read shards on reader threads.
+
+Usage (from Assignment_2/):
+    python -m benchmarks.profile_main --cprofile [--tracemalloc] [--top 25] [path-or-glob]
+"""
+import argparse
+import cProfile
+import pstats
+import runpy
+import sys
+import threading
+import time
+import tracemalloc
+
+MAIN_PATH = "main.py"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cprofile", action="store_true", help="profile with cProfile")
+    parser.add_argument("--all-threads", action="store_true", help="also profile threads started by main.py")
+    parser.add_argument("--sort", default="cumulative", help="pstats sort key")
+    parser.add_argument("--top", type=int, default=25, help="functions / allocation sites to list")
+    parser.add_argument("--stats-file", help="also dump the raw cProfile stats here")
+    parser.add_argument("--tracemalloc", action="store_true", help="trace memory allocations")
+    parser.add_argument("--frames", type=int, default=1, help="traceback depth kept by tracemalloc")
+    parser.add_argument("main_args", nargs=argparse.REMAINDER, help="arguments for main.py")
+    args = parser.parse_args()
+
+    profiles = []
+    if args.cprofile:
+        profiles.append(cProfile.Profile())
+        if args.all_threads:
+            def profile_new_thread(frame, event, arg):
+                # First profiler event of a new thread: replace this hook with a profiler of its own
+                profile = cProfile.Profile()
+                profiles.append(profile)
+                profile.enable()
+            threading.setprofile(profile_new_thread)
+    if args.tracemalloc:
+        tracemalloc.start(args.frames)
+
+    started = time.perf_counter()
+    sys.argv = [MAIN_PATH] + args.main_args
+    if profiles:
+        profiles[0].enable()
+    try:
+        runpy.run_path(MAIN_PATH, run_name="__main__")
+    except SystemExit:
+        pass
+    finally:
+        threading.setprofile(None)
+        if profiles:
+            profiles[0].disable()
+    elapsed = time.perf_counter() - started
+    if args.tracemalloc:
+        # Taken before any reporting, so only main.py's allocations are counted
+        current, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+    print(f"\nmain.py finished in {elapsed:.3f}s")
+
+    if profiles:
+        stats = pstats.Stats(profiles[0])
+        for profile in profiles[1:]:
+            stats.add(profile)
+        if args.stats_file:
+            stats.dump_stats(args.stats_file)
+            print(f"cProfile stats written to {args.stats_file}")
+        stats.sort_stats(args.sort).print_stats(args.top)
+    if args.tracemalloc:
+        print(f"tracemalloc: current {current / 2**10:,.0f} KiB, peak {peak / 2**10:,.0f} KiB")
+        for stat in snapshot.statistics('traceback' if args.frames > 1 else 'lineno')[:args.top]:
+            print(f"  {stat}")
+
+
+if __name__ == "__main__":
+    main()
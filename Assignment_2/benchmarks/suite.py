@@ -0,0 +1,83 @@
+"""
+Parse and aggregation throughput suite with JSON results and a stored baseline.
+
+Generates reproducible synthetic CSVs (benchmarks/datasets.py) of each
+--rows size and measures rows/sec, best of --repeat runs, for:
+  stream            car_sales_stream (full CarSale decode)
+  stream_projected  car_sales_stream(columns=brand/model/price)
+  chunks            car_sales_chunks (columnar loader)
+  aggregate         functional_aggregate over car_sales_stream
+  vectorized_<b>    vectorized_aggregate with the default backend <b>
+Results can be written as JSON and are compared with
+benchmarks/baseline.json: a case more than --tolerance slower than its
+baseline (also after one re-measurement) is a regression (exit status 1).
+
+Usage (from Assignment_2/):
+    python -m benchmarks.suite [--rows 10000 100000] [--output results.json] [--save-baseline]
+"""
+import argparse
+import os
+import tempfile
+import time
+from operator import attrgetter
+from typing import Callable, Dict
+
+from benchmarks.datasets import synthetic_dataset
+from benchmarks.regression import add_baseline_arguments, check_baseline, make_report
+from src import analysis
+from src.analysis import functional_aggregate, count_and_revenue, vectorized_aggregate
+from src.columnar import car_sales_chunks
+from src.streams import car_sales_stream
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+def _drain(iterable) -> None:
+    for _ in iterable:
+        pass
+
+
+def suite_cases() -> Dict[str, Callable[[str], object]]:
+    backend = 'numpy' if analysis.np is not None else 'python'
+    return {
+        "stream": lambda path: _drain(car_sales_stream(path)),
+        "stream_projected": lambda path: _drain(car_sales_stream(path, columns=('brand', 'model', 'price'))),
+        "chunks": lambda path: _drain(car_sales_chunks(path)),
+        "aggregate": lambda path: functional_aggregate(
+            car_sales_stream(path), attrgetter('full_name'), count_and_revenue),
+        f"vectorized_{backend}": lambda path: vectorized_aggregate(car_sales_chunks(path)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 100000], help="dataset sizes")
+    parser.add_argument("--seed", type=int, default=0, help="synthetic data seed")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case; the best is kept")
+    add_baseline_arguments(parser, BASELINE_PATH)
+    parser.add_argument("--data-dir", default=tempfile.gettempdir(), help="where the synthetic CSVs are written")
+    args = parser.parse_args()
+
+    paths = {rows: synthetic_dataset(rows, args.data_dir, args.seed) for rows in args.rows}
+    cases = {f"{name}/{rows}": (run, rows) for rows in args.rows for name, run in suite_cases().items()}
+
+    def measure(name: str) -> float:
+        run, rows = cases[name]
+        best = float('inf')
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            run(paths[rows])
+            best = min(best, time.perf_counter() - started)
+        return rows / best
+
+    results = {}
+    for name in cases:
+        results[name] = measure(name)
+        print(f"{name:<28} {results[name]:>12,.0f} rows/s")
+
+    report = make_report("car_sales_throughput", "rows/s", {"seed": args.seed, "repeat": args.repeat}, results)
+    check_baseline(report, args, measure)
+
+
+if __name__ == "__main__":
+    main()
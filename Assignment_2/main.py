@@ -1,25 +1,52 @@
 import os
+import argparse
 from src.streams import car_sales_stream
-from src.analysis import functional_aggregate, get_max_entry
+from src.multi_query import Query, multi_aggregate
+from src.cache import cached_multi_aggregate
 
 DATA_PATH = os.path.join("data", "Car_sales_dataset.csv")
 
 def main():
+    parser = argparse.ArgumentParser(description="Functional Car Sales Analysis")
+    # An optional argument replaces the sample file: a CSV path, or a quoted
+    # glob of daily shards such as "data/sales-*.csv.gz".
+    parser.add_argument("source", nargs="?", default=DATA_PATH, help="CSV file or glob of shards")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="always re-read the data instead of using data/.aggregate_cache")
+    args = parser.parse_args()
+
     print("--- Functional Car Sales Analysis ---\n")
-    
-    # Initialize Stream
-    # We create the stream generator. No data is read yet (Lazy Evaluation).
-    stream = car_sales_stream(DATA_PATH)
-    
+
+    # One pass computes everything: per-model units and revenue, a running
+    # top-1 by units and by revenue, and the revenue total.
+    full_name = lambda c: c.full_name   # Group by "Brand Model"
+    price = lambda c: c.price           # Revenue of one sale
+    # Same selectors, so both queries share one accumulator
+    queries = {
+        'by_units': Query(full_name, price, metrics=('count', 'sum'), top_k=1, rank_by='count'),
+        'by_revenue': Query(full_name, price, metrics=(), top_k=1, rank_by='sum'),
+    }
+    totals = {'revenue': price}
+
     # Execute Aggregation
-    sales_map = functional_aggregate(
-        stream,
-        key_selector=lambda c: c.full_name,              # Group by "Brand Model"
-        value_mapper=lambda c: {'count': 1, 'revenue': c.price}  # Extract 1 unit and price
-    )
-    
-    # Calculate Global Stats
-    total_revenue = sum(map(lambda x: x['revenue'], sales_map.values()))
+    if args.no_cache:
+        # We create the stream generator. No data is read yet (Lazy Evaluation).
+        stream = car_sales_stream(args.source)
+        result = multi_aggregate(stream, queries, totals)
+    else:
+        # Repeat runs over unchanged data are served from the on-disk cache
+        result = cached_multi_aggregate(args.source, queries, totals)
+    sales_map = result.groups['by_units']
+
+    def leader(query: str) -> tuple:
+        # The top-1 model of a query, with its units and revenue
+        if not result.top[query]:
+            return ("None", {'count': 0, 'sum': 0.0})
+        model = result.top[query][0][0]
+        return model, sales_map[model]
+
+    # Global Stats
+    total_revenue = result.totals['revenue']['sum']
     total_models = len(sales_map)
     
     print(f"Global Stats:")
@@ -28,29 +55,22 @@ def main():
     print("-" * 50)
 
     # Most Selling Car (by Quantity)
-    # We pass a lambda to define "Most Selling" as "highest count"
-    best_seller, seller_stats = get_max_entry(
-        sales_map, 
-        comparator=lambda x: x['count']
-    )
+    best_seller, seller_stats = leader('by_units')
     
     print(f"1. Most Selling Car (Quantity):")
     print(f"   • Model: {best_seller}")
-    print(f"   • Units: {seller_stats['count']}")
-    print(f"   • Rev:   ${seller_stats['revenue']:,.2f}")
+    print(f"   • Units: {float(seller_stats['count'])}")
+    print(f"   • Rev:   ${seller_stats['sum']:,.2f}")
     
     # Most Profitable Car (by Revenue)
-    most_profit, profit_stats = get_max_entry(
-        sales_map, 
-        comparator=lambda x: x['revenue']
-    )
+    most_profit, profit_stats = leader('by_revenue')
     
-    percentage = (profit_stats['revenue'] / total_revenue * 100) if total_revenue else 0
+    percentage = (profit_stats['sum'] / total_revenue * 100) if total_revenue else 0
     
     print(f"\n2. Most Profitable Car (Revenue):")
     print(f"   • Model: {most_profit}")
-    print(f"   • Units: {profit_stats['count']}")
-    print(f"   • Rev:   ${profit_stats['revenue']:,.2f}")
+    print(f"   • Units: {float(profit_stats['count'])}")
+    print(f"   • Rev:   ${profit_stats['sum']:,.2f}")
     print(f"   • Share: {percentage:.2f}% of total market revenue")
 
 if __name__ == "__main__":
@@ -1,6 +1,16 @@
+import math
+from array import array
 from functools import reduce
-from typing import Iterator, Dict, Callable, Any, TypeVar
+from operator import itemgetter
+from typing import Iterable, Iterator, Dict, Callable, Any, TypeVar, List, Optional, Sequence, Tuple
 from src.models import CarSale
+from src.columnar import CarSalesChunk, StringDictionary, COLUMN_TYPECODES, STRING_COLUMNS
+
+try:
+    # Optional: vectorized_aggregate uses it when installed
+    import numpy as np
+except ImportError:
+    np = None
 
 # Generic type var to allow this to work with any object, not just Cars
 T = TypeVar('T')
@@ -25,19 +35,281 @@ def functional_aggregate(
         key = key_selector(item)
         values = value_mapper(item)
         
-        # Get existing state or initialize defaults
-        current = acc.get(key, {'count': 0.0, 'revenue': 0.0})
+        # Get existing state or initialize defaults.
+        # The accumulator is private to this reduce, so it is updated in place
+        # instead of building a new dict for every row.
+        current = acc.get(key)
+        if current is None:
+            current = acc[key] = {'count': 0.0, 'revenue': 0.0}
         
         # Aggregate logic
-        acc[key] = {
-            'count': current['count'] + values.get('count', 0),
-            'revenue': current['revenue'] + values.get('revenue', 0.0)
-        }
+        current['count'] += values.get('count', 0)
+        current['revenue'] += values.get('revenue', 0.0)
         return acc
 
     # Reduce the entire stream into a single dictionary
     return reduce(reducer, stream, {})
 
+# Metrics GroupedAccumulator can report for every key
+METRICS = ('count', 'sum', 'min', 'max', 'mean')
+
+class GroupedAccumulator:
+    """
+    In-place accumulator for count/sum/min/max per key.
+
+    Each key gets an integer id on first sight; the running values live in
+    parallel typed arrays indexed by that id, so adding a value allocates
+    nothing once the key is known. Two accumulators merge associatively,
+    so partial results (e.g. per file range) can be combined.
+    """
+    def __init__(self):
+        self.key_ids: Dict[str, int] = {}
+        self.keys: List[str] = []
+        self.count = array('q')
+        self.sum = array('d')
+        self.min = array('d')
+        self.max = array('d')
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def add_key(self, key: str, value: float) -> None:
+        # First value of a key that is not in the accumulator yet
+        self.key_ids[key] = len(self.keys)
+        self.keys.append(key)
+        self.count.append(1)
+        self.sum.append(value)
+        self.min.append(value)
+        self.max.append(value)
+
+    def add(self, key: str, value: float) -> None:
+        index = self.key_ids.get(key)
+        if index is None:
+            self.add_key(key, value)
+            return
+        self.count[index] += 1
+        self.sum[index] += value
+        if value < self.min[index]:
+            self.min[index] = value
+        if value > self.max[index]:
+            self.max[index] = value
+
+    def merge(self, other: 'GroupedAccumulator') -> 'GroupedAccumulator':
+        # Folds `other` into this accumulator and returns it
+        for index, key in enumerate(other.keys):
+            mine = self.key_ids.get(key)
+            if mine is None:
+                self.add_key(key, other.min[index])
+                mine = self.key_ids[key]
+                self.count[mine] = other.count[index]
+                self.sum[mine] = other.sum[index]
+                self.max[mine] = other.max[index]
+                continue
+            self.count[mine] += other.count[index]
+            self.sum[mine] += other.sum[index]
+            self.min[mine] = min(self.min[mine], other.min[index])
+            self.max[mine] = max(self.max[mine], other.max[index])
+        return self
+
+    def result(self, metrics: Sequence[str] = METRICS) -> Dict[str, Dict[str, float]]:
+        # {key: {metric: value}} for the requested metrics
+        unknown = set(metrics) - set(METRICS)
+        if unknown:
+            raise ValueError(f"Unknown metrics: {sorted(unknown)}")
+        columns = {'count': self.count, 'sum': self.sum, 'min': self.min, 'max': self.max}
+        output = {}
+        for index, key in enumerate(self.keys):
+            stats = {}
+            for metric in metrics:
+                if metric == 'mean':
+                    stats[metric] = self.sum[index] / self.count[index]
+                else:
+                    stats[metric] = columns[metric][index]
+            output[key] = stats
+        return output
+
+def functional_accumulate(
+    stream: Iterator[T],
+    key_selector: Callable[[T], str],
+    value_selector: Callable[[T], float],
+    accumulator: Optional[GroupedAccumulator] = None
+) -> GroupedAccumulator:
+    """
+    Allocation-free counterpart of functional_aggregate.
+
+    Args:
+        stream: The data source.
+        key_selector: Lambda to group data (e.g., lambda c: c.full_name).
+        value_selector: Lambda returning the single number to accumulate (e.g., lambda c: c.price).
+        accumulator: Existing accumulator to continue; a new one by default.
+
+    Call .result(('count', 'sum')) or any of METRICS on the returned accumulator.
+    """
+    acc = accumulator if accumulator is not None else GroupedAccumulator()
+    # add() inlined, with local names, to keep the per-row loop free of calls and attribute lookups
+    key_ids, new_key = acc.key_ids, acc.add_key
+    count, total, low, high = acc.count, acc.sum, acc.min, acc.max
+    for item in stream:
+        key = key_selector(item)
+        value = value_selector(item)
+        index = key_ids.get(key)
+        if index is None:
+            new_key(key, value)
+            continue
+        count[index] += 1
+        total[index] += value
+        if value < low[index]:
+            low[index] = value
+        if value > high[index]:
+            high[index] = value
+    return acc
+
+# Metrics vectorized_aggregate can report; 'revenue' is the sum of the value column
+VECTOR_METRICS = ('count', 'revenue', 'mean', 'min', 'max')
+
+def vectorized_aggregate(
+    chunks: Iterable[CarSalesChunk],
+    key_columns: Sequence[str] = ('brand', 'model'),
+    value_column: str = 'price',
+    metrics: Sequence[str] = ('count', 'revenue'),
+    backend: Optional[str] = None
+) -> Dict[str, Dict[str, float]]:
+    """
+    Column-at-a-time counterpart of functional_aggregate, with no per-row lambdas.
+
+    Args:
+        chunks: Columnar chunks, e.g. car_sales_chunks(path).
+        key_columns: Columns whose values, joined with a space, form the key
+            (the default gives the same keys as CarSale.full_name).
+        value_column: Numeric column summed as 'revenue' (e.g. 'price').
+        metrics: Any of VECTOR_METRICS.
+        backend: 'numpy' or 'python'; numpy when it is installed by default.
+
+    The numpy backend factorizes the key columns into one integer code per row
+    and reduces with np.bincount (count, sum) and np.minimum/maximum.reduceat
+    (min, max). The python backend runs the same grouping through
+    functional_accumulate. With metrics=('count', 'revenue') the result has
+    the {key: {count, revenue}} shape of functional_aggregate.
+    """
+    backend = backend or ('numpy' if np is not None else 'python')
+    if backend not in ('numpy', 'python'):
+        raise ValueError(f"Unknown backend {backend!r}; use 'numpy' or 'python'")
+    if backend == 'numpy' and np is None:
+        raise ImportError("The numpy backend needs numpy installed")
+    unknown = set(metrics) - set(VECTOR_METRICS)
+    if unknown:
+        raise ValueError(f"Unknown metrics: {sorted(unknown)}")
+    if value_column in STRING_COLUMNS:
+        raise ValueError(f"{value_column!r} is not a numeric column")
+
+    columns, dictionaries = _concat_columns(chunks, tuple(key_columns) + (value_column,))
+    groups = (_numpy_groups if backend == 'numpy' else _python_groups)(
+        [columns[name] for name in key_columns],
+        [dictionaries.get(name) for name in key_columns],
+        columns[value_column])
+
+    result: Dict[str, Dict[str, float]] = {}
+    for labels, count, total, low, high in groups:
+        key = " ".join(labels)
+        current = result.get(key)
+        if current is not None:
+            # Different label tuples can join to the same text (e.g. "a b" + "c" vs "a" + "b c")
+            count, total = count + current['count'], total + current['revenue']
+            low, high = min(low, current['min']), max(high, current['max'])
+        result[key] = {'count': float(count), 'revenue': total, 'min': low, 'max': high}
+    for stats in result.values():
+        stats['mean'] = stats['revenue'] / stats['count']
+        for metric in VECTOR_METRICS:
+            if metric not in metrics:
+                del stats[metric]
+    return result
+
+def _concat_columns(chunks: Iterable[CarSalesChunk], names: Sequence[str]) -> Tuple[Dict[str, array], Dict[str, List[str]]]:
+    # Appends the needed columns of every chunk into one array each.
+    # String codes are re-encoded into one dictionary per column, since chunks
+    # of different files (e.g. from sharded_chunks) have their own. The source
+    # dictionaries are only read: a reader thread may still be extending them.
+    columns = {name: array(COLUMN_TYPECODES[name]) for name in names}
+    merged = {name: StringDictionary() for name in names if name in STRING_COLUMNS}
+    # source dictionary -> code translation, and the sources whose codes change
+    tables: Dict[StringDictionary, List[int]] = {}
+    shifted = set()
+    for chunk in chunks:
+        for name in names:
+            values = getattr(chunk, name)
+            if name in merged:
+                source = chunk.dictionaries[name]
+                table = tables.setdefault(source, [])
+                for value in source.values[len(table):]:
+                    code = merged[name].encode(value)
+                    if code != len(table):
+                        shifted.add(source)
+                    table.append(code)
+                if source in shifted:
+                    values = array('i', map(table.__getitem__, values))
+            columns[name].extend(values)
+    return columns, {name: dictionary.values for name, dictionary in merged.items()}
+
+def _python_groups(keys: List[array], dictionaries: List[Optional[List[str]]], values: array) -> Iterator[Tuple]:
+    # (labels, count, sum, min, max) per distinct key tuple
+    acc = functional_accumulate(zip(zip(*keys), values), itemgetter(0), itemgetter(1))
+    for index, key in enumerate(acc.keys):
+        labels = [str(part) if names is None else names[part] for part, names in zip(key, dictionaries)]
+        yield labels, acc.count[index], acc.sum[index], acc.min[index], acc.max[index]
+
+def _numpy_groups(keys: List[array], dictionaries: List[Optional[List[str]]], values: array) -> Iterator[Tuple]:
+    # Same as _python_groups, one vectorized pass per metric
+    # array typecodes ('d', 'i', 'q') double as numpy dtype codes
+    values = np.frombuffer(values, dtype=values.typecode).astype(np.float64)
+    if not len(values):
+        return
+
+    # Per column: row codes in [0, size) and the label of each code
+    codes, labels = [], []
+    for column, names in zip(keys, dictionaries):
+        column = np.frombuffer(column, dtype=column.typecode)
+        if names is None:
+            uniques, column = np.unique(column, return_inverse=True)
+            names = [str(value) for value in uniques.tolist()]
+        codes.append(column.astype(np.int64))
+        labels.append(names)
+
+    # One mixed-radix code per row, or unique rows if that would overflow int64
+    sizes = [max(len(names), 1) for names in labels]
+    if math.prod(sizes) < 2 ** 62:
+        combined = np.zeros(len(values), dtype=np.int64)
+        for column, size in zip(codes, sizes):
+            combined = combined * size + column
+        group_codes, inverse = np.unique(combined, return_inverse=True)
+        group_keys = []
+        for code in group_codes.tolist():
+            parts = []
+            for size in reversed(sizes):
+                code, part = divmod(code, size)
+                parts.append(part)
+            group_keys.append(parts[::-1])
+    else:
+        group_rows, inverse = np.unique(np.stack(codes, axis=1), axis=0, return_inverse=True)
+        group_keys = group_rows.tolist()
+    inverse = inverse.reshape(-1)
+
+    counts = np.bincount(inverse, minlength=len(group_keys))
+    sums = np.bincount(inverse, weights=values, minlength=len(group_keys))
+    # min/max: sort rows by group, then reduce each contiguous run
+    ordered = values[np.argsort(inverse, kind='stable')]
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    mins = np.minimum.reduceat(ordered, starts)
+    maxs = np.maximum.reduceat(ordered, starts)
+
+    for index, parts in enumerate(group_keys):
+        yield ([names[part] for names, part in zip(labels, parts)],
+               int(counts[index]), float(sums[index]), float(mins[index]), float(maxs[index]))
+
+def count_and_revenue(car: CarSale) -> Dict[str, float]:
+    # Named equivalent of lambda c: {'count': 1, 'revenue': c.price}.
+    # Module-level functions can be pickled, so this one also works with parallel_aggregate.
+    return {'count': 1, 'revenue': car.price}
+
 def get_max_entry(
     data: Dict[str, Dict[str, float]], 
     comparator: Callable[[dict], float]
@@ -0,0 +1,309 @@
+import os
+import json
+import time
+import pickle
+import types
+import hashlib
+import logging
+import functools
+from typing import Callable, Dict, Optional, Set, Tuple
+from src.models import CarSale
+from src.streams import car_sales_stream
+from src.shards import Source, expand_paths
+from src.analysis import functional_aggregate
+from src.multi_query import MultiQueryResult, Query, multi_aggregate
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join("data", ".aggregate_cache")
+INDEX_FILE = "index.json"
+HASH_BLOCK_BYTES = 1 << 20
+
+
+def file_fingerprint(filepath: str, content_hash: bool = False) -> Tuple:
+
+    # (absolute path, size, mtime in ns), like Snapshot.is_current: one stat,
+    # so a warm cache hit does not depend on the file size. content_hash=True
+    # appends a BLAKE2b of the content, which also catches rewrites that keep
+    # size and mtime but reads the whole file.
+    stat = os.stat(filepath)
+    fingerprint = (os.path.abspath(filepath), stat.st_size, stat.st_mtime_ns)
+    if content_hash:
+        fingerprint += (_content_hash(filepath),)
+    return fingerprint
+
+
+def _content_hash(filepath: str) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(filepath, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_BYTES), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def callable_identity(function: Callable) -> str:
+
+    # Stable description of a selector/mapper, used as part of the cache key.
+    # Plain functions and lambdas are identified by their bytecode, constants,
+    # names, default arguments, captured closure values and the current values
+    # of the module globals they use, so two textually identical lambdas share
+    # cache entries while a changed lambda, default or constant gets a new one.
+    # functools.partial objects and bound methods are unwrapped. Raises
+    # ValueError when no identity is stable across runs (e.g. a callable object
+    # whose repr is a memory address).
+    return repr(_value_identity(function, set()))
+
+
+def _value_identity(value, seen: Set[int]):
+    if isinstance(value, (type(None), bool, int, float, complex, str, bytes)):
+        return value
+    if isinstance(value, (tuple, list, frozenset, set)):
+        items = [_value_identity(item, seen) for item in value]
+        return type(value).__name__, sorted(items, key=repr) if isinstance(value, (set, frozenset)) else items
+    if isinstance(value, dict):
+        return 'dict', [(_value_identity(k, seen), _value_identity(v, seen)) for k, v in value.items()]
+    if isinstance(value, types.ModuleType):
+        return 'module', value.__name__
+    if isinstance(value, type):
+        return 'class', value.__module__, value.__qualname__
+    if isinstance(value, functools.partial):
+        return ('partial', _value_identity(value.func, seen), _value_identity(value.args, seen),
+                _value_identity(value.keywords, seen))
+    if isinstance(value, types.MethodType):
+        return 'method', _value_identity(value.__func__, seen), _value_identity(value.__self__, seen)
+    if isinstance(value, types.FunctionType):
+        if id(value) in seen:
+            # Recursive reference (e.g. a function using itself as a global)
+            return 'function', value.__module__, value.__qualname__
+        seen.add(id(value))
+        closure = tuple(_value_identity(cell.cell_contents, seen) for cell in (value.__closure__ or ()))
+        return ('function', value.__module__, value.__qualname__, _code_identity(value.__code__),
+                _value_identity(value.__defaults__, seen), _value_identity(value.__kwdefaults__, seen),
+                closure, _globals_identity(value, seen))
+    # Anything else (e.g. operator.attrgetter('full_name')) by its repr, if that is stable
+    text = repr(value)
+    if ' at 0x' in text:
+        raise ValueError(f"No stable identity for {text}; pass an explicit key")
+    return text
+
+
+def _code_identity(code) -> Tuple:
+    # Nested code objects (e.g. a comprehension) repr with their address, so recurse instead
+    consts = tuple(_code_identity(c) if hasattr(c, 'co_code') else c for c in code.co_consts)
+    return code.co_code.hex(), consts, code.co_names
+
+
+def _global_names(code) -> Set[str]:
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if hasattr(const, 'co_code'):
+            names |= _global_names(const)
+    return names
+
+
+def _globals_identity(function, seen: Set[int]) -> Tuple:
+    # Current values of the module globals the code refers to (attribute names
+    # in co_names are skipped because they are not globals)
+    namespace = function.__globals__
+    return tuple((name, _value_identity(namespace[name], seen))
+                 for name in sorted(_global_names(function.__code__)) if name in namespace)
+
+
+def write_atomic(path: str, data: bytes) -> None:
+
+    # Write then rename, so readers never see a half-written file.
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class AggregateCache:
+    """
+    On-disk cache of aggregation results.
+
+    An entry is keyed by the input file's fingerprint (path, size, mtime,
+    and optionally a content hash) and by the identity of the grouping/metric functions, and
+    stored as one pickle file, so group keys keep their type (ints, tuples).
+    An index records each entry's size and last use; once the cache holds
+    more than `max_entries` entries or `max_bytes` bytes, the least recently
+    used entries are deleted. Loading an entry unpickles it, so only use
+    cache directories you trust.
+    """
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, max_entries: int = 64,
+                 max_bytes: int = 64 * 2**20):
+        if max_entries <= 0 or max_bytes <= 0:
+            raise ValueError("max_entries and max_bytes must be positive")
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+        self._index_path = os.path.join(directory, INDEX_FILE)
+        self._index = self._load_index()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(entry['bytes'] for entry in self._index.values())
+
+    @staticmethod
+    def entry_key(fingerprint: Tuple, query: str) -> str:
+        return hashlib.blake2b(repr((fingerprint, query)).encode('utf-8'), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[object]:
+        entry = self._index.get(key)
+        if entry is None:
+            return None
+        try:
+            with open(self._entry_path(key), 'rb') as f:
+                result = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, ValueError):
+            # Missing or damaged entry: drop it and recompute
+            self._remove(key)
+            self._save_index()
+            return None
+        entry['last_used'] = time.time()
+        self._save_index()
+        return result
+
+    def put(self, key: str, result: object) -> None:
+        try:
+            data = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError) as error:
+            # e.g. group keys of a class defined inside a function
+            logger.warning("Aggregate cannot be stored (%s); not cached.", error)
+            return
+        if len(data) > self.max_bytes:
+            logger.info("Aggregate of %d bytes exceeds the cache size limit; not cached.", len(data))
+            return
+        write_atomic(self._entry_path(key), data)
+        self._index[key] = {'bytes': len(data), 'last_used': time.time()}
+        self._evict()
+        self._save_index()
+
+    def clear(self) -> None:
+        for key in list(self._index):
+            self._remove(key)
+        self._save_index()
+
+    # Internal helpers
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".pickle")
+
+    def _evict(self) -> None:
+        # Least recently used first, until both limits hold
+        by_age = sorted(self._index, key=lambda k: self._index[k]['last_used'])
+        total = self.total_bytes
+        for key in by_age:
+            if len(self._index) <= self.max_entries and total <= self.max_bytes:
+                break
+            total -= self._index[key]['bytes']
+            self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        self._index.pop(key, None)
+        try:
+            os.remove(self._entry_path(key))
+        except FileNotFoundError:
+            pass
+
+    def _load_index(self) -> Dict[str, Dict[str, float]]:
+        try:
+            with open(self._index_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self) -> None:
+        write_atomic(self._index_path, json.dumps(self._index).encode('utf-8'))
+
+
+
+def cached_aggregate(
+    filepath: Source,
+    key_selector: Callable[[CarSale], str],
+    value_mapper: Callable[[CarSale], Dict[str, float]],
+    cache: Optional[AggregateCache] = None,
+    key: Optional[str] = None,
+    content_hash: bool = False
+) -> Dict[str, Dict[str, float]]:
+    """
+    functional_aggregate(car_sales_stream(filepath), ...) with an on-disk result cache.
+
+    Args:
+        filepath: CSV file to aggregate, or a glob pattern / list of files
+            (keyed by the fingerprints of all of them).
+        key_selector: Lambda to group data (e.g., lambda c: c.full_name).
+        value_mapper: Lambda to extract metrics (e.g., lambda c: {'count': 1, 'revenue': c.price}).
+        cache: Cache to use (default: AggregateCache() under data/.aggregate_cache).
+        key: Explicit name for the selector/mapper pair. Needed to cache callables
+            without a stable identity (see callable_identity); without it they
+            are aggregated uncached.
+        content_hash: Also key by a hash of the file content (see
+            file_fingerprint). Catches same-size rewrites that keep the mtime,
+            at the cost of reading the file on every call.
+    """
+    def query() -> str:
+        return callable_identity(key_selector) + "|" + callable_identity(value_mapper)
+
+    def compute() -> Dict[str, Dict[str, float]]:
+        return functional_aggregate(car_sales_stream(filepath), key_selector, value_mapper)
+
+    return _cached(filepath, key, query, compute, cache, content_hash)
+
+
+def cached_multi_aggregate(
+    filepath: Source,
+    queries: Dict[str, Query],
+    totals: Optional[Dict[str, Callable[[CarSale], float]]] = None,
+    cache: Optional[AggregateCache] = None,
+    key: Optional[str] = None,
+    content_hash: bool = False
+) -> MultiQueryResult:
+    """
+    multi_aggregate(car_sales_stream(filepath), queries, totals) with the same
+    on-disk cache as cached_aggregate, keyed by the file fingerprints and by
+    every query's selectors, metrics and top-k settings (or by `key`).
+    `content_hash` works as in cached_aggregate.
+    """
+    totals = totals or {}
+
+    def query() -> str:
+        return "multi|" + repr((
+            [(name, callable_identity(q.key_selector), callable_identity(q.value_selector),
+              tuple(q.metrics), q.top_k, q.rank_by) for name, q in queries.items()],
+            [(name, callable_identity(selector)) for name, selector in totals.items()]))
+
+    def compute() -> MultiQueryResult:
+        return multi_aggregate(car_sales_stream(filepath), queries, totals)
+
+    return _cached(filepath, key and "multi|" + key, query, compute, cache, content_hash)
+
+
+def _cached(filepath: Source, key: Optional[str], query: Callable[[], str],
+            compute: Callable[[], object], cache: Optional[AggregateCache],
+            content_hash: bool = False) -> object:
+    # compute() through the cache, keyed by the fingerprints of the source files
+    # and by `key` (default: query()). Missing files and callables without a
+    # stable identity are computed uncached; the stream reports missing files.
+    paths = expand_paths(filepath)
+    if not paths or not all(os.path.exists(path) for path in paths):
+        return compute()
+    if key is None:
+        try:
+            key = query()
+        except ValueError as error:
+            logger.warning("%s; aggregating without the cache.", error)
+            return compute()
+    cache = cache if cache is not None else AggregateCache()
+    fingerprints = tuple(file_fingerprint(path, content_hash) for path in paths)
+    entry = cache.entry_key(fingerprints[0] if len(fingerprints) == 1 else fingerprints, key)
+
+    result = cache.get(entry)
+    if result is None:
+        result = compute()
+        cache.put(entry, result)
+    return result
@@ -0,0 +1,184 @@
+import csv
+import gzip
+import logging
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, TextIO
+from src.models import CarSale
+
+logger = logging.getLogger(__name__)
+
+# Column layout of a chunk: numeric columns are typed arrays, string columns
+# are dictionary-encoded (array of int codes + one shared dictionary per column).
+INT_COLUMNS = ('id', 'year')
+FLOAT_COLUMNS = ('price', 'mileage')
+STRING_COLUMNS = ('brand', 'model', 'title_status', 'color')
+
+DEFAULT_CHUNK_SIZE = 65536
+
+# How CSV text is decoded (open_csv, and the byte ranges of src/parallel.py):
+# newline=None splits lines at \n, \r and \r\n and turns each into \n
+CSV_ENCODING = 'utf-8'
+CSV_NEWLINE = None
+
+# Typecode of every chunk column: ids are 64-bit (real ids exceed a C int),
+# years and dictionary codes are C ints
+COLUMN_TYPECODES = {
+    'id': 'q', 'price': 'd', 'brand': 'i', 'model': 'i',
+    'year': 'i', 'title_status': 'i', 'mileage': 'd', 'color': 'i',
+}
+
+# Ranges of the id (array('q')) and year (array('i')) columns. A row with a
+# value outside them cannot be stored and is skipped with a warning.
+ID_MIN, ID_MAX = -2 ** 63, 2 ** 63 - 1
+INT_MIN, INT_MAX = -2 ** 31, 2 ** 31 - 1
+
+
+class StringDictionary:
+    """
+    Maps each distinct string of a column to a small integer code.
+
+    A column like `brand` has only a few dozen distinct values, so a chunk
+    stores 4-byte codes instead of one str object per row, and decoding hands
+    out the same (interned) str object for every row with that value.
+    """
+    def __init__(self):
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+
+    def encode(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self.codes[value] = code
+        return code
+
+    def __getitem__(self, code: int) -> str:
+        return self.values[code]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+@dataclass
+class CarSalesChunk:
+    # One batch of rows stored column by column.
+    # The dictionaries are shared by every chunk of the same file, so codes
+    # are comparable across chunks.
+    dictionaries: Dict[str, StringDictionary]
+    id: array = field(default_factory=lambda: array('q'))
+    price: array = field(default_factory=lambda: array('d'))
+    brand: array = field(default_factory=lambda: array('i'))
+    model: array = field(default_factory=lambda: array('i'))
+    year: array = field(default_factory=lambda: array('i'))
+    title_status: array = field(default_factory=lambda: array('i'))
+    mileage: array = field(default_factory=lambda: array('d'))
+    color: array = field(default_factory=lambda: array('i'))
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def strings(self, name: str) -> List[str]:
+        # Decoded view of a dictionary-encoded column
+        values = self.dictionaries[name].values
+        return [values[code] for code in getattr(self, name)]
+
+    def rows(self) -> Iterator[CarSale]:
+        # Row view of the chunk, for code written against CarSale objects
+        brands = self.dictionaries['brand'].values
+        models = self.dictionaries['model'].values
+        statuses = self.dictionaries['title_status'].values
+        colors = self.dictionaries['color'].values
+        for i in range(len(self.id)):
+            yield CarSale(
+                id=self.id[i],
+                price=self.price[i],
+                brand=brands[self.brand[i]],
+                model=models[self.model[i]],
+                year=self.year[i],
+                title_status=statuses[self.title_status[i]],
+                mileage=self.mileage[i],
+                color=colors[self.color[i]]
+            )
+
+
+def open_csv(filepath: str) -> TextIO:
+
+    # Text handle on a CSV file; .gz files are decompressed while reading.
+    if filepath.endswith('.gz'):
+        return gzip.open(filepath, mode='rt', encoding=CSV_ENCODING, newline=CSV_NEWLINE)
+    return open(filepath, mode='r', encoding=CSV_ENCODING, newline=CSV_NEWLINE)
+
+
+def car_sales_chunks(filepath: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[CarSalesChunk]:
+
+    # Lazy generator: reads the CSV `chunk_size` rows at a time into columnar chunks.
+    # Rows that fail conversion are skipped, like in car_sales_stream.
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    try:
+        with open_csv(filepath) as f:
+            yield from chunks_from_lines(f, chunk_size)
+    except FileNotFoundError:
+        print(f"Error: File {filepath} not found.")
+        return
+
+
+def chunks_from_lines(lines: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[CarSalesChunk]:
+
+    # Parses CSV text lines (header first) into columnar chunks.
+    # Used directly for slices of a file, e.g. the byte ranges of parallel_aggregate.
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if header is None:
+        return
+    try:
+        # Column positions, so the file's column order does not matter
+        (id_at, price_at, brand_at, model_at, year_at,
+         status_at, mileage_at, color_at) = (
+            header.index(name) for name in
+            ('id', 'price', 'brand', 'model', 'year', 'title_status', 'mileage', 'color'))
+    except ValueError:
+        # A missing column makes every row invalid
+        return
+
+    dictionaries = {name: StringDictionary() for name in STRING_COLUMNS}
+    encode_brand = dictionaries['brand'].encode
+    encode_model = dictionaries['model'].encode
+    encode_status = dictionaries['title_status'].encode
+    encode_color = dictionaries['color'].encode
+
+    chunk = CarSalesChunk(dictionaries)
+    out_of_range = 0
+    for row in reader:
+        try:
+            # Convert everything before appending, so a bad row leaves no partial entry
+            values = (int(row[id_at]), float(row[price_at]), int(row[year_at]),
+                      float(row[mileage_at]))
+            strings = (row[brand_at], row[model_at], row[status_at], row[color_at])
+        except (ValueError, IndexError):
+            # Skip this specific row to keep the stream alive.
+            continue
+        if not (ID_MIN <= values[0] <= ID_MAX and INT_MIN <= values[2] <= INT_MAX):
+            out_of_range += 1
+            continue
+
+        chunk.id.append(values[0])
+        chunk.price.append(values[1])
+        chunk.year.append(values[2])
+        chunk.mileage.append(values[3])
+        chunk.brand.append(encode_brand(strings[0]))
+        chunk.model.append(encode_model(strings[1]))
+        chunk.title_status.append(encode_status(strings[2]))
+        chunk.color.append(encode_color(strings[3]))
+
+        if len(chunk.id) == chunk_size:
+            yield chunk
+            chunk = CarSalesChunk(dictionaries)
+    if len(chunk.id):
+        yield chunk
+    if out_of_range:
+        logger.warning("Skipped %d rows whose id or year is outside the 64-bit/32-bit column range.",
+                       out_of_range)
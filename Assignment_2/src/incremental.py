@@ -0,0 +1,144 @@
+import os
+import pickle
+import hashlib
+import logging
+from typing import Callable, Dict, Optional
+from src.models import CarSale
+from src.analysis import functional_aggregate
+from src.parallel import read_byte_range, merge_aggregates
+from src.cache import callable_identity, write_atomic
+
+logger = logging.getLogger(__name__)
+
+# Bytes hashed at the start of the file and just before the checkpoint offset
+# to notice a rewritten file without re-reading everything processed so far
+SAMPLE_BYTES = 1 << 16
+
+
+def _sample_hash(f, start: int, end: int) -> str:
+    f.seek(start)
+    return hashlib.blake2b(f.read(end - start), digest_size=16).hexdigest()
+
+
+class IncrementalAggregator:
+    """
+    functional_aggregate for an append-only CSV that resumes where it stopped.
+
+    A checkpoint (a pickle next to the CSV by default, so group keys keep
+    their type) stores the byte offset of the first unprocessed line and the
+    aggregate so far. update() only parses the bytes appended since then and
+    merges them into the stored result; an incomplete last line is left for
+    the next update, and nothing is stored until the header line is complete.
+
+    The stored result is thrown away and rebuilt from the start when the file
+    is shorter than the offset (truncated), when it is a different file
+    (inode changed) or its first/last processed bytes differ (rewritten), or
+    when the selector/mapper changed (compared with callable_identity, or
+    by the explicit `key` given for them).
+    """
+    def __init__(self, filepath: str,
+                 key_selector: Callable[[CarSale], str],
+                 value_mapper: Callable[[CarSale], Dict[str, float]],
+                 checkpoint_path: Optional[str] = None, key: Optional[str] = None):
+        self.filepath = filepath
+        self.key_selector = key_selector
+        self.value_mapper = value_mapper
+        self.checkpoint_path = checkpoint_path or filepath + ".checkpoint.pickle"
+        # An explicit key names callables without a stable identity (callable_identity raises)
+        self.query = key or callable_identity(key_selector) + "|" + callable_identity(value_mapper)
+        # What the last update() did: bytes parsed and whether it started over
+        self.last_bytes_read = 0
+        self.last_rebuilt = False
+        self._state = self._load_checkpoint()
+
+    @property
+    def offset(self) -> int:
+        return self._state['offset'] if self._state else 0
+
+    @property
+    def result(self) -> Dict[str, Dict[str, float]]:
+        return self._state['result'] if self._state else {}
+
+    def update(self) -> Dict[str, Dict[str, float]]:
+        try:
+            stat = os.stat(self.filepath)
+        except FileNotFoundError:
+            print(f"Error: File {self.filepath} not found.")
+            return self.result
+
+        with open(self.filepath, 'rb') as f:
+            state = self._state
+            self.last_rebuilt = state is None or not self._still_valid(state, f, stat)
+            if self.last_rebuilt:
+                if state is not None:
+                    logger.info("%s was truncated or rewritten; rebuilding the aggregate.", self.filepath)
+                f.seek(0)
+                header = f.readline()
+                if not header.endswith(b'\n'):
+                    # Empty file or header still being written: wait, so the
+                    # checkpoint never records a partial header
+                    self._state = None
+                    self.last_bytes_read = 0
+                    if os.path.exists(self.checkpoint_path):
+                        os.remove(self.checkpoint_path)
+                    return {}
+                state = {'offset': f.tell(), 'header': header.decode('utf-8'), 'result': {}}
+
+            # Only complete lines: stop after the last newline in the file
+            end = self._last_line_end(f, state['offset'], stat.st_size)
+            start = state['offset']
+            if end > start:
+                new_rows = read_byte_range(self.filepath, state['header'].encode('utf-8'), start, end)
+                partial = functional_aggregate(new_rows, self.key_selector, self.value_mapper)
+                state['result'] = merge_aggregates(state['result'], partial)
+                state['offset'] = end
+            self.last_bytes_read = end - start
+
+            state['inode'] = stat.st_ino
+            state['query'] = self.query
+            state['head_hash'] = _sample_hash(f, 0, min(SAMPLE_BYTES, state['offset']))
+            state['tail_hash'] = _sample_hash(f, max(0, state['offset'] - SAMPLE_BYTES), state['offset'])
+
+        self._state = state
+        try:
+            data = pickle.dumps(state, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError) as error:
+            # A new aggregator resumes from the last checkpoint stored, if any
+            logger.warning("Checkpoint cannot be stored (%s); not saved.", error)
+        else:
+            write_atomic(self.checkpoint_path, data)
+        return state['result']
+
+    # Internal helpers
+
+    def _still_valid(self, state: Dict, f, stat) -> bool:
+        offset = state['offset']
+        return (state.get('query') == self.query
+                and state.get('inode') == stat.st_ino
+                and stat.st_size >= offset
+                and state.get('head_hash') == _sample_hash(f, 0, min(SAMPLE_BYTES, offset))
+                and state.get('tail_hash') == _sample_hash(f, max(0, offset - SAMPLE_BYTES), offset))
+
+    @staticmethod
+    def _last_line_end(f, start: int, size: int) -> int:
+        # Offset just past the last '\n' in [start, size), or start if there is none
+        position = size
+        while position > start:
+            block_start = max(start, position - SAMPLE_BYTES)
+            f.seek(block_start)
+            newline = f.read(position - block_start).rfind(b'\n')
+            if newline >= 0:
+                return block_start + newline + 1
+            position = block_start
+        return start
+
+    def _load_checkpoint(self) -> Optional[Dict]:
+        try:
+            with open(self.checkpoint_path, 'rb') as f:
+                state = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, ValueError):
+            return None
+        # An unreadable checkpoint just means a full rebuild
+        if not isinstance(state, dict) or not {'offset', 'header', 'result'} <= state.keys():
+            return None
+        return state
@@ -0,0 +1,232 @@
+import csv
+import os
+import sys
+import json
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List, Optional
+from src.models import CarSale
+from src.columnar import chunks_from_lines, ID_MIN, ID_MAX, INT_MIN, INT_MAX
+from src.cache import file_fingerprint
+
+# File layout: MAGIC, 4-byte header length N (little-endian), N bytes of JSON
+# header (source fingerprint, CSV header line, hash index key ranges, array
+# offsets), then the raw arrays (native byte order, recorded in the header).
+MAGIC = b"CARIDX01"
+
+# Point lookups by exact value, range lookups over the numeric columns
+HASH_COLUMNS = ('brand', 'full_name')
+SORTED_COLUMNS = ('price', 'year', 'mileage')
+
+
+def default_index_path(csv_path: str) -> str:
+    return csv_path + ".idx"
+
+
+class CarSalesIndex:
+    """
+    Secondary indexes over one CSV file, holding byte offsets of its rows.
+
+    hash_index[column] maps each value to [start, count] in
+    arrays[column + '_offsets'], whose entries are grouped by value. For the
+    numeric columns, arrays[column + '_keys'] and arrays[column + '_offsets']
+    are ordered by value, so a range is two bisects. rows() then seeks to the
+    matching records (which may span several lines) and parses only those, in
+    file order.
+
+    The offsets are only valid for the file version in `fingerprint`; use
+    open_index() to get an index that is rebuilt when the CSV changes.
+    """
+    def __init__(self, csv_path: str, fingerprint: List, header: str,
+                 hash_index: Dict[str, Dict[str, List[int]]], arrays: Dict[str, array]):
+        self.csv_path = csv_path
+        self.fingerprint = fingerprint
+        self.header = header
+        self.hash_index = hash_index
+        self.arrays = arrays
+
+    def __len__(self) -> int:
+        return len(self.arrays['price_offsets'])
+
+    def lookup(self, column: str, value: str) -> array:
+        # Offsets of the rows whose `column` equals `value` (file order)
+        if column not in HASH_COLUMNS:
+            raise ValueError(f"No hash index on {column!r}; indexed: {HASH_COLUMNS}")
+        start, count = self.hash_index[column].get(value, (0, 0))
+        return self.arrays[column + '_offsets'][start:start + count]
+
+    def range(self, column: str, low: float, high: float) -> array:
+        # Offsets of the rows with low <= column <= high (ordered by value)
+        if column not in SORTED_COLUMNS:
+            raise ValueError(f"No sorted index on {column!r}; indexed: {SORTED_COLUMNS}")
+        keys = self.arrays[column + '_keys']
+        return self.arrays[column + '_offsets'][bisect_left(keys, low):bisect_right(keys, high)]
+
+    def rows(self, offsets: Iterable[int]) -> Iterator[CarSale]:
+        # Reads and parses only the records at `offsets`
+        for chunk in chunks_from_lines(chain([self.header], self._records(sorted(offsets)))):
+            yield from chunk.rows()
+
+    def find(self, column: str, value: str) -> Iterator[CarSale]:
+        return self.rows(self.lookup(column, value))
+
+    def find_range(self, column: str, low: float, high: float) -> Iterator[CarSale]:
+        return self.rows(self.range(column, low, high))
+
+    def _records(self, offsets: List[int]) -> Iterator[str]:
+        # Text of the CSV record starting at each offset. A line with an odd
+        # number of quotes leaves a quoted field open; then csv.reader pulls
+        # physical lines until the record is complete, so it is read whole.
+        with open(self.csv_path, 'rb') as f:
+            for offset in offsets:
+                f.seek(offset)
+                line = f.readline()
+                if line.count(b'"') % 2 == 0:
+                    yield line.decode('utf-8')
+                    continue
+                f.seek(offset)
+                raw: List[bytes] = []
+
+                def physical_lines() -> Iterator[str]:
+                    for line in iter(f.readline, b''):
+                        raw.append(line)
+                        yield line.decode('utf-8')
+
+                next(csv.reader(physical_lines()), None)
+                yield b''.join(raw).decode('utf-8')
+
+
+def build_index(csv_path: str) -> CarSalesIndex:
+
+    # Scans the CSV once and builds every index. Rows that car_sales_stream
+    # would skip (bad numbers, missing fields) are left out of the index too.
+    fingerprint = list(file_fingerprint(csv_path))
+    groups: Dict[str, Dict[str, array]] = {name: {} for name in HASH_COLUMNS}
+    pairs: Dict[str, List] = {name: [] for name in SORTED_COLUMNS}
+
+    with open(csv_path, 'rb') as f:
+        header_line = f.readline().decode('utf-8')
+        header = next(csv.reader([header_line]), [])
+        # Start offset of every physical line, so rows spanning lines map to their first
+        starts = array('q')
+
+        def lines() -> Iterator[str]:
+            position = len(header_line.encode('utf-8'))
+            for raw in f:
+                starts.append(position)
+                position += len(raw)
+                yield raw.decode('utf-8')
+
+        try:
+            (id_at, price_at, brand_at, model_at, year_at, mileage_at) = (
+                header.index(name) for name in ('id', 'price', 'brand', 'model', 'year', 'mileage'))
+            required = max(header.index(name) for name in ('title_status', 'color'))
+        except ValueError:
+            # A missing column makes every row invalid
+            required = None
+
+        reader = csv.reader(lines())
+        while required is not None:
+            first_line = len(starts)
+            row = next(reader, None)
+            if row is None:
+                break
+            try:
+                row[required]  # title_status/color must be present, like in the full parser
+                identifier, year = int(row[id_at]), int(row[year_at])
+                price, mileage = float(row[price_at]), float(row[mileage_at])
+                brand, model = row[brand_at], row[model_at]
+                if not (ID_MIN <= identifier <= ID_MAX and INT_MIN <= year <= INT_MAX):
+                    raise ValueError("integer column out of range")
+            except (ValueError, IndexError):
+                continue
+
+            offset = starts[first_line]
+            for column, key in (('brand', brand), ('full_name', f"{brand} {model}")):
+                offsets = groups[column].get(key)
+                if offsets is None:
+                    offsets = groups[column][key] = array('q')
+                offsets.append(offset)
+            pairs['price'].append((price, offset))
+            pairs['year'].append((year, offset))
+            pairs['mileage'].append((mileage, offset))
+
+    hash_index: Dict[str, Dict[str, List[int]]] = {}
+    arrays: Dict[str, array] = {}
+    for column, by_key in groups.items():
+        hash_index[column] = {}
+        flat = arrays[column + '_offsets'] = array('q')
+        for key, offsets in by_key.items():
+            hash_index[column][key] = [len(flat), len(offsets)]
+            flat.extend(offsets)
+    for column, values in pairs.items():
+        values.sort()
+        arrays[column + '_keys'] = array('d', (value for value, _ in values))
+        arrays[column + '_offsets'] = array('q', (offset for _, offset in values))
+    return CarSalesIndex(csv_path, fingerprint, header_line, hash_index, arrays)
+
+
+def write_index(index: CarSalesIndex, index_path: Optional[str] = None) -> str:
+
+    # Persists an index (write then rename) and returns its path.
+    index_path = index_path or default_index_path(index.csv_path)
+    header = {
+        'fingerprint': index.fingerprint,
+        'byteorder': sys.byteorder,
+        'header': index.header,
+        'hash_index': index.hash_index,
+        'arrays': {},
+    }
+    position = 0
+    for name, values in index.arrays.items():
+        header['arrays'][name] = {'typecode': values.typecode, 'offset': position, 'count': len(values)}
+        position += len(values) * values.itemsize
+
+    encoded = json.dumps(header).encode('utf-8')
+    tmp_path = index_path + ".tmp"
+    with open(tmp_path, 'wb') as out:
+        out.write(MAGIC + struct.pack('<I', len(encoded)) + encoded)
+        for values in index.arrays.values():
+            values.tofile(out)
+    os.replace(tmp_path, index_path)
+    return index_path
+
+
+def load_index(csv_path: str, index_path: Optional[str] = None) -> Optional[CarSalesIndex]:
+
+    # Reads a persisted index; None if it is missing, unreadable or from another machine.
+    index_path = index_path or default_index_path(csv_path)
+    try:
+        with open(index_path, 'rb') as f:
+            data = f.read()
+        if data[:len(MAGIC)] != MAGIC:
+            return None
+        (length,) = struct.unpack_from('<I', data, len(MAGIC))
+        start = len(MAGIC) + 4
+        header = json.loads(data[start:start + length].decode('utf-8'))
+        if header['byteorder'] != sys.byteorder:
+            return None
+        body = start + length
+        arrays = {}
+        for name, info in header['arrays'].items():
+            values = arrays[name] = array(info['typecode'])
+            begin = body + info['offset']
+            values.frombytes(data[begin:begin + info['count'] * values.itemsize])
+    except (OSError, ValueError, KeyError, struct.error):
+        return None
+    return CarSalesIndex(csv_path, header['fingerprint'], header['header'], header['hash_index'], arrays)
+
+
+def open_index(csv_path: str, index_path: Optional[str] = None) -> CarSalesIndex:
+
+    # Loads the index next to the CSV, rebuilding and saving it when it is
+    # missing or the CSV's size or mtime changed. Only the CSV is stat'ed,
+    # so reopening an index costs one stat plus reading the index file.
+    index = load_index(csv_path, index_path)
+    if index is not None and index.fingerprint == list(file_fingerprint(csv_path)):
+        return index
+    index = build_index(csv_path)
+    write_index(index, index_path)
+    return index
@@ -0,0 +1,161 @@
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from src.models import CarSale
+from src.analysis import GroupedAccumulator, METRICS
+
+
+@dataclass(frozen=True)
+class Query:
+    # One grouping evaluated by multi_aggregate.
+    key_selector: Callable[[CarSale], str]           # e.g. lambda c: c.brand
+    value_selector: Callable[[CarSale], float]       # e.g. lambda c: c.price
+    metrics: Sequence[str] = ('count', 'sum')        # any of analysis.METRICS
+    top_k: int = 0                                   # keep a running top-k (0 = off)
+    rank_by: str = 'sum'                             # 'count' or 'sum'
+
+    def __post_init__(self):
+        if self.top_k < 0:
+            raise ValueError("top_k must not be negative")
+        if self.rank_by not in ('count', 'sum'):
+            raise ValueError("rank_by must be 'count' or 'sum'")
+        unknown = set(self.metrics) - set(METRICS)
+        if unknown:
+            raise ValueError(f"Unknown metrics: {sorted(unknown)}")
+
+
+class RunningTopK:
+    """
+    The k keys with the highest score, kept up to date row by row.
+
+    Exact as long as scores never decrease (counts, sums of non-negative
+    values): a key outside the top-k can only enter by passing the current
+    minimum, which is checked on every update of that key. Equal scores are
+    ranked by the order in which the keys were first seen, earliest first,
+    so the leader is the one max() over the grouped dict would pick.
+    """
+    def __init__(self, k: int):
+        self.k = k
+        self.members: Dict[str, float] = {}
+        # First-seen position of every member, and of every key passed without one
+        self._order: Dict[str, int] = {}
+        self._min_key: Optional[str] = None
+        self._min_rank = (float('-inf'), 0)
+        # Score a non-member must reach to enter: -inf until k keys are held
+        self.floor = float('-inf')
+
+    def update(self, key: str, score: float, order: Optional[int] = None) -> None:
+        # order: the key's first-seen position (multi_aggregate passes its group
+        # index); without it the order of the first update of the key is used.
+        members = self.members
+        if key in members:
+            members[key] = score
+            if key == self._min_key:
+                self._refresh_min()
+            return
+        if order is None:
+            order = self._order.setdefault(key, len(self._order))
+        if len(members) < self.k:
+            members[key] = score
+            self._order[key] = order
+            self._refresh_min()
+        elif (score, -order) > self._min_rank:
+            del members[self._min_key]
+            members[key] = score
+            self._order[key] = order
+            self._refresh_min()
+
+    def _rank(self, key: str) -> Tuple[float, int]:
+        return self.members[key], -self._order[key]
+
+    def _refresh_min(self) -> None:
+        self._min_key = min(self.members, key=self._rank)
+        self._min_rank = self._rank(self._min_key)
+        if len(self.members) >= self.k:
+            self.floor = self._min_rank[0]
+
+    def items(self) -> List[Tuple[str, float]]:
+        # Highest score first, ties in first-seen order
+        return sorted(self.members.items(), key=lambda item: (-item[1], self._order[item[0]]))
+
+
+@dataclass
+class MultiQueryResult:
+    rows: int = 0
+    groups: Dict[str, Dict[str, Dict[str, float]]] = field(default_factory=dict)
+    top: Dict[str, List[Tuple[str, float]]] = field(default_factory=dict)
+    totals: Dict[str, Dict[str, float]] = field(default_factory=dict)
+
+
+def multi_aggregate(
+    stream: Iterator[CarSale],
+    queries: Dict[str, Query],
+    totals: Optional[Dict[str, Callable[[CarSale], float]]] = None
+) -> MultiQueryResult:
+    """
+    Evaluates several groupings over a single pass of the stream.
+
+    Args:
+        stream: The data source, read once.
+        queries: Named groupings, e.g. {"by_model": Query(lambda c: c.full_name, lambda c: c.price, top_k=5)}.
+        totals: Named values summarised over all rows (count/sum/min/max/mean),
+            e.g. {"price": lambda c: c.price}.
+
+    Returns a MultiQueryResult with the row count, the per-key metrics of each
+    query, the top-k list of queries that asked for one, and the global totals.
+    """
+    totals = totals or {}
+    # One (selectors, accumulator arrays, top-k list) tuple per distinct pair of
+    # selectors, with add() inlined below. Queries using the same key and value
+    # selector objects share the accumulator; each keeps its own top-k.
+    shared = {}
+    accs, tops = [], []
+    for query in queries.values():
+        plan = shared.get((query.key_selector, query.value_selector))
+        if plan is None:
+            acc = GroupedAccumulator()
+            plan = shared[query.key_selector, query.value_selector] = (
+                query.key_selector, query.value_selector, acc, acc.key_ids,
+                acc.count, acc.sum, acc.min, acc.max, [])
+        top = RunningTopK(query.top_k) if query.top_k else None
+        if top is not None:
+            plan[8].append((top, query.rank_by == 'count'))
+        accs.append(plan[2])
+        tops.append(top)
+    plans = list(shared.values())
+    total_accs = {name: GroupedAccumulator() for name in totals}
+    total_plans = [(selector, total_accs[name].add) for name, selector in totals.items()]
+
+    rows = 0
+    for item in stream:
+        rows += 1
+        for key_selector, value_selector, acc, key_ids, count, total, low, high, plan_tops in plans:
+            key = key_selector(item)
+            value = value_selector(item)
+            index = key_ids.get(key)
+            if index is None:
+                acc.add_key(key, value)
+                index = key_ids[key]
+            else:
+                count[index] += 1
+                total[index] += value
+                if value < low[index]:
+                    low[index] = value
+                if value > high[index]:
+                    high[index] = value
+            for top, by_count in plan_tops:
+                score = count[index] if by_count else total[index]
+                # Most rows neither touch a member nor reach the minimum: skip
+                # the call (an equal score may still win on first-seen order)
+                if score >= top.floor or key in top.members:
+                    top.update(key, score, index)
+        for selector, add in total_plans:
+            add('', selector(item))
+
+    result = MultiQueryResult(rows=rows)
+    for (name, query), acc, top in zip(queries.items(), accs, tops):
+        result.groups[name] = acc.result(query.metrics)
+        if top is not None:
+            result.top[name] = top.items()
+    for name, acc in total_accs.items():
+        result.totals[name] = acc.result().get('', {'count': 0, 'sum': 0.0})
+    return result
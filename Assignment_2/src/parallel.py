@@ -0,0 +1,173 @@
+import io
+import os
+import pickle
+import logging
+from functools import reduce
+from multiprocessing import Pool
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from src.models import CarSale
+from src.columnar import CSV_ENCODING, CSV_NEWLINE, chunks_from_lines
+from src.analysis import functional_aggregate
+from src.shards import Source, expand_paths
+from src.streams import car_sales_stream
+
+logger = logging.getLogger(__name__)
+
+# Ranges smaller than this are not worth a worker process
+MIN_RANGE_BYTES = 1 << 20
+# Bytes decoded at a time while reading a range
+READ_BLOCK_BYTES = 1 << 22
+
+
+def split_byte_ranges(filepath: str, parts: int) -> Tuple[bytes, List[Tuple[int, int]]]:
+
+    # Splits the data rows of a CSV into `parts` byte ranges that start and end
+    # on line boundaries. Returns the header line and the (start, end) ranges.
+    # Assumes no quoted field spans several lines (true for the car sales data).
+    if parts <= 0:
+        raise ValueError("parts must be positive")
+    with open(filepath, 'rb') as f:
+        header = f.readline()
+        first = f.tell()
+        size = os.fstat(f.fileno()).st_size
+
+        boundaries = [first]
+        for i in range(1, parts):
+            target = first + (size - first) * i // parts
+            if target <= boundaries[-1]:
+                continue
+            # Move forward to the start of the next line
+            f.seek(target - 1)
+            f.readline()
+            boundary = f.tell()
+            if boundaries[-1] < boundary < size:
+                boundaries.append(boundary)
+        boundaries.append(size)
+    return header, [(start, end) for start, end in zip(boundaries, boundaries[1:]) if start < end]
+
+
+def read_byte_range(filepath: str, header: bytes, start: int, end: int) -> Iterator[CarSale]:
+
+    # Lazy generator over the CarSale rows stored in [start, end) of the file.
+    return (car for chunk in chunks_from_lines(_range_lines(filepath, header, start, end))
+            for car in chunk.rows())
+
+
+def _range_lines(filepath: str, header: bytes, start: int, end: int) -> Iterator[str]:
+    # Decodes the range block by block (each block completed to a line end),
+    # so memory stays bounded however large the range is.
+    yield from _text_lines(header)
+    with open(filepath, 'rb') as f:
+        f.seek(start)
+        position = start
+        while position < end:
+            block = f.read(min(READ_BLOCK_BYTES, end - position))
+            if not block:
+                break
+            if not block.endswith(b'\n') and position + len(block) < end:
+                block += f.readline()
+            position += len(block)
+            yield from _text_lines(block)
+
+
+def _text_lines(data: bytes) -> Iterator[str]:
+    # Lines of `data` decoded by the same text layer as open_csv, so they split
+    # and translate line endings exactly like the sequential path. (str.splitlines
+    # would also break inside fields at \x0b, \x0c, \x1c-\x1e, \x85, \u2028, \u2029.)
+    return io.TextIOWrapper(io.BytesIO(data), encoding=CSV_ENCODING, newline=CSV_NEWLINE)
+
+
+def merge_aggregates(
+    left: Dict[str, Dict[str, float]],
+    right: Dict[str, Dict[str, float]]
+) -> Dict[str, Dict[str, float]]:
+
+    # Associative merge of two functional_aggregate results: counts and revenue add up.
+    merged = dict(left)
+    for key, stats in right.items():
+        current = merged.get(key)
+        if current is None:
+            merged[key] = dict(stats)
+        else:
+            merged[key] = {
+                'count': current['count'] + stats['count'],
+                'revenue': current['revenue'] + stats['revenue']
+            }
+    return merged
+
+
+def _aggregate_range(task) -> Dict[str, Dict[str, float]]:
+    # Runs in a worker process: aggregates one byte range
+    filepath, header, start, end, key_selector, value_mapper = task
+    return functional_aggregate(read_byte_range(filepath, header, start, end), key_selector, value_mapper)
+
+
+def _aggregate_file(task) -> Dict[str, Dict[str, float]]:
+    # Runs in a worker process: aggregates one whole file (plain or .gz)
+    filepath, key_selector, value_mapper = task
+    return functional_aggregate(car_sales_stream(filepath), key_selector, value_mapper)
+
+
+def _picklable(*objects) -> bool:
+    try:
+        pickle.dumps(objects)
+        return True
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+
+
+def parallel_aggregate(
+    filepath: Source,
+    key_selector: Callable[[CarSale], str],
+    value_mapper: Callable[[CarSale], Dict[str, float]],
+    workers: Optional[int] = None
+) -> Dict[str, Dict[str, float]]:
+    """
+    functional_aggregate over a CSV file, split across worker processes.
+
+    The file is cut into byte ranges on line boundaries; each worker parses
+    and aggregates its range, and the partial results are combined with
+    merge_aggregates. Gives the same result as
+    functional_aggregate(car_sales_stream(filepath), key_selector, value_mapper).
+
+    For a glob pattern or list of files (plain or .gz), each file is one task
+    instead: workers aggregate whole shards.
+
+    Args:
+        filepath: CSV file to aggregate, or a glob pattern / list of files.
+        key_selector: Function to group data. Must be picklable (a module-level
+            function or e.g. operator.attrgetter('full_name')) to run in parallel.
+        value_mapper: Function to extract metrics, with the same restriction.
+        workers: Number of processes (default: CPU count).
+    """
+    workers = workers or os.cpu_count() or 1
+    paths = expand_paths(filepath)
+    if not paths:
+        print(f"Error: No files match {filepath}.")
+        return {}
+    missing = [path for path in paths if not os.path.exists(path)]
+    if missing:
+        print(f"Error: File {missing[0]} not found.")
+        return {}
+
+    if len(paths) == 1 and not paths[0].endswith('.gz'):
+        # Small files are not worth the process start-up cost
+        parts = max(1, min(workers, os.path.getsize(paths[0]) // MIN_RANGE_BYTES))
+        header, ranges = split_byte_ranges(paths[0], parts)
+        work = _aggregate_range
+        tasks = [(paths[0], header, start, end, key_selector, value_mapper) for start, end in ranges]
+    else:
+        work = _aggregate_file
+        tasks = [(path, key_selector, value_mapper) for path in paths]
+
+    if len(tasks) > 1 and not _picklable(key_selector, value_mapper):
+        # Lambdas and closures cannot be sent to another process
+        logger.warning("key_selector/value_mapper are not picklable; aggregating in this process.")
+        partials = map(work, tasks)
+    elif len(tasks) > 1 and workers > 1:
+        with Pool(min(workers, len(tasks))) as pool:
+            partials = pool.map(work, tasks)
+    else:
+        partials = map(work, tasks)
+
+    return reduce(merge_aggregates, partials, {})
@@ -0,0 +1,112 @@
+import queue
+import threading
+from functools import partial
+from glob import glob
+from typing import Callable, Iterator, List, Sequence, TypeVar, Union
+from src.columnar import CarSalesChunk, car_sales_chunks, DEFAULT_CHUNK_SIZE
+
+T = TypeVar('T')
+
+# A CSV path, a glob pattern ("data/sales-*.csv.gz") or a list of either
+Source = Union[str, Sequence[str]]
+
+# Shards read at the same time, and batches buffered per reader thread
+DEFAULT_READERS = 4
+PREFETCH_PER_READER = 2
+
+
+def expand_paths(source: Source) -> List[str]:
+
+    # Turns a source into a list of files: glob patterns are expanded (sorted),
+    # plain paths are kept as they are, even if they do not exist.
+    patterns = [source] if isinstance(source, str) else list(source)
+    paths = []
+    for pattern in patterns:
+        if any(char in pattern for char in '*?['):
+            paths.extend(sorted(glob(pattern)))
+        else:
+            paths.append(pattern)
+    return paths
+
+
+class _Failure:
+    # Carries an exception from a reader thread to the consuming thread
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def prefetched(producers: Sequence[Callable[[], Iterator[T]]],
+               readers: int = DEFAULT_READERS,
+               prefetch: int = PREFETCH_PER_READER) -> Iterator[T]:
+    """
+    Runs several producers on reader threads and yields their items as they arrive.
+
+    Up to `readers` producers run at once; each is started when a thread
+    becomes free. A bounded queue of readers * prefetch items applies
+    backpressure, so readers stay at most that far ahead of the consumer.
+    Items of one producer keep their order, but producers interleave. An
+    exception in a producer is re-raised here, and closing the iterator early
+    stops the readers. With one producer or one reader everything runs inline.
+    """
+    if readers <= 0 or prefetch <= 0:
+        raise ValueError("readers and prefetch must be positive")
+    if len(producers) <= 1 or readers == 1:
+        for producer in producers:
+            yield from producer()
+        return
+
+    items = queue.Queue(maxsize=readers * prefetch)
+    pending = iter(producers)
+    pending_lock = threading.Lock()
+    stop = threading.Event()
+    done = object()
+
+    def read() -> None:
+        try:
+            while not stop.is_set():
+                with pending_lock:
+                    producer = next(pending, None)
+                if producer is None:
+                    break
+                for item in producer():
+                    items.put(item)
+                    if stop.is_set():
+                        return
+        except BaseException as error:
+            items.put(_Failure(error))
+        items.put(done)
+
+    threads = [threading.Thread(target=read, daemon=True) for _ in range(min(readers, len(producers)))]
+    for thread in threads:
+        thread.start()
+    try:
+        finished = 0
+        while finished < len(threads):
+            item = items.get()
+            if item is done:
+                finished += 1
+            elif isinstance(item, _Failure):
+                raise item.error
+            else:
+                yield item
+    finally:
+        # Unblock readers waiting on a full queue so they see `stop` and exit
+        stop.set()
+        while any(thread.is_alive() for thread in threads):
+            try:
+                items.get(timeout=0.05)
+            except queue.Empty:
+                pass
+
+
+def sharded_chunks(source: Source, readers: int = DEFAULT_READERS,
+                   chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[CarSalesChunk]:
+
+    # car_sales_chunks over every file of `source` (plain or .gz), with up to
+    # `readers` files read and decompressed concurrently. Each file keeps its
+    # own string dictionaries, so codes are only comparable within a file.
+    paths = expand_paths(source)
+    if not paths:
+        print(f"Error: No files match {source}.")
+        return
+    yield from prefetched([partial(car_sales_chunks, path, chunk_size) for path in paths], readers)
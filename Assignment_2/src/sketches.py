@@ -0,0 +1,227 @@
+import math
+import heapq
+import hashlib
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+# Fixed-size, mergeable summaries for streams too large to aggregate exactly.
+# Every sketch takes its accuracy as a parameter, supports update()/add() per
+# row and merge() of two sketches built with the same parameters (e.g. one
+# per file shard or per worker process).
+
+
+class SpaceSaving:
+    """
+    Approximate top-k heavy hitters (Metwally et al. Space-Saving).
+
+    Keeps at most `capacity` counters. A key that is not tracked replaces the
+    smallest counter and inherits its count as possible overestimation, so
+    every reported count is within `error` of the true count and the error
+    is at most total / capacity. Pass `epsilon` instead of `capacity` to get
+    capacity = ceil(1 / epsilon).
+    """
+    def __init__(self, capacity: Optional[int] = None, epsilon: Optional[float] = None):
+        if capacity is None:
+            if epsilon is None or not 0 < epsilon < 1:
+                raise ValueError("Give a positive capacity or an epsilon in (0, 1)")
+            capacity = math.ceil(1 / epsilon)
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.total = 0
+        # key -> [count, error]
+        self.counters: Dict[Hashable, List[float]] = {}
+        # Min-heap of (count, key); stale entries are skipped when popped
+        self._heap: List[Tuple[float, Hashable]] = []
+
+    def update(self, key: Hashable, weight: float = 1) -> None:
+        self.total += weight
+        counter = self.counters.get(key)
+        if counter is not None:
+            counter[0] += weight
+        elif len(self.counters) < self.capacity:
+            counter = self.counters[key] = [weight, 0]
+        else:
+            smallest = self._pop_min()
+            floor = self.counters.pop(smallest)[0]
+            counter = self.counters[key] = [floor + weight, floor]
+        heapq.heappush(self._heap, (counter[0], key))
+        if len(self._heap) > 4 * self.capacity:
+            self._rebuild_heap()
+
+    def top(self, k: Optional[int] = None) -> List[Tuple[Hashable, float, float]]:
+        # (key, estimated count, maximum overestimation), highest count first
+        ranked = sorted(((key, c[0], c[1]) for key, c in self.counters.items()),
+                        key=lambda item: item[1], reverse=True)
+        return ranked if k is None else ranked[:k]
+
+    def merge(self, other: 'SpaceSaving') -> 'SpaceSaving':
+        # Mergeable summary: a key missing from one side may have had up to
+        # that side's smallest count there, which is added as count and error.
+        merged = SpaceSaving(capacity=max(self.capacity, other.capacity))
+        merged.total = self.total + other.total
+        floor_self = self._floor()
+        floor_other = other._floor()
+        combined = {}
+        for key in self.counters.keys() | other.counters.keys():
+            mine = self.counters.get(key, [floor_self, floor_self])
+            theirs = other.counters.get(key, [floor_other, floor_other])
+            combined[key] = [mine[0] + theirs[0], mine[1] + theirs[1]]
+        kept = heapq.nlargest(merged.capacity, combined.items(), key=lambda item: item[1][0])
+        merged.counters = dict(kept)
+        merged._rebuild_heap()
+        return merged
+
+    def _floor(self) -> float:
+        # Smallest tracked count if the sketch is full; untracked keys cannot exceed it
+        if len(self.counters) < self.capacity:
+            return 0
+        return min(c[0] for c in self.counters.values())
+
+    def _pop_min(self) -> Hashable:
+        while True:
+            count, key = heapq.heappop(self._heap)
+            counter = self.counters.get(key)
+            if counter is not None and counter[0] == count:
+                return key
+
+    def _rebuild_heap(self) -> None:
+        self._heap = [(c[0], key) for key, c in self.counters.items()]
+        heapq.heapify(self._heap)
+
+
+class HyperLogLog:
+    """
+    Approximate distinct count (Flajolet et al. HyperLogLog).
+
+    Uses 2**precision one-byte registers; the standard error is about
+    1.04 / sqrt(2**precision) (precision 12: 4 KiB, ~1.6%). Pass
+    `error` instead of `precision` to pick the smallest precision that meets it.
+    """
+    def __init__(self, precision: Optional[int] = None, error: Optional[float] = None):
+        if precision is None:
+            if error is None or error <= 0:
+                raise ValueError("Give a precision or a positive error")
+            precision = math.ceil(math.log2((1.04 / error) ** 2))
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self.precision = precision
+        self.m = 1 << precision
+        self.registers = bytearray(self.m)
+
+    def add(self, value: str) -> None:
+        hashed = int.from_bytes(hashlib.blake2b(value.encode('utf-8'), digest_size=8).digest(), 'big')
+        index = hashed >> (64 - self.precision)
+        rest = hashed & ((1 << (64 - self.precision)) - 1)
+        # Position of the first 1-bit in the remaining 64 - precision bits
+        rank = (64 - self.precision) - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def update(self, values: Iterable[str]) -> None:
+        for value in values:
+            self.add(value)
+
+    def count(self) -> float:
+        m = self.m
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(m, 0.7213 / (1 + 1.079 / m))
+        estimate = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            # Small range: linear counting is more accurate
+            return m * math.log(m / zeros)
+        return estimate
+
+    def merge(self, other: 'HyperLogLog') -> 'HyperLogLog':
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLogs of different precision")
+        merged = HyperLogLog(self.precision)
+        merged.registers = bytearray(map(max, self.registers, other.registers))
+        return merged
+
+
+class QuantileSketch:
+    """
+    Approximate quantiles with relative error (DDSketch, Masson et al.).
+
+    Non-negative values fall into logarithmic buckets of ratio
+    gamma = (1 + relative_error) / (1 - relative_error), so every reported
+    quantile is within `relative_error` of a true value at that rank. Memory
+    grows with the log of the value range, not the number of values; past
+    `max_buckets` the lowest buckets are collapsed together.
+    """
+    def __init__(self, relative_error: float = 0.01, max_buckets: int = 2048):
+        if not 0 < relative_error < 1:
+            raise ValueError("relative_error must be in (0, 1)")
+        if max_buckets <= 0:
+            raise ValueError("max_buckets must be positive")
+        self.relative_error = relative_error
+        self.max_buckets = max_buckets
+        self.gamma = (1 + relative_error) / (1 - relative_error)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets: Dict[int, int] = {}
+        self.zeros = 0
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        if value < 0:
+            raise ValueError("QuantileSketch only accepts non-negative values")
+        self.count += 1
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if value == 0:
+            self.zeros += 1
+            return
+        index = math.ceil(math.log(value) / self._log_gamma)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+
+    def update(self, values: Iterable[float]) -> None:
+        for value in values:
+            self.add(value)
+
+    def quantile(self, q: float) -> float:
+        if not 0 <= q <= 1:
+            raise ValueError("q must be in [0, 1]")
+        if not self.count:
+            return math.nan
+        # The extremes are tracked exactly
+        if q == 0:
+            return self.min
+        if q == 1:
+            return self.max
+        rank = q * (self.count - 1)
+        seen = self.zeros
+        if rank < seen:
+            return 0.0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen > rank:
+                # Midpoint (in relative terms) of the bucket (gamma^(i-1), gamma^i]
+                estimate = 2 * self.gamma ** index / (self.gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        if other.relative_error != self.relative_error:
+            raise ValueError("Cannot merge QuantileSketches of different relative_error")
+        merged = QuantileSketch(self.relative_error, max(self.max_buckets, other.max_buckets))
+        merged.buckets = dict(self.buckets)
+        for index, count in other.buckets.items():
+            merged.buckets[index] = merged.buckets.get(index, 0) + count
+        merged.zeros = self.zeros + other.zeros
+        merged.count = self.count + other.count
+        merged.min = min(self.min, other.min)
+        merged.max = max(self.max, other.max)
+        while len(merged.buckets) > merged.max_buckets:
+            merged._collapse()
+        return merged
+
+    def _collapse(self) -> None:
+        # Fold the two lowest buckets together (accuracy is kept for high quantiles)
+        lowest, second = sorted(self.buckets)[:2]
+        self.buckets[second] += self.buckets.pop(lowest)
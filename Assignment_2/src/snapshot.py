@@ -0,0 +1,207 @@
+import os
+import sys
+import json
+import mmap
+import struct
+from array import array
+from typing import Dict, Iterator, List, Optional, Sequence
+from src.models import CarSale
+from src.columnar import car_sales_chunks, COLUMN_TYPECODES, STRING_COLUMNS
+
+# File layout (native byte order, recorded in the header):
+#   8 bytes   MAGIC
+#   4 bytes   header length N (little-endian uint32)
+#   N bytes   JSON header: row count, source size/mtime, string dictionaries,
+#             and {column: {typecode, offset, count}}
+#   ...       column data, each column starting on an 8-byte boundary
+MAGIC = b"CARSNAP1"
+ALIGNMENT = 8
+
+# Column typecodes as produced by the columnar loader
+COLUMN_TYPES = COLUMN_TYPECODES
+
+
+def default_snapshot_path(csv_path: str) -> str:
+    return csv_path + ".snap"
+
+
+def write_snapshot(csv_path: str, snapshot_path: Optional[str] = None) -> str:
+
+    # Converts a CSV into a snapshot file (via the columnar loader) and returns its path.
+    snapshot_path = snapshot_path or default_snapshot_path(csv_path)
+    stat = os.stat(csv_path)
+    columns = {name: array(typecode) for name, typecode in COLUMN_TYPES.items()}
+    dictionaries = None
+    for chunk in car_sales_chunks(csv_path):
+        dictionaries = chunk.dictionaries
+        for name, values in columns.items():
+            values.extend(getattr(chunk, name))
+
+    header = {
+        'rows': len(columns['id']),
+        'byteorder': sys.byteorder,
+        'source_size': stat.st_size,
+        'source_mtime_ns': stat.st_mtime_ns,
+        'dictionaries': {name: (dictionaries[name].values if dictionaries else [])
+                         for name in STRING_COLUMNS},
+        'columns': {},
+    }
+    # Offsets depend on the header length, which depends on the offsets:
+    # lay the columns out after a header padded to a fixed size.
+    layout_probe = json.dumps(dict(header, columns={
+        name: {'typecode': t, 'offset': 2**62, 'count': 2**62} for name, t in COLUMN_TYPES.items()
+    })).encode('utf-8')
+    data_start = _align(len(MAGIC) + 4 + len(layout_probe))
+    offset = data_start
+    for name, values in columns.items():
+        header['columns'][name] = {'typecode': values.typecode, 'offset': offset, 'count': len(values)}
+        offset = _align(offset + len(values) * values.itemsize)
+
+    encoded = json.dumps(header).encode('utf-8')
+    # Written column by column to a temporary file, then renamed into place
+    tmp_path = snapshot_path + ".tmp"
+    with open(tmp_path, 'wb') as out:
+        out.write(MAGIC + struct.pack('<I', len(encoded)) + encoded)
+        for name, values in columns.items():
+            out.write(b'\0' * (header['columns'][name]['offset'] - out.tell()))
+            values.tofile(out)
+    os.replace(tmp_path, snapshot_path)
+    return snapshot_path
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+class Snapshot:
+    """
+    Read-only, memory-mapped view of a snapshot file.
+
+    columns[name] is a memoryview cast to the column's type straight over the
+    mapped file, so opening a snapshot reads nothing but the header and
+    pages are loaded on demand. Use it as a context manager (or call close())
+    once every memoryview taken from it is released.
+    """
+    def __init__(self, snapshot_path: str):
+        self.path = snapshot_path
+        with open(snapshot_path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if self._mmap[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"{snapshot_path} is not a car sales snapshot")
+            (length,) = struct.unpack_from('<I', self._mmap, len(MAGIC))
+            start = len(MAGIC) + 4
+            self.header = json.loads(self._mmap[start:start + length].decode('utf-8'))
+            if self.header['byteorder'] != sys.byteorder:
+                raise ValueError(f"{snapshot_path} was written on a {self.header['byteorder']}-endian machine")
+        except Exception:
+            self._mmap.close()
+            raise
+
+        self.dictionaries: Dict[str, List[str]] = self.header['dictionaries']
+        self._buffer = memoryview(self._mmap)
+        self.columns: Dict[str, memoryview] = {}
+        for name, info in self.header['columns'].items():
+            nbytes = info['count'] * array(info['typecode']).itemsize
+            self.columns[name] = self._buffer[info['offset']:info['offset'] + nbytes].cast(info['typecode'])
+
+    def __len__(self) -> int:
+        return self.header['rows']
+
+    def __enter__(self) -> 'Snapshot':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for view in self.columns.values():
+            view.release()
+        self.columns = {}
+        self._buffer.release()
+        self._mmap.close()
+
+    def is_current(self, csv_path: str) -> bool:
+        # True while the source CSV has the size and mtime it had when the snapshot was written
+        try:
+            stat = os.stat(csv_path)
+        except FileNotFoundError:
+            return False
+        return (stat.st_size == self.header['source_size']
+                and stat.st_mtime_ns == self.header['source_mtime_ns'])
+
+    def strings(self, name: str) -> List[str]:
+        # Decoded view of a dictionary-encoded column
+        values = self.dictionaries[name]
+        return [values[code] for code in self.columns[name]]
+
+    def rows(self) -> Iterator[CarSale]:
+        # CarSale view, so existing functional_aggregate lambdas work unchanged
+        c = self.columns
+        brands, models = self.dictionaries['brand'], self.dictionaries['model']
+        statuses, colors = self.dictionaries['title_status'], self.dictionaries['color']
+        for i in range(len(self)):
+            yield CarSale(
+                id=c['id'][i],
+                price=c['price'][i],
+                brand=brands[c['brand'][i]],
+                model=models[c['model'][i]],
+                year=c['year'][i],
+                title_status=statuses[c['title_status'][i]],
+                mileage=c['mileage'][i],
+                color=colors[c['color'][i]]
+            )
+
+
+def open_snapshot(csv_path: str, snapshot_path: Optional[str] = None) -> Snapshot:
+
+    # Opens the snapshot of a CSV, (re)writing it first if it is missing or stale.
+    snapshot_path = snapshot_path or default_snapshot_path(csv_path)
+    if os.path.exists(snapshot_path):
+        snapshot = Snapshot(snapshot_path)
+        if snapshot.is_current(csv_path):
+            return snapshot
+        snapshot.close()
+    return Snapshot(write_snapshot(csv_path, snapshot_path))
+
+
+def snapshot_aggregate(
+    snapshot: Snapshot,
+    key_columns: Sequence[str] = ('brand', 'model'),
+    value_column: str = 'price'
+) -> Dict[str, Dict[str, float]]:
+    """
+    {key: {'count', 'revenue'}} straight from snapshot columns.
+
+    Groups on the dictionary codes of `key_columns` (joined with a space, so
+    the default gives the same keys as CarSale.full_name) and sums
+    `value_column`; strings are only decoded once per group at the end.
+    Same output as functional_aggregate with a count/revenue value_mapper.
+    """
+    for name in key_columns:
+        if name not in snapshot.dictionaries:
+            raise ValueError(f"{name!r} is not a dictionary-encoded column")
+    values = snapshot.columns[value_column]
+    codes = [snapshot.columns[name] for name in key_columns]
+
+    groups: Dict[tuple, List[float]] = {}
+    for group, value in zip(zip(*codes), values):
+        current = groups.get(group)
+        if current is None:
+            groups[group] = [1.0, value]
+        else:
+            current[0] += 1
+            current[1] += value
+
+    names = [snapshot.dictionaries[name] for name in key_columns]
+    result: Dict[str, Dict[str, float]] = {}
+    for group, (count, revenue) in groups.items():
+        key = " ".join(dictionary[code] for dictionary, code in zip(names, group))
+        current = result.get(key)
+        if current is None:
+            result[key] = {'count': count, 'revenue': revenue}
+        else:
+            # Different code tuples can join to the same text (e.g. "a b" + "c" vs "a" + "b c")
+            current['count'] += count
+            current['revenue'] += revenue
+    return result
@@ -1,29 +1,155 @@
 import csv
-from typing import Iterator
+from functools import partial
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence
 from src.models import CarSale
+from src.columnar import open_csv, ID_MIN, ID_MAX, INT_MIN, INT_MAX
+from src.shards import Source, DEFAULT_READERS, expand_paths, prefetched, sharded_chunks
 
-def car_sales_stream(filepath: str) -> Iterator[CarSale]:
+# CarSale fields in constructor order, and how the numeric ones are converted
+FIELDS = ('id', 'price', 'brand', 'model', 'year', 'title_status', 'mileage', 'color')
+NUMERIC_FIELDS = {'id': int, 'price': float, 'year': int, 'mileage': float}
+INT_RANGES = {'id': (ID_MIN, ID_MAX), 'year': (INT_MIN, INT_MAX)}
 
-    #  Lazy generator: Reads CSV one line at a time.
+# Memoized results kept per range filter (enough for year/status-like columns)
+FILTER_MEMO_SIZE = 4096
+
+# Rows handed over per batch by a projected shard reader
+BATCH_ROWS = 4096
+
+
+def car_sales_stream(
+    filepath: Source,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[Dict[str, Callable[[str], bool]]] = None,
+    readers: int = DEFAULT_READERS
+) -> Iterator[CarSale]:
+
+    #  Lazy generator: yields one CarSale at a time.
+    #  Rows are parsed in columnar chunks (see src/columnar.py) and turned back
+    #  into CarSale objects here, so string fields are shared between rows.
+    #  Malformed rows are skipped and a missing file is reported, not raised.
+    #
+    #  columns: only these fields are converted; the others are left as None.
+    #  filters: {column: test on the raw field text}, e.g. equals()/between()
+    #  below. A row failing any test is dropped before anything is converted.
+    #
+    #  filepath may also be a glob pattern or a list of paths, plain or .gz:
+    #  up to `readers` files are then read concurrently (see src/shards.py)
+    #  and their rows merged into this one stream, not in file order.
+    if columns is None and not filters:
+        return _full_rows(filepath, readers)
+    columns = FIELDS if columns is None else tuple(columns)
+    filters = filters or {}
+    unknown = (set(columns) | set(filters)) - set(FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown columns: {sorted(unknown)}")
+    return _projected_rows(filepath, columns, filters, readers)
+
+
+def equals(*values: str) -> Callable[[str], bool]:
+
+    # Filter: the raw field is one of `values`, e.g. {'title_status': equals('clean')}
+    return frozenset(values).__contains__
+
+
+def between(low: float, high: float) -> Callable[[str], bool]:
+
+    # Filter: the field is a number in [low, high], e.g. {'year': between(2015, 2018)}.
+    # Results are memoized by raw text, so a column with few distinct values
+    # (year) is converted once per value instead of once per row.
+    memo: Dict[str, bool] = {}
+
+    def test(text: str) -> bool:
+        result = memo.get(text)
+        if result is None:
+            try:
+                result = low <= float(text) <= high
+            except ValueError:
+                result = False
+            if len(memo) < FILTER_MEMO_SIZE:
+                memo[text] = result
+        return result
+    return test
+
+
+def _full_rows(source: Source, readers: int) -> Iterator[CarSale]:
+    for chunk in sharded_chunks(source, readers):
+        yield from chunk.rows()
+
+
+def _projected_rows(source: Source, columns: Sequence[str],
+                    filters: Dict[str, Callable[[str], bool]], readers: int) -> Iterator[CarSale]:
+    paths = expand_paths(source)
+    if not paths:
+        print(f"Error: No files match {source}.")
+        return
+    producers = [partial(_projected_batches, path, columns, filters) for path in paths]
+    for batch in prefetched(producers, readers):
+        yield from batch
+
+
+def _projected_batches(filepath: str, columns: Sequence[str],
+                       filters: Dict[str, Callable[[str], bool]]) -> Iterator[List[CarSale]]:
+    # One file's projected rows, in lists of BATCH_ROWS
     try:
-        with open(filepath, mode='r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                try:
-                    # Convert raw CSV strings to proper types
-                    yield CarSale(
-                        id=int(row['id']),
-                        price=float(row['price']),
-                        brand=row['brand'],
-                        model=row['model'],
-                        year=int(row['year']),
-                        title_status=row['title_status'],
-                        mileage=float(row['mileage']),
-                        color=row['color']
-                    )
-                except (ValueError, KeyError):
-                    # Skip this specific row to keep the stream alive.:
-                    continue
+        with open_csv(filepath) as f:
+            rows = projected_rows_from_lines(f, columns, filters)
+            for batch in iter(lambda: list(islice(rows, BATCH_ROWS)), []):
+                yield batch
     except FileNotFoundError:
         print(f"Error: File {filepath} not found.")
-        return
\ No newline at end of file
+        return
+
+
+def _ranged_int(low: int, high: int) -> Callable[[str], int]:
+    # Same ranges as the id/year columns of the full path
+    def convert(text: str) -> int:
+        value = int(text)
+        if not low <= value <= high:
+            raise ValueError("integer column out of range")
+        return value
+    return convert
+
+
+def projected_rows_from_lines(lines: Iterable[str], columns: Sequence[str],
+                              filters: Dict[str, Callable[[str], bool]]) -> Iterator[CarSale]:
+
+    # Parses CSV text lines (header first), testing `filters` on the raw fields
+    # and converting only `columns`. Validation, too, only covers the columns
+    # that are tested or loaded: a bad value in an unused column is not seen.
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if header is None:
+        return
+    try:
+        tests = [(header.index(name), test) for name, test in filters.items()]
+        positions = [(FIELDS.index(name), header.index(name)) for name in columns]
+    except ValueError:
+        # A missing column makes every row invalid
+        return
+
+    converters = {name: (_ranged_int(*INT_RANGES[name]) if convert is int else convert)
+                  for name, convert in NUMERIC_FIELDS.items()}
+    # Numeric columns are converted; string columns share one str per distinct value
+    loaders = [(slot, at, converters.get(FIELDS[slot]), None if FIELDS[slot] in converters else {})
+               for slot, at in positions]
+    width = len(header)
+    empty = [None] * len(FIELDS)
+
+    for row in reader:
+        if len(row) < width:
+            continue
+        for at, test in tests:
+            if not test(row[at]):
+                break
+        else:
+            values = empty.copy()
+            try:
+                for slot, at, convert, shared in loaders:
+                    text = row[at]
+                    values[slot] = convert(text) if shared is None else shared.setdefault(text, text)
+            except ValueError:
+                # Skip this specific row to keep the stream alive.
+                continue
+            yield CarSale(*values)
@@ -1,6 +1,9 @@
 import unittest
 from src.models import CarSale
-from src.analysis import functional_aggregate, get_max_entry
+from src import analysis
+from src.analysis import functional_aggregate, get_max_entry, functional_accumulate, GroupedAccumulator
+from src.analysis import vectorized_aggregate, VECTOR_METRICS
+from src.columnar import chunks_from_lines
 
 class TestFunctionalAnalysis(unittest.TestCase):
     def setUp(self):
@@ -39,5 +42,80 @@ class TestFunctionalAnalysis(unittest.TestCase):
         name, stats = get_max_entry(data, lambda x: x['revenue'])
         self.assertEqual(name, "expensive")
 
+    def test_accumulate_metrics(self):
+        # In-place accumulator reports every metric per key
+        acc = functional_accumulate(
+            iter(self.mock_stream),
+            key_selector=lambda c: c.full_name,
+            value_selector=lambda c: c.price
+        )
+        result = acc.result()
+
+        self.assertEqual(result["toyota camry"], {'count': 2, 'sum': 300.0, 'min': 100.0, 'max': 200.0, 'mean': 150.0})
+        self.assertEqual(result["bmw x5"]['mean'], 1000.0)
+        self.assertEqual(acc.result(('count',)), {"toyota camry": {'count': 2}, "bmw x5": {'count': 1}})
+        with self.assertRaises(ValueError):
+            acc.result(('median',))
+
+    def test_accumulate_matches_aggregate(self):
+        # count/sum agree with the dict-based functional_aggregate
+        aggregated = functional_aggregate(iter(self.mock_stream), lambda c: c.brand,
+                                          lambda c: {'count': 1, 'revenue': c.price})
+        accumulated = functional_accumulate(iter(self.mock_stream), lambda c: c.brand,
+                                            lambda c: c.price).result(('count', 'sum'))
+        for key, stats in aggregated.items():
+            self.assertEqual(accumulated[key]['count'], stats['count'])
+            self.assertEqual(accumulated[key]['sum'], stats['revenue'])
+
+    def test_accumulator_merge(self):
+        # Merging partial accumulators equals accumulating everything at once
+        first = functional_accumulate(iter(self.mock_stream[:2]), lambda c: c.brand, lambda c: c.price)
+        second = functional_accumulate(iter(self.mock_stream[1:]), lambda c: c.brand, lambda c: c.price)
+        merged = GroupedAccumulator().merge(first).merge(second).result()
+
+        self.assertEqual(merged["toyota"], {'count': 3, 'sum': 500.0, 'min': 100.0, 'max': 200.0, 'mean': 500.0 / 3})
+        self.assertEqual(merged["bmw"]['count'], 1)
+
+class TestVectorizedAggregate(unittest.TestCase):
+    CSV_LINES = [
+        "id,price,brand,model,year,title_status,mileage,color\n",
+        "1,100,toyota,camry,2010,clean,5000,black\n",
+        "2,200,toyota,camry,2010,clean,6000,white\n",
+        "3,1000,bmw,x5,2020,clean,1000,blue\n",
+        "4,50,toyota,corolla,2012,salvage,9000,black\n",
+    ]
+
+    def chunks(self):
+        # Chunks of two rows, so the columns are concatenated across chunks
+        return chunks_from_lines(self.CSV_LINES, chunk_size=2)
+
+    def backends(self):
+        return ['python'] + (['numpy'] if analysis.np is not None else [])
+
+    def test_matches_functional_aggregate(self):
+        # Same {key: {count, revenue}} as the lambda-based path, on every backend
+        stream = (car for chunk in self.chunks() for car in chunk.rows())
+        expected = functional_aggregate(stream, lambda c: c.full_name,
+                                        lambda c: {'count': 1, 'revenue': c.price})
+        for backend in self.backends():
+            self.assertEqual(vectorized_aggregate(self.chunks(), backend=backend), expected)
+
+    def test_all_metrics_and_numeric_keys(self):
+        # Grouping by a numeric column, with mean/min/max
+        for backend in self.backends():
+            result = vectorized_aggregate(self.chunks(), ('year',), 'mileage', VECTOR_METRICS, backend)
+            self.assertEqual(result["2010"], {'count': 2.0, 'revenue': 11000.0, 'min': 5000.0,
+                                              'max': 6000.0, 'mean': 5500.0})
+            self.assertEqual(set(result), {"2010", "2012", "2020"})
+
+    def test_empty_input_and_bad_arguments(self):
+        self.assertEqual(vectorized_aggregate(iter([]), backend='python'), {})
+        with self.assertRaises(ValueError):
+            vectorized_aggregate(self.chunks(), backend='fortran')
+        with self.assertRaises(ValueError):
+            vectorized_aggregate(self.chunks(), value_column='brand', backend='python')
+        with self.assertRaises(ValueError):
+            vectorized_aggregate(self.chunks(), metrics=('median',), backend='python')
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,113 @@
+import argparse
+import contextlib
+import gzip
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from benchmarks.datasets import generate_car_sales, synthetic_dataset
+from benchmarks.regression import add_baseline_arguments, check_baseline, compare, load_json, make_report
+
+
+class TestCompare(unittest.TestCase):
+    def compare(self, results, baseline, tolerance=0.3):
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            regressions = compare(results, baseline, tolerance, "items/s")
+        return regressions, out.getvalue()
+
+    def test_flags_only_cases_beyond_tolerance(self):
+        """Test that only a slowdown larger than the tolerance is a regression."""
+        regressions, out = self.compare({"a": 60.0, "b": 80.0, "c": 200.0},
+                                        {"a": 100.0, "b": 100.0, "c": 100.0})
+        self.assertEqual(regressions, ["a"])
+        self.assertIn("0.60x  REGRESSION", out)
+        self.assertIn("2.00x", out)
+
+    def test_new_cases_are_not_regressions(self):
+        """Test that a case missing from the baseline is reported as new."""
+        regressions, out = self.compare({"a": 1.0}, {})
+        self.assertEqual(regressions, [])
+        self.assertIn("new", out)
+
+
+class TestCheckBaseline(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.baseline = os.path.join(self.directory, "baseline.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def check(self, results, measure, save=False):
+        parser = argparse.ArgumentParser()
+        add_baseline_arguments(parser, self.baseline)
+        args = parser.parse_args(["--save-baseline"] if save else [])
+        report = make_report("test", "items/s", {}, dict(results))
+        with contextlib.redirect_stdout(io.StringIO()):
+            check_baseline(report, args, measure)
+        return report
+
+    def test_saved_baseline_round_trips(self):
+        """Test that a saved report is loaded back with the same results."""
+        self.check({"a": 100.0}, measure=None, save=True)
+        self.assertEqual(load_json(self.baseline)["results"], {"a": 100.0})
+
+    def test_suspect_case_is_measured_again(self):
+        """Test that a slow case is re-measured and only fails if it stays slow."""
+        self.check({"a": 100.0, "b": 100.0}, measure=None, save=True)
+        remeasured = []
+
+        def measure(name):
+            remeasured.append(name)
+            return 95.0
+        report = self.check({"a": 50.0, "b": 90.0}, measure)
+        self.assertEqual(remeasured, ["a"])
+        self.assertEqual(report["results"]["a"], 95.0)
+
+        with self.assertRaises(SystemExit) as raised:
+            self.check({"a": 50.0}, lambda name: 40.0)
+        self.assertEqual(raised.exception.code, 1)
+
+
+class TestSyntheticDataset(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.source = os.path.join(self.directory, "sample.csv")
+        with open(self.source, 'w', encoding='utf-8', newline='') as f:
+            f.write("id,price,brand,model,year,title_status,mileage,color\n"
+                    "1,2000,toyota,camry,2010,clean,5000,black\n"
+                    "2,3000,honda,civic,2016,clean,7000,red\n"
+                    "3,4000,ford,focus,2017,salvage,8000,blue\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def generate(self, name, seed, **kwargs):
+        path = os.path.join(self.directory, name)
+        generate_car_sales(path, 200, seed, source=self.source, **kwargs)
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def test_same_seed_gives_same_bytes(self):
+        """Test that a seed always produces a byte-identical file."""
+        first = self.generate("a.csv", seed=1)
+        self.assertEqual(first, self.generate("b.csv", seed=1))
+        self.assertNotEqual(first, self.generate("c.csv", seed=2))
+        self.assertEqual(len(first.splitlines()), 201)
+
+    def test_invalid_rows_follow_the_seed(self):
+        """Test that the bad-price rows are part of the seeded draw."""
+        first = self.generate("a.csv", seed=1, invalid_rate=0.3)
+        self.assertIn(b",INVALID,", first)
+        self.assertEqual(first, self.generate("b.csv", seed=1, invalid_rate=0.3))
+
+    def test_compressed_rows_match(self):
+        """Test that the .csv.gz variant holds the same rows as the plain file."""
+        plain = synthetic_dataset(200, self.directory, seed=4, source=self.source)
+        packed = synthetic_dataset(200, self.directory, seed=4, compress=True, source=self.source)
+        self.assertTrue(packed.endswith(".csv.gz"))
+        with open(plain, 'rb') as f, gzip.open(packed, 'rb') as g:
+            self.assertEqual(f.read(), g.read())
+        # An existing file is reused, not regenerated
+        self.assertEqual(synthetic_dataset(200, self.directory, seed=4, source=self.source), plain)
@@ -0,0 +1,209 @@
+import os
+import shutil
+import tempfile
+import unittest
+from functools import partial
+from operator import attrgetter
+from unittest.mock import patch
+from src.cache import (AggregateCache, cached_aggregate, cached_multi_aggregate, callable_identity,
+                       file_fingerprint)
+from src.multi_query import Query
+from src.analysis import count_and_revenue
+
+CSV_DATA = (
+    "id,price,brand,model,year,title_status,mileage,color\n"
+    "1,2000,toyota,camry,2010,clean,5000,black\n"
+    "2,3000,honda,civic,2012,clean,6000,red\n"
+)
+
+PRICE_FACTOR = 1.0
+
+def scaled_price(c, factor=1):
+    return c.price * factor * PRICE_FACTOR
+
+class Selector:
+    def __init__(self, column):
+        self.column = column
+
+    def __repr__(self):
+        return f"Selector({self.column!r})"
+
+    def select(self, c):
+        return getattr(c, self.column)
+
+class Opaque:
+    def __call__(self, c):
+        return c.brand
+
+class TestAggregateCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.directory, "sales.csv")
+        with open(self.csv_path, 'w', encoding='utf-8') as f:
+            f.write(CSV_DATA)
+        self.cache = AggregateCache(os.path.join(self.directory, "cache"))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_second_call_is_served_from_cache(self):
+        """Test that a repeated aggregation does not read the CSV rows again."""
+        first = cached_aggregate(self.csv_path, attrgetter('brand'), count_and_revenue, self.cache)
+        with patch("src.cache.functional_aggregate") as aggregate:
+            second = cached_aggregate(self.csv_path, attrgetter('brand'), count_and_revenue, self.cache)
+        aggregate.assert_not_called()
+        self.assertEqual(first, second)
+        self.assertEqual(second["honda"]["revenue"], 3000.0)
+
+    def test_cache_persists_on_disk(self):
+        """Test that a new cache object over the same directory sees earlier entries."""
+        cached_aggregate(self.csv_path, attrgetter('brand'), count_and_revenue, self.cache)
+        reopened = AggregateCache(self.cache.directory)
+        self.assertEqual(len(reopened), 1)
+
+    def test_changed_file_or_query_misses(self):
+        """Test that new content or a different grouping key gives a fresh result."""
+        cached_aggregate(self.csv_path, attrgetter('brand'), count_and_revenue, self.cache)
+        by_model = cached_aggregate(self.csv_path, attrgetter('model'), count_and_revenue, self.cache)
+        self.assertIn("camry", by_model)
+
+        with open(self.csv_path, 'a', encoding='utf-8') as f:
+            f.write("3,1000,honda,fit,2015,clean,100,blue\n")
+        by_brand = cached_aggregate(self.csv_path, attrgetter('brand'), count_and_revenue, self.cache)
+        self.assertEqual(by_brand["honda"]["count"], 2)
+        self.assertEqual(len(self.cache), 3)
+
+    def test_glob_source(self):
+        """Test that a glob of shards is cached and a changed shard misses."""
+        shard = os.path.join(self.directory, "sales-2.csv")
+        with open(shard, 'w', encoding='utf-8') as f:
+            f.write(CSV_DATA.replace("honda", "kia"))
+        pattern = os.path.join(self.directory, "*.csv")
+        result = cached_aggregate(pattern, attrgetter('brand'), count_and_revenue, self.cache)
+        self.assertEqual(result["toyota"]["count"], 2)
+        self.assertEqual(set(result), {"toyota", "honda", "kia"})
+
+        with open(shard, 'a', encoding='utf-8') as f:
+            f.write("3,1000,kia,rio,2015,clean,100,blue\n")
+        result = cached_aggregate(pattern, attrgetter('brand'), count_and_revenue, self.cache)
+        self.assertEqual(result["kia"]["count"], 2)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_cached_multi_aggregate(self):
+        """Test that a multi-query result round-trips through the cache."""
+        queries = {"by_brand": Query(attrgetter('brand'), attrgetter('price'), top_k=1)}
+        totals = {"price": attrgetter('price')}
+        first = cached_multi_aggregate(self.csv_path, queries, totals, self.cache)
+        with patch("src.cache.multi_aggregate") as aggregate:
+            second = cached_multi_aggregate(self.csv_path, queries, totals, self.cache)
+        aggregate.assert_not_called()
+        self.assertEqual(first, second)
+        self.assertEqual(second.top["by_brand"], [("honda", 3000.0)])
+        self.assertEqual(second.totals["price"]["sum"], 5000.0)
+
+        # Other top-k settings are a different query
+        queries = {"by_brand": Query(attrgetter('brand'), attrgetter('price'), top_k=2)}
+        self.assertEqual(len(cached_multi_aggregate(self.csv_path, queries, totals, self.cache).top["by_brand"]), 2)
+
+    def test_non_string_keys_survive(self):
+        """Test that int and tuple group keys come back unchanged from a warm hit."""
+        for key_selector in (attrgetter('year'), attrgetter('brand', 'year')):
+            cold = cached_aggregate(self.csv_path, key_selector, count_and_revenue, self.cache)
+            warm = cached_aggregate(self.csv_path, key_selector, count_and_revenue, self.cache)
+            self.assertEqual(cold, warm)
+        self.assertEqual(set(warm), {("toyota", 2010), ("honda", 2012)})
+
+        queries = {"by_year": Query(attrgetter('year'), attrgetter('price'), top_k=1)}
+        cached_multi_aggregate(self.csv_path, queries, cache=self.cache)
+        warm = cached_multi_aggregate(self.csv_path, queries, cache=self.cache)
+        leader = warm.top["by_year"][0][0]
+        self.assertEqual(warm.groups["by_year"][leader]["sum"], 3000.0)
+
+    def test_fingerprint_covers_content(self):
+        """Test that content_hash=True tells apart a same-size rewrite with the same mtime."""
+        before = file_fingerprint(self.csv_path, content_hash=True)
+        stat = os.stat(self.csv_path)
+        with open(self.csv_path, 'w', encoding='utf-8') as f:
+            f.write(CSV_DATA.replace("2000", "9000"))
+        os.utime(self.csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        after = file_fingerprint(self.csv_path, content_hash=True)
+        self.assertEqual(before[:3], after[:3])
+        self.assertNotEqual(before[3], after[3])
+        self.assertEqual(file_fingerprint(self.csv_path), before[:3])
+
+    def test_warm_hit_does_not_read_the_file(self):
+        """Test that by default a warm hit only stats the CSV."""
+        cached_aggregate(self.csv_path, attrgetter('brand'), count_and_revenue, self.cache)
+        with patch("src.cache._content_hash") as content_hash, \
+             patch("src.cache.functional_aggregate") as aggregate:
+            cached_aggregate(self.csv_path, attrgetter('brand'), count_and_revenue, self.cache)
+        content_hash.assert_not_called()
+        aggregate.assert_not_called()
+
+    def test_callable_identity(self):
+        """Test that equal lambdas share an identity and different ones do not."""
+        self.assertEqual(callable_identity(lambda c: c.brand), callable_identity(lambda c: c.brand))
+        self.assertNotEqual(callable_identity(lambda c: c.brand), callable_identity(lambda c: c.model))
+        self.assertNotEqual(callable_identity(attrgetter('brand')), callable_identity(attrgetter('model')))
+
+    def test_identity_covers_defaults_and_globals(self):
+        """Test that changed defaults or module constants give a new identity."""
+        def with_default(c, factor=1.0):
+            return c.price * factor
+        before = callable_identity(with_default)
+        with_default.__defaults__ = (2.0,)
+        self.assertNotEqual(before, callable_identity(with_default))
+
+        global PRICE_FACTOR
+        before = callable_identity(scaled_price)
+        PRICE_FACTOR = 3.0
+        try:
+            self.assertNotEqual(before, callable_identity(scaled_price))
+        finally:
+            PRICE_FACTOR = 1.0
+
+    def test_identity_of_partials_and_methods(self):
+        """Test that partials and bound methods are unwrapped into stable identities."""
+        self.assertEqual(callable_identity(partial(scaled_price, factor=2)),
+                         callable_identity(partial(scaled_price, factor=2)))
+        self.assertNotEqual(callable_identity(partial(scaled_price, factor=2)),
+                            callable_identity(partial(scaled_price, factor=3)))
+        self.assertNotIn(" at 0x", callable_identity(Selector('brand').select))
+        self.assertEqual(callable_identity(Selector('brand').select), callable_identity(Selector('brand').select))
+        self.assertNotEqual(callable_identity(Selector('brand').select), callable_identity(Selector('model').select))
+
+    def test_unstable_identity_is_not_cached(self):
+        """Test that callables without a stable identity need an explicit key to be cached."""
+        selector = Opaque()
+        with self.assertRaises(ValueError):
+            callable_identity(selector)
+        result = cached_aggregate(self.csv_path, selector, count_and_revenue, self.cache)
+        self.assertEqual(result["honda"]["count"], 1)
+        self.assertEqual(len(self.cache), 0)
+
+        cached_aggregate(self.csv_path, selector, count_and_revenue, self.cache, key="by-brand")
+        self.assertEqual(len(self.cache), 1)
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry goes first once a limit is hit."""
+        cache = AggregateCache(os.path.join(self.directory, "small"), max_entries=2)
+        cache.put("a", {"x": {"count": 1}})
+        cache.put("b", {"x": {"count": 2}})
+        cache.get("a")
+        cache.put("c", {"x": {"count": 3}})
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertFalse(os.path.exists(os.path.join(cache.directory, "b.json")))
+
+    def test_size_limit(self):
+        """Test that entries are evicted to respect max_bytes and oversized results are skipped."""
+        cache = AggregateCache(os.path.join(self.directory, "bytes"), max_bytes=60)
+        cache.put("a", {"key": {"count": 1.0, "revenue": 2.0}})
+        cache.put("b", {"key": {"count": 3.0, "revenue": 4.0}})
+        self.assertLessEqual(cache.total_bytes, 60)
+        self.assertIsNone(cache.get("a"))
+        cache.put("big", {str(i): {"count": i} for i in range(100)})
+        self.assertIsNone(cache.get("big"))
+
+if __name__ == '__main__':
+    unittest.main()
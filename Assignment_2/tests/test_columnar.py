@@ -0,0 +1,91 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch, mock_open
+from src.columnar import car_sales_chunks, StringDictionary
+from src.streams import car_sales_stream
+
+CSV_DATA = (
+    "id,price,brand,model,year,title_status,mileage,color\n"
+    "1,2000,toyota,camry,2010,clean,5000,black\n"
+    "2,INVALID,toyota,camry,2010,clean,5000,black\n"
+    "3,3000,honda,civic,2012,clean,6000,red\n"
+    "4,4000,toyota,corolla,2014,salvage,7000.5,black\n"
+    "5,5000,honda\n"
+)
+
+class TestColumnarLoader(unittest.TestCase):
+    def test_chunk_columns(self):
+        """Test that rows are split into typed, dictionary-encoded columns."""
+        with patch("builtins.open", mock_open(read_data=CSV_DATA)):
+            chunks = list(car_sales_chunks("dummy.csv"))
+
+        self.assertEqual(len(chunks), 1)
+        chunk = chunks[0]
+        self.assertEqual(list(chunk.id), [1, 3, 4])
+        self.assertEqual(chunk.price.typecode, 'd')
+        self.assertEqual(list(chunk.mileage), [5000.0, 6000.0, 7000.5])
+        self.assertEqual(chunk.strings('brand'), ["toyota", "honda", "toyota"])
+        # Repeated values share one dictionary code
+        self.assertEqual(chunk.brand[0], chunk.brand[2])
+        self.assertEqual(len(chunk.dictionaries['color']), 2)
+
+    def test_chunk_size(self):
+        """Test that chunks hold at most chunk_size rows and share dictionaries."""
+        with patch("builtins.open", mock_open(read_data=CSV_DATA)):
+            chunks = list(car_sales_chunks("dummy.csv", chunk_size=2))
+
+        self.assertEqual([len(c) for c in chunks], [2, 1])
+        self.assertIs(chunks[0].dictionaries, chunks[1].dictionaries)
+
+    def test_row_view_matches_columns(self):
+        """Test that the CarSale row view returns the same values as the columns."""
+        with patch("builtins.open", mock_open(read_data=CSV_DATA)):
+            rows = list(car_sales_stream("dummy.csv"))
+
+        self.assertEqual([r.id for r in rows], [1, 3, 4])
+        self.assertEqual(rows[2].full_name, "toyota corolla")
+        self.assertEqual(rows[2].title_status, "salvage")
+
+    def test_column_order_and_missing_columns(self):
+        """Test that columns are found by name, and a missing column yields nothing."""
+        reordered = "price,id,color,mileage,year,model,brand,title_status\n10,7,red,1,2000,a,b,clean\n"
+        with patch("builtins.open", mock_open(read_data=reordered)):
+            row = next(car_sales_stream("dummy.csv"))
+        self.assertEqual((row.id, row.price, row.brand), (7, 10.0, "b"))
+
+        with patch("builtins.open", mock_open(read_data="id,price\n1,2\n")):
+            self.assertEqual(list(car_sales_chunks("dummy.csv")), [])
+
+    def test_missing_file(self):
+        """Test that a missing file is reported and yields nothing."""
+        missing = os.path.join(tempfile.gettempdir(), "does_not_exist_car_sales.csv")
+        with patch("builtins.print") as printed:
+            self.assertEqual(list(car_sales_chunks(missing)), [])
+        printed.assert_called_once()
+
+    def test_large_ids(self):
+        """Test that ids beyond 32 bits are kept and ids beyond 64 bits are skipped with a warning."""
+        data = (CSV_DATA.splitlines(keepends=True)[0]
+                + "3000000000,2000,toyota,camry,2010,clean,5000,black\n"
+                + f"{2 ** 70},3000,honda,civic,2012,clean,6000,red\n")
+        with patch("builtins.open", mock_open(read_data=data)):
+            with self.assertLogs("src.columnar", level="WARNING") as logs:
+                rows = list(car_sales_stream("dummy.csv"))
+        self.assertEqual([r.id for r in rows], [3000000000])
+        self.assertIn("Skipped 1 rows", logs.output[0])
+
+        with patch("builtins.open", mock_open(read_data=data)):
+            projected = list(car_sales_stream("dummy.csv", columns=('id', 'price')))
+        self.assertEqual([r.id for r in projected], [3000000000])
+
+    def test_string_dictionary(self):
+        """Test encode/decode round trip of the string dictionary."""
+        dictionary = StringDictionary()
+        self.assertEqual(dictionary.encode("a"), 0)
+        self.assertEqual(dictionary.encode("b"), 1)
+        self.assertEqual(dictionary.encode("a"), 0)
+        self.assertEqual(dictionary[1], "b")
+
+if __name__ == '__main__':
+    unittest.main()
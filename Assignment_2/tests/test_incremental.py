@@ -0,0 +1,122 @@
+import os
+import shutil
+import tempfile
+import unittest
+from operator import attrgetter
+from src.analysis import count_and_revenue, functional_aggregate
+from src.incremental import IncrementalAggregator
+from src.streams import car_sales_stream
+
+HEADER = "id,price,brand,model,year,title_status,mileage,color\n"
+
+class TestIncrementalAggregator(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.directory, "sales.csv")
+        self.write(HEADER + "1,2000,toyota,camry,2010,clean,5000,black\n", mode='w')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, text, mode='a'):
+        with open(self.csv_path, mode, encoding='utf-8', newline='') as f:
+            f.write(text)
+
+    def aggregator(self, key='brand'):
+        return IncrementalAggregator(self.csv_path, attrgetter(key), count_and_revenue)
+
+    def test_appended_rows_are_merged(self):
+        """Test that update() only reads the new bytes and merges them into the result."""
+        agg = self.aggregator()
+        self.assertEqual(agg.update()["toyota"]["count"], 1)
+        self.assertTrue(agg.last_rebuilt)
+
+        appended = "2,3000,toyota,corolla,2012,clean,6000,red\n3,500,honda,fit,2015,clean,100,blue\n"
+        self.write(appended)
+        result = agg.update()
+        self.assertFalse(agg.last_rebuilt)
+        self.assertEqual(agg.last_bytes_read, len(appended))
+        self.assertEqual(result["toyota"], {'count': 2.0, 'revenue': 5000.0})
+        self.assertEqual(result["honda"]["count"], 1)
+
+    def test_resumes_from_checkpoint(self):
+        """Test that a new aggregator picks up the stored offset and result."""
+        self.aggregator().update()
+        self.write("2,3000,honda,civic,2012,clean,6000,red\n")
+
+        resumed = self.aggregator()
+        result = resumed.update()
+        self.assertFalse(resumed.last_rebuilt)
+        self.assertEqual(set(result), {"toyota", "honda"})
+
+    def test_resume_keeps_key_types(self):
+        """Test that resuming with int and tuple keys matches a single full pass."""
+        self.write("2,3000,honda,civic,2010,clean,6000,red\n")
+        for key_selector in (attrgetter('year'), attrgetter('brand', 'year')):
+            IncrementalAggregator(self.csv_path, key_selector, count_and_revenue).update()
+            self.write("3,500,toyota,fit,2010,clean,100,blue\n4,700,kia,rio,2015,clean,10,white\n")
+            resumed = IncrementalAggregator(self.csv_path, key_selector, count_and_revenue)
+            result = resumed.update()
+            self.assertFalse(resumed.last_rebuilt)
+            full = functional_aggregate(car_sales_stream(self.csv_path), key_selector, count_and_revenue)
+            self.assertEqual(result, full)
+        self.assertEqual(result[("toyota", 2010)]["count"], 3)
+
+    def test_incomplete_line_waits(self):
+        """Test that a partially written last line is only counted once complete."""
+        agg = self.aggregator()
+        agg.update()
+        self.write("2,3000,honda,ci")
+        self.assertNotIn("honda", agg.update())
+        self.write("vic,2012,clean,6000,red\n")
+        self.assertEqual(agg.update()["honda"]["revenue"], 3000.0)
+
+    def test_empty_file_waits_for_header(self):
+        """Test that an empty file stores no checkpoint and later rows are all counted."""
+        self.write("", mode='w')
+        agg = self.aggregator()
+        self.assertEqual(agg.update(), {})
+        self.assertEqual(agg.offset, 0)
+        self.assertFalse(os.path.exists(agg.checkpoint_path))
+
+        self.write(HEADER + "1,2000,toyota,camry,2010,clean,5000,black\n")
+        self.assertEqual(agg.update()["toyota"], {'count': 1.0, 'revenue': 2000.0})
+
+    def test_partial_header_waits(self):
+        """Test that a header still being written is not recorded in the checkpoint."""
+        self.write(HEADER[:10], mode='w')
+        agg = self.aggregator()
+        self.assertEqual(agg.update(), {})
+        self.assertEqual(agg.offset, 0)
+
+        self.write(HEADER[10:] + "1,2000,toyota,camry,2010,clean,5000,black\n")
+        result = self.aggregator().update()
+        self.assertEqual(result["toyota"], {'count': 1.0, 'revenue': 2000.0})
+
+    def test_truncation_and_rewrite_rebuild(self):
+        """Test that a shorter or rewritten file triggers a full rebuild."""
+        agg = self.aggregator()
+        self.write("2,3000,honda,civic,2012,clean,6000,red\n")
+        agg.update()
+
+        # Truncated: only the header and a new first row remain
+        self.write(HEADER + "9,100,kia,rio,2018,clean,10,white\n", mode='w')
+        result = agg.update()
+        self.assertTrue(agg.last_rebuilt)
+        self.assertEqual(set(result), {"kia"})
+
+        # Rewritten in place with the same length
+        self.write(HEADER + "9,100,bmw,rio,2018,clean,10,white\n", mode='r+')
+        result = agg.update()
+        self.assertTrue(agg.last_rebuilt)
+        self.assertEqual(set(result), {"bmw"})
+
+    def test_changed_query_rebuilds(self):
+        """Test that a different grouping key does not reuse the stored result."""
+        self.aggregator('brand').update()
+        by_model = self.aggregator('model')
+        self.assertEqual(set(by_model.update()), {"camry"})
+        self.assertTrue(by_model.last_rebuilt)
+
+if __name__ == '__main__':
+    unittest.main()
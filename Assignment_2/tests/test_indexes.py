@@ -0,0 +1,92 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+from src.indexes import build_index, load_index, open_index, write_index, default_index_path
+from src.streams import car_sales_stream
+
+CSV_DATA = (
+    "id,price,brand,model,year,title_status,mileage,color\n"
+    "1,2000,toyota,camry,2010,clean,5000,black\n"
+    "2,INVALID,toyota,camry,2010,clean,5000,black\n"
+    "3,3000,honda,civic,2012,clean,6000,red\n"
+    "4,4000.5,toyota,camry,2014,salvage,7000,black\n"
+    "5,1500,toyota,corolla,2012,clean,9000,white\n"
+)
+
+class TestCarSalesIndex(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.directory, "sales.csv")
+        with open(self.csv_path, 'w', encoding='utf-8') as f:
+            f.write(CSV_DATA)
+        self.rows = list(car_sales_stream(self.csv_path))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_point_lookups(self):
+        """Test that hash lookups return the same rows as a filtered scan."""
+        index = build_index(self.csv_path)
+        self.assertEqual(len(index), 4)
+        self.assertEqual(list(index.find('brand', 'toyota')), [c for c in self.rows if c.brand == 'toyota'])
+        self.assertEqual([c.id for c in index.find('full_name', 'toyota camry')], [1, 4])
+        self.assertEqual(list(index.find('brand', 'kia')), [])
+
+    def test_range_lookups(self):
+        """Test that sorted-index ranges are inclusive and returned in file order."""
+        index = build_index(self.csv_path)
+        self.assertEqual([c.id for c in index.find_range('price', 1500, 3000)], [1, 3, 5])
+        self.assertEqual([c.id for c in index.find_range('year', 2012, 2012)], [3, 5])
+        self.assertEqual(list(index.find_range('mileage', 9500, 10000)), [])
+        with self.assertRaises(ValueError):
+            index.range('color', 0, 1)
+
+    def test_multi_line_records(self):
+        """Test that a quoted field spanning lines is indexed and returned whole."""
+        with open(self.csv_path, 'a', encoding='utf-8', newline='') as f:
+            f.write('7,1200,"for\nd",focus,2016,clean,900,"dark\nblue"\n'
+                    '8,1300,kia,"rio ""x""",2017,clean,800,red\n')
+        index = build_index(self.csv_path)
+        rows = list(index.find('brand', 'for\nd'))
+        self.assertEqual([(c.id, c.color) for c in rows], [(7, "dark\nblue")])
+        self.assertEqual([c.id for c in index.find_range('price', 1200, 1300)], [7, 8])
+        self.assertEqual([c.model for c in index.find('brand', 'kia')], ['rio "x"'])
+
+    def test_persisted_round_trip(self):
+        """Test that a written index loads with the same lookups."""
+        index = build_index(self.csv_path)
+        path = write_index(index)
+        self.assertEqual(path, default_index_path(self.csv_path))
+        loaded = load_index(self.csv_path)
+        self.assertEqual(loaded.fingerprint, index.fingerprint)
+        self.assertEqual(list(loaded.range('price', 0, 10000)), list(index.range('price', 0, 10000)))
+
+    def test_changed_file_rebuilds(self):
+        """Test that open_index rebuilds the index when the CSV fingerprint changes."""
+        self.assertEqual(len(open_index(self.csv_path)), 4)
+        with open(self.csv_path, 'a', encoding='utf-8') as f:
+            f.write("6,800,kia,rio,2018,clean,10,white\n")
+        index = open_index(self.csv_path)
+        self.assertEqual([c.id for c in index.find('brand', 'kia')], [6])
+        self.assertEqual(len(load_index(self.csv_path)), 5)
+
+    def test_reopen_does_not_read_the_csv(self):
+        """Test that opening a current index neither hashes nor rescans the CSV."""
+        open_index(self.csv_path)
+        with patch("src.cache._content_hash") as content_hash, \
+             patch("src.indexes.build_index") as build:
+            self.assertEqual(len(open_index(self.csv_path)), 4)
+        content_hash.assert_not_called()
+        build.assert_not_called()
+
+    def test_damaged_index_is_ignored(self):
+        """Test that an unreadable index file counts as missing."""
+        with open(default_index_path(self.csv_path), 'wb') as f:
+            f.write(b"not an index")
+        self.assertIsNone(load_index(self.csv_path))
+        self.assertEqual(len(open_index(self.csv_path)), 4)
+
+if __name__ == '__main__':
+    unittest.main()
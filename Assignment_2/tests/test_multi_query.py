@@ -0,0 +1,96 @@
+import unittest
+from src.models import CarSale
+from src.analysis import functional_aggregate, get_max_entry
+from src.multi_query import Query, RunningTopK, multi_aggregate
+
+class TestMultiQuery(unittest.TestCase):
+    def setUp(self):
+        self.mock_stream = [
+            CarSale(1, 100.0, "toyota", "camry", 2010, "clean", 5000, "black"),
+            CarSale(2, 200.0, "toyota", "camry", 2010, "clean", 6000, "white"),
+            CarSale(3, 1000.0, "bmw", "x5", 2020, "clean", 1000, "blue"),
+            CarSale(4, 350.0, "ford", "focus", 2015, "salvage", 9000, "black"),
+        ]
+
+    def test_several_groupings_in_one_pass(self):
+        """Test that each query matches its own functional_aggregate and totals cover every row."""
+        consumed = []
+
+        def stream():
+            for car in self.mock_stream:
+                consumed.append(car.id)
+                yield car
+
+        result = multi_aggregate(stream(), {
+            "by_model": Query(lambda c: c.full_name, lambda c: c.price),
+            "by_color": Query(lambda c: c.color, lambda c: c.mileage, metrics=('count', 'mean')),
+        }, totals={"price": lambda c: c.price})
+
+        # The stream is read exactly once
+        self.assertEqual(consumed, [1, 2, 3, 4])
+        self.assertEqual(result.rows, 4)
+
+        expected = functional_aggregate(iter(self.mock_stream), lambda c: c.full_name,
+                                        lambda c: {'count': 1, 'revenue': c.price})
+        for key, stats in expected.items():
+            self.assertEqual(result.groups["by_model"][key], {'count': stats['count'], 'sum': stats['revenue']})
+        self.assertEqual(result.groups["by_color"]["black"], {'count': 2, 'mean': 7000.0})
+        self.assertEqual(result.totals["price"], {'count': 4, 'sum': 1650.0, 'min': 100.0, 'max': 1000.0, 'mean': 412.5})
+
+    def test_running_top_k(self):
+        """Test that the running top-k ranks by sum or count."""
+        result = multi_aggregate(iter(self.mock_stream), {
+            "by_revenue": Query(lambda c: c.brand, lambda c: c.price, top_k=2),
+            "by_units": Query(lambda c: c.brand, lambda c: c.price, top_k=1, rank_by='count'),
+        })
+        self.assertEqual(result.top["by_revenue"], [("bmw", 1000.0), ("ford", 350.0)])
+        self.assertEqual(result.top["by_units"], [("toyota", 2)])
+
+    def test_shared_selectors(self):
+        """Test that queries with the same selectors keep their own metrics and top-k."""
+        brand, price = (lambda c: c.brand), (lambda c: c.price)
+        result = multi_aggregate(iter(self.mock_stream), {
+            "by_units": Query(brand, price, metrics=('count',), top_k=3, rank_by='count'),
+            "by_revenue": Query(brand, price, metrics=('sum', 'max'), top_k=1),
+        })
+        self.assertEqual(result.groups["by_units"]["toyota"], {'count': 2})
+        self.assertEqual(result.groups["by_revenue"]["toyota"], {'sum': 300.0, 'max': 200.0})
+        self.assertEqual(result.top["by_units"], [("toyota", 2), ("bmw", 1), ("ford", 1)])
+        self.assertEqual(result.top["by_revenue"], [("bmw", 1000.0)])
+
+    def test_top_k_keys_can_reenter(self):
+        """Test that a key evicted from the top-k comes back once its score passes the minimum."""
+        top = RunningTopK(2)
+        for key, score in (("a", 5), ("b", 3), ("c", 4), ("b", 6)):
+            top.update(key, score)
+        self.assertEqual(top.items(), [("b", 6), ("a", 5)])
+
+    def test_ties_keep_first_seen_order(self):
+        """Test that equal scores pick the same leader as get_max_entry."""
+        rows = [CarSale(i, 100.0, brand, "x", 2010, "clean", 0, "black")
+                for i, brand in enumerate(("bmw", "audi", "audi", "bmw"))]
+        result = multi_aggregate(iter(rows), {
+            "by_units": Query(lambda c: c.brand, lambda c: c.price, top_k=1, rank_by='count'),
+            "by_revenue": Query(lambda c: c.brand, lambda c: c.price, top_k=2),
+        })
+        groups = result.groups["by_units"]
+        self.assertEqual(result.top["by_units"][0][0], get_max_entry(groups, lambda s: s['count'])[0])
+        self.assertEqual(result.top["by_units"], [("bmw", 2)])
+        self.assertEqual(result.top["by_revenue"], [("bmw", 200.0), ("audi", 200.0)])
+
+    def test_invalid_query(self):
+        """Test that bad query settings are rejected."""
+        with self.assertRaises(ValueError):
+            Query(lambda c: c.brand, lambda c: c.price, rank_by='max')
+        with self.assertRaises(ValueError):
+            Query(lambda c: c.brand, lambda c: c.price, metrics=('median',))
+
+    def test_empty_stream(self):
+        """Test that an empty stream gives empty groups and zero totals."""
+        result = multi_aggregate(iter([]), {"q": Query(lambda c: c.brand, lambda c: c.price, top_k=3)},
+                                 totals={"price": lambda c: c.price})
+        self.assertEqual((result.rows, result.groups["q"], result.top["q"]), (0, {}, []))
+        self.assertEqual(result.totals["price"]["count"], 0)
+
+if __name__ == '__main__':
+    unittest.main()
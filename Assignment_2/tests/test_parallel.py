@@ -0,0 +1,90 @@
+import os
+import tempfile
+import unittest
+from operator import attrgetter
+from unittest.mock import patch
+from src.analysis import functional_aggregate, count_and_revenue
+from src.parallel import split_byte_ranges, read_byte_range, merge_aggregates, parallel_aggregate
+from src.streams import car_sales_stream
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "Car_sales_dataset.csv")
+
+class TestParallelAggregate(unittest.TestCase):
+    def test_ranges_cover_every_row_once(self):
+        """Test that byte ranges split on line boundaries and together hold every row."""
+        header, ranges = split_byte_ranges(DATA_PATH, 7)
+        self.assertTrue(header.startswith(b"id,price"))
+        self.assertEqual(len(ranges), 7)
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            self.assertEqual(end, start)
+
+        ids = [car.id for start, end in ranges for car in read_byte_range(DATA_PATH, header, start, end)]
+        self.assertEqual(ids, [car.id for car in car_sales_stream(DATA_PATH)])
+
+    def test_unicode_line_separators_inside_fields(self):
+        """Test that separators str.splitlines knows (\x0b, \x85, \u2028, ...) do not split rows."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "sales.csv")
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                f.write("id,price,brand,model,year,title_status,mileage,color\n")
+                for i, separator in enumerate("\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"):
+                    f.write(f"{i},100,ford,f{separator}150,2010,clean,10,red\n")
+            header, ranges = split_byte_ranges(path, 3)
+            rows = [car for start, end in ranges for car in read_byte_range(path, header, start, end)]
+            self.assertEqual(rows, list(car_sales_stream(path)))
+            self.assertEqual(len(rows), 8)
+
+    def test_line_endings_match_sequential(self):
+        """Test that CRLF, lone CR and line breaks inside quoted fields read like the sequential path."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "sales.csv")
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                f.write("id,price,brand,model,year,title_status,mileage,color\r\n"
+                        "1,100,ford,\"f\r\n150\",2010,clean,10,red\r\n"
+                        "2,200,kia,rio,2011,clean,20,blue\r"
+                        "3,300,audi,\"a\r4\",2012,clean,30,black\n")
+            sequential = list(car_sales_stream(path))
+            header, ranges = split_byte_ranges(path, 2)
+            rows = [car for start, end in ranges for car in read_byte_range(path, header, start, end)]
+            self.assertEqual(rows, sequential)
+            self.assertEqual([c.model for c in rows], ["f\n150", "rio", "a\n4"])
+
+    def test_merge_is_associative(self):
+        """Test that merging partial aggregates adds counts and revenue per key."""
+        a = {"x": {'count': 1, 'revenue': 10.0}}
+        b = {"x": {'count': 2, 'revenue': 5.0}, "y": {'count': 1, 'revenue': 1.0}}
+        c = {"y": {'count': 3, 'revenue': 2.0}}
+        self.assertEqual(merge_aggregates(merge_aggregates(a, b), c),
+                         merge_aggregates(a, merge_aggregates(b, c)))
+        self.assertEqual(merge_aggregates(a, b)["x"], {'count': 3, 'revenue': 15.0})
+
+    def test_matches_sequential(self):
+        """Test that the multi-process result equals the sequential functional_aggregate."""
+        expected = functional_aggregate(car_sales_stream(DATA_PATH), attrgetter('full_name'), count_and_revenue)
+        # Force several ranges even though the sample file is small
+        with patch("src.parallel.MIN_RANGE_BYTES", 1):
+            result = parallel_aggregate(DATA_PATH, attrgetter('full_name'), count_and_revenue, workers=3)
+
+        self.assertEqual(result.keys(), expected.keys())
+        for key, stats in expected.items():
+            self.assertEqual(result[key]['count'], stats['count'])
+            self.assertAlmostEqual(result[key]['revenue'], stats['revenue'])
+
+    def test_lambdas_fall_back_to_one_process(self):
+        """Test that unpicklable lambdas still give the correct result."""
+        with patch("src.parallel.MIN_RANGE_BYTES", 1):
+            result = parallel_aggregate(DATA_PATH, lambda c: c.brand,
+                                        lambda c: {'count': 1, 'revenue': c.price}, workers=2)
+        expected = functional_aggregate(car_sales_stream(DATA_PATH), lambda c: c.brand,
+                                        lambda c: {'count': 1, 'revenue': c.price})
+        self.assertEqual({k: v['count'] for k, v in result.items()},
+                         {k: v['count'] for k, v in expected.items()})
+
+    def test_missing_file(self):
+        """Test that a missing file is reported and gives an empty result."""
+        missing = os.path.join(tempfile.gettempdir(), "does_not_exist_car_sales.csv")
+        with patch("builtins.print"):
+            self.assertEqual(parallel_aggregate(missing, attrgetter('brand'), count_and_revenue), {})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import os
+import gzip
+import shutil
+import tempfile
+import unittest
+from collections import Counter
+from operator import attrgetter
+from src.analysis import functional_aggregate, count_and_revenue, vectorized_aggregate
+from src.parallel import parallel_aggregate
+from src.shards import expand_paths, prefetched, sharded_chunks
+from src.streams import car_sales_stream, equals
+
+HEADER = "id,price,brand,model,year,title_status,mileage,color\n"
+SHARDS = {
+    "day1.csv": ["1,2000,toyota,camry,2010,clean,5000,black\n", "2,INVALID,ford,focus,2011,clean,1,red\n"],
+    "day2.csv.gz": ["3,3000,honda,civic,2012,clean,6000,red\n", "4,1000,toyota,camry,2014,clean,7000,blue\n"],
+    "day3.csv": ["5,500,kia,rio,2018,salvage,10,white\n"],
+}
+
+class TestShardedInput(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        for name, rows in SHARDS.items():
+            opener = gzip.open if name.endswith('.gz') else open
+            with opener(os.path.join(self.directory, name), 'wt', encoding='utf-8') as f:
+                f.write(HEADER + ''.join(rows))
+        self.pattern = os.path.join(self.directory, "day*")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_expand_paths(self):
+        """Test that globs expand sorted and plain paths are kept as given."""
+        paths = expand_paths([self.pattern, "missing.csv"])
+        self.assertEqual([os.path.basename(p) for p in paths], ["day1.csv", "day2.csv.gz", "day3.csv", "missing.csv"])
+        self.assertEqual(expand_paths(os.path.join(self.directory, "none-*.csv")), [])
+
+    def test_stream_merges_plain_and_gzip_shards(self):
+        """Test that a glob stream yields the valid rows of every shard."""
+        for readers in (1, 4):
+            ids = sorted(c.id for c in car_sales_stream(self.pattern, readers=readers))
+            self.assertEqual(ids, [1, 3, 4, 5])
+        projected = car_sales_stream(self.pattern, columns=('id',), filters={'brand': equals('toyota')})
+        self.assertEqual(sorted(c.id for c in projected), [1, 4])
+
+    def test_aggregates_over_shards(self):
+        """Test that stream, process and vectorized aggregation agree over shards."""
+        expected = {"toyota camry": {'count': 2.0, 'revenue': 3000.0},
+                    "honda civic": {'count': 1.0, 'revenue': 3000.0},
+                    "kia rio": {'count': 1.0, 'revenue': 500.0}}
+        paths = expand_paths(self.pattern)
+        self.assertEqual(functional_aggregate(car_sales_stream(paths), attrgetter('full_name'),
+                                              count_and_revenue), expected)
+        self.assertEqual(parallel_aggregate(self.pattern, attrgetter('full_name'), count_and_revenue,
+                                            workers=2), expected)
+        # Every shard has its own string dictionaries
+        self.assertEqual(vectorized_aggregate(sharded_chunks(self.pattern), backend='python'), expected)
+
+    def test_no_match(self):
+        """Test that a glob without matches gives an empty stream and aggregate."""
+        pattern = os.path.join(self.directory, "none-*.csv")
+        self.assertEqual(list(car_sales_stream(pattern)), [])
+        self.assertEqual(parallel_aggregate(pattern, attrgetter('full_name'), count_and_revenue), {})
+
+class TestPrefetched(unittest.TestCase):
+    def test_all_items_in_producer_order(self):
+        """Test that every item arrives and each producer keeps its order."""
+        producers = [lambda n=n: iter(range(n * 100, n * 100 + 50)) for n in range(6)]
+        items = list(prefetched(producers, readers=3, prefetch=2))
+        self.assertEqual(Counter(items), Counter(i for n in range(6) for i in range(n * 100, n * 100 + 50)))
+        for n in range(6):
+            own = [i for i in items if n * 100 <= i < n * 100 + 50]
+            self.assertEqual(own, sorted(own))
+
+    def test_errors_propagate_and_early_close(self):
+        """Test that a producer's exception is re-raised and closing stops readers."""
+        def failing():
+            yield 1
+            raise OSError("disk gone")
+        with self.assertRaises(OSError):
+            list(prefetched([failing, lambda: iter(range(10))], readers=2))
+
+        stream = prefetched([lambda: iter(range(10 ** 6)) for _ in range(3)], readers=3, prefetch=1)
+        self.assertIsNotNone(next(stream))
+        stream.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import random
+import unittest
+from collections import Counter
+from src.sketches import SpaceSaving, HyperLogLog, QuantileSketch
+
+class TestSpaceSaving(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(7)
+        # Skewed stream: key i appears with weight ~ 1/i
+        self.stream = [f"k{int(rng.paretovariate(1.2))}" for _ in range(20000)]
+        self.exact = Counter(self.stream)
+
+    def test_heavy_hitters_within_error(self):
+        """Test that the true top keys are found and counts are within the error bound."""
+        sketch = SpaceSaving(epsilon=0.01)
+        for key in self.stream:
+            sketch.update(key)
+        self.assertEqual(sketch.capacity, 100)
+        self.assertLessEqual(len(sketch.counters), 100)
+
+        top = sketch.top(5)
+        self.assertEqual([key for key, _, _ in top], [key for key, _ in self.exact.most_common(5)])
+        for key, count, error in top:
+            self.assertGreaterEqual(count, self.exact[key])
+            self.assertLessEqual(count - error, self.exact[key])
+            self.assertLessEqual(count - self.exact[key], len(self.stream) * 0.01)
+
+    def test_merge(self):
+        """Test that merged sketches of two halves still find the top keys."""
+        left, right = SpaceSaving(100), SpaceSaving(100)
+        for key in self.stream[:10000]:
+            left.update(key)
+        for key in self.stream[10000:]:
+            right.update(key)
+        merged = left.merge(right)
+        self.assertEqual(merged.total, len(self.stream))
+        self.assertEqual([key for key, _, _ in merged.top(3)], [key for key, _ in self.exact.most_common(3)])
+        for key, count, _ in merged.top(10):
+            self.assertGreaterEqual(count, self.exact[key])
+
+    def test_invalid(self):
+        """Test that a sketch needs a capacity or an epsilon."""
+        with self.assertRaises(ValueError):
+            SpaceSaving()
+
+
+class TestHyperLogLog(unittest.TestCase):
+    def test_estimate_within_error(self):
+        """Test that the distinct count is within a few standard errors."""
+        sketch = HyperLogLog(error=0.02)
+        for i in range(50000):
+            sketch.add(f"id-{i % 20000}")
+        self.assertLess(abs(sketch.count() - 20000) / 20000, 0.06)
+        self.assertEqual(len(sketch.registers), 1 << sketch.precision)
+
+    def test_small_cardinality(self):
+        """Test that small counts are nearly exact (linear counting)."""
+        sketch = HyperLogLog(precision=12)
+        sketch.update(["ford f-150", "ford door", "toyota camry", "ford door"])
+        self.assertEqual(round(sketch.count()), 3)
+
+    def test_merge(self):
+        """Test that merging equals sketching the union."""
+        a, b, union = HyperLogLog(10), HyperLogLog(10), HyperLogLog(10)
+        for i in range(3000):
+            (a if i % 2 else b).add(str(i))
+            union.add(str(i))
+        self.assertEqual(a.merge(b).registers, union.registers)
+        with self.assertRaises(ValueError):
+            a.merge(HyperLogLog(11))
+
+
+class TestQuantileSketch(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(3)
+        self.values = [rng.lognormvariate(9, 1) for _ in range(20000)] + [0.0] * 100
+        self.sorted = sorted(self.values)
+
+    def exact(self, q):
+        return self.sorted[int(q * (len(self.sorted) - 1))]
+
+    def test_relative_error(self):
+        """Test that quantiles are within the configured relative error."""
+        sketch = QuantileSketch(relative_error=0.01)
+        sketch.update(self.values)
+        for q in (0.1, 0.5, 0.9, 0.99):
+            self.assertLessEqual(abs(sketch.quantile(q) - self.exact(q)), 0.0101 * self.exact(q))
+        self.assertEqual(sketch.quantile(0), 0.0)
+        self.assertEqual(sketch.quantile(1), max(self.values))
+
+    def test_merge(self):
+        """Test that merged sketches give the same quantiles as one sketch."""
+        whole, a, b = QuantileSketch(0.02), QuantileSketch(0.02), QuantileSketch(0.02)
+        whole.update(self.values)
+        a.update(self.values[::2])
+        b.update(self.values[1::2])
+        merged = a.merge(b)
+        self.assertEqual(merged.count, whole.count)
+        for q in (0.25, 0.5, 0.75):
+            self.assertEqual(merged.quantile(q), whole.quantile(q))
+
+    def test_bucket_limit_and_invalid_values(self):
+        """Test that the bucket limit holds and negative values are rejected."""
+        sketch = QuantileSketch(0.01, max_buckets=50)
+        sketch.update(self.values)
+        self.assertLessEqual(len(sketch.buckets), 50)
+        with self.assertRaises(ValueError):
+            sketch.add(-1.0)
+
+if __name__ == '__main__':
+    unittest.main()
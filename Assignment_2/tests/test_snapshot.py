@@ -0,0 +1,69 @@
+import os
+import shutil
+import tempfile
+import unittest
+from src.analysis import functional_aggregate
+from src.snapshot import Snapshot, open_snapshot, snapshot_aggregate, write_snapshot
+from src.streams import car_sales_stream
+
+CSV_DATA = (
+    "id,price,brand,model,year,title_status,mileage,color\n"
+    "1,2000,toyota,camry,2010,clean,5000,black\n"
+    "2,INVALID,toyota,camry,2010,clean,5000,black\n"
+    "3,3000,honda,civic,2012,clean,6000,red\n"
+    "4,4000.5,toyota,camry,2014,salvage,7000,black\n"
+)
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.directory, "sales.csv")
+        with open(self.csv_path, 'w', encoding='utf-8') as f:
+            f.write(CSV_DATA)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_round_trip(self):
+        """Test that a snapshot holds the same rows as the CSV stream."""
+        path = write_snapshot(self.csv_path)
+        with Snapshot(path) as snapshot:
+            self.assertEqual(len(snapshot), 3)
+            self.assertEqual(list(snapshot.rows()), list(car_sales_stream(self.csv_path)))
+            self.assertIsInstance(snapshot.columns['price'], memoryview)
+            self.assertEqual(snapshot.columns['price'].format, 'd')
+            self.assertEqual(snapshot.strings('brand'), ["toyota", "honda", "toyota"])
+
+    def test_functional_aggregate_over_columns(self):
+        """Test that functional_aggregate works over row indices with column lambdas."""
+        expected = functional_aggregate(car_sales_stream(self.csv_path), lambda c: c.full_name,
+                                        lambda c: {'count': 1, 'revenue': c.price})
+        with open_snapshot(self.csv_path) as snapshot:
+            brand, model, price = (snapshot.columns[n] for n in ('brand', 'model', 'price'))
+            brands, models = snapshot.dictionaries['brand'], snapshot.dictionaries['model']
+            by_index = functional_aggregate(
+                range(len(snapshot)),
+                key_selector=lambda i: f"{brands[brand[i]]} {models[model[i]]}",
+                value_mapper=lambda i: {'count': 1, 'revenue': price[i]}
+            )
+            self.assertEqual(by_index, expected)
+            self.assertEqual(snapshot_aggregate(snapshot), expected)
+            self.assertEqual(snapshot_aggregate(snapshot, ('color',))["black"]["count"], 2)
+
+    def test_stale_snapshot_is_rebuilt(self):
+        """Test that open_snapshot rewrites the snapshot when the CSV changes."""
+        with open_snapshot(self.csv_path) as snapshot:
+            self.assertEqual(len(snapshot), 3)
+        with open(self.csv_path, 'a', encoding='utf-8') as f:
+            f.write("5,100,kia,rio,2018,clean,10,white\n")
+        with open_snapshot(self.csv_path) as snapshot:
+            self.assertTrue(snapshot.is_current(self.csv_path))
+            self.assertEqual(len(snapshot), 4)
+
+    def test_rejects_other_files(self):
+        """Test that a file without the snapshot magic is refused."""
+        with self.assertRaises(ValueError):
+            Snapshot(self.csv_path)
+
+if __name__ == '__main__':
+    unittest.main()
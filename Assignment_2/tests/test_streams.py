@@ -0,0 +1,53 @@
+import unittest
+from unittest.mock import patch, mock_open
+from src.models import CarSale
+from src.streams import car_sales_stream, equals, between
+
+CSV_DATA = (
+    "id,price,brand,model,year,title_status,mileage,color\n"
+    "1,2000,toyota,camry,2010,clean,5000,black\n"
+    "2,3000,honda,civic,2016,clean,BAD,red\n"
+    "3,INVALID,ford,focus,2017,clean,7000,blue\n"
+    "4,4000,toyota,camry,2017,salvage,8000,black\n"
+    "5,5000,toyota,corolla,2018,clean,9000,white\n"
+    "6,6000,kia\n"
+)
+
+class TestProjectedStream(unittest.TestCase):
+    def stream(self, **kwargs):
+        with patch("builtins.open", mock_open(read_data=CSV_DATA)):
+            return list(car_sales_stream("dummy.csv", **kwargs))
+
+    def test_projection_leaves_other_fields_empty(self):
+        """Test that only the projected columns are converted."""
+        rows = self.stream(columns=('brand', 'model', 'price'))
+        self.assertEqual(rows[0], CarSale(None, 2000.0, "toyota", "camry", None, None, None, None))
+        self.assertEqual(rows[0].full_name, "toyota camry")
+        # The bad mileage is never converted, the bad price and short row still drop out
+        self.assertEqual([c.brand for c in rows], ["toyota", "honda", "toyota", "toyota"])
+
+    def test_filters_on_raw_text(self):
+        """Test that equals/between filters select the same rows as the full path."""
+        filtered = self.stream(filters={'title_status': equals('clean'), 'year': between(2015, 2018)})
+        full = [c for c in self.stream() if c.title_status == 'clean' and 2015 <= c.year <= 2018]
+        self.assertEqual(filtered, full)
+        self.assertEqual([c.id for c in filtered], [5])
+
+    def test_filter_without_projection_of_its_column(self):
+        """Test that a filter column does not need to be loaded."""
+        rows = self.stream(columns=('id',), filters={'brand': equals('toyota', 'kia')})
+        self.assertEqual([c.id for c in rows], [1, 4, 5])
+        self.assertIsNone(rows[0].brand)
+
+    def test_shared_strings(self):
+        """Test that equal string fields share one object."""
+        rows = self.stream(columns=('brand',))
+        self.assertIs(rows[0].brand, rows[3].brand)
+
+    def test_unknown_column(self):
+        """Test that an unknown column name raises ValueError."""
+        with self.assertRaises(ValueError):
+            car_sales_stream("dummy.csv", columns=('brand', 'price_usd'))
+
+if __name__ == '__main__':
+    unittest.main()